@@ -1,6 +1,6 @@
 """Main module entry point for Terma AI"""
 
-from .cli import app
+from .cli import cli
 
 if __name__ == "__main__":
-    app()
+    cli()
@@ -1,32 +1,64 @@
 """Command-line interface for Terma AI"""
 
 import typer
+import json
 import os
-from pathlib import Path
-from typing import Optional
-import sys
+import re
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 from . import __version__
-from .core.llm import LLMClient
-from .core.safety import SafetyChecker
-from .core.executor import CommandExecutor
-from .core.display import DisplayManager
-from .core.shell import TermaShell
-from .core.planner import TaskPlanner
-from .core.preferences import Preferences
-from .core.teaching import TeachingMode
-from .core.autofix import AutoFix
-from .core.troubleshoot import TroubleshootingAgent
-from .core.setup_wizard import SetupWizard
-from .core.git_assistant import GitAssistant
-from .core.network_diagnostic import NetworkDiagnostic
-from .core.goal_agent import GoalAgent
-from .core.api_setup import APIKeySetupError, setup_api_key_interactive, check_api_key
-from .core.conversational import ConversationalAgent
-from .core.react_agent import ReActAgent
-from .core.system_info import SystemInfoCollector
-
-app = typer.Typer(
+from .core.api_setup import APIKeySetupError
+
+if TYPE_CHECKING:
+    from .core.display import DisplayManager
+    from .core.llm import LLMClient
+    from .core.preferences import Preferences
+
+# Core modules are imported inside the commands that use them: most of them
+# pull in openai/rich at import time, which would otherwise be paid by every
+# invocation (including `--version` and `pref list`).
+
+# Exceptions that carry their own exit status/message for Typer to handle
+# (typer.Exit is a RuntimeError, so these must be let through explicitly)
+_TYPER_EXCEPTIONS = (typer.Exit, typer.Abort, typer.BadParameter)
+
+# Errors owned by cli_error_handler; commands that keep their own
+# `except Exception` block (for a more specific message) re-raise them.
+_HANDLED_BY_APP = (*_TYPER_EXCEPTIONS, APIKeySetupError)
+
+
+def cli_error_handler(func):
+    """Map errors escaping a command to a message and an exit code"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except APIKeySetupError:
+            # Error message already shown by require_api_key()
+            raise typer.Exit(1)
+        except KeyboardInterrupt:
+            typer.echo("\n👋 Interrupted")
+            raise typer.Exit(0)
+        except _TYPER_EXCEPTIONS:
+            raise
+        except Exception as e:
+            _display().show_error(f"Error: {str(e)}")
+            raise typer.Exit(1)
+    return wrapper
+
+
+class _TermaTyper(typer.Typer):
+    """Typer app that installs cli_error_handler on every command"""
+
+    def command(self, *args, **kwargs):
+        register = super().command(*args, **kwargs)
+        return lambda func: register(cli_error_handler(func))
+
+
+app = _TermaTyper(
     name="termai",
     help="Terma AI - Natural Language Terminal Agent",
     add_completion=False,
@@ -49,15 +81,25 @@ def callback(
         raise typer.Exit()
 
 
-def handle_api_key_error(func):
-    """Decorator to handle API key setup errors consistently"""
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except APIKeySetupError:
-            # Error message already shown by require_api_key()
-            raise typer.Exit(1)
-    return wrapper
+@lru_cache(maxsize=2)
+def _llm_client(require_key: bool = True) -> "LLMClient":
+    """Return the process-wide LLM client (one per ``require_key`` value)"""
+    from .core.llm import LLMClient
+    return LLMClient(require_key=require_key)
+
+
+def _display() -> "DisplayManager":
+    """Return the process-wide display manager"""
+    from .core.display import DISPLAY
+    return DISPLAY
+
+
+def _join_args(first: Optional[str], extra: List[str]) -> Optional[str]:
+    """Join a positional argument with the extra words Typer left in ctx.args"""
+    # Common case: a single quoted argument and nothing else to join
+    if not extra:
+        return first
+    return " ".join([first, *extra] if first else extra)
 
 
 @app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})
@@ -79,31 +121,20 @@ def run(
         termai run check git status
     """
     # Combine query with any remaining arguments
-    if query:
-        query_parts = [query]
-    else:
-        query_parts = []
-    
-    # Get remaining arguments from context
-    if ctx.args:
-        query_parts.extend(ctx.args)
-    
-    # Join all parts into a single query
-    if not query_parts:
-        typer.echo("❌ Error: Query is required")
-        typer.echo("Usage: termai run <query>")
-        typer.echo("Example: termai run check git status")
-        raise typer.Exit(1)
-    
-    query = " ".join(query_parts)
-    
-    display = DisplayManager()
+    query = _join_args(query, ctx.args)
+    if not query:
+        raise typer.BadParameter("Query is required. Example: termai run check git status", param_hint="query")
+
+    from .core.executor import CommandExecutor
+    from .core.safety import SafetyChecker
+
+    display = _display()
 
     try:
         # Initialize components (will check for API key)
-        llm_client = LLMClient()
+        llm_client = _llm_client()
         safety_checker = SafetyChecker()
-        executor = CommandExecutor(cwd)
+        executor = CommandExecutor(cwd, stream_output=True)
 
         if verbose:
             display.show_welcome()
@@ -136,15 +167,16 @@ def run(
             display.show_risky_commands(safety_result["risky_commands"])
 
         # Show warnings if any
-        display.show_safety_warnings(safety_result["warnings"])
+        if safety_result["warnings"]:
+            display.show_safety_warnings(safety_result["warnings"])
 
-        # Prepare all commands for execution (safe + risky)
-        all_commands = safety_result["safe_commands"].copy()
+        # Prepare all commands for execution (safe + risky), in original order
         risky_commands_list = safety_result.get("risky_commands", [])
-        
-        # Add risky commands to execution list (maintaining order)
+        all_commands = [None] * len(commands)
+        for cmd, index in zip(safety_result["safe_commands"], safety_result["safe_indices"]):
+            all_commands[index] = cmd
         for risky in risky_commands_list:
-            all_commands.insert(risky["index"], risky["command"])
+            all_commands[risky["index"]] = risky["command"]
 
         # Confirmation - only for risky commands, safe commands auto-execute
         if confirm:
@@ -171,82 +203,94 @@ def run(
             display.console.print("\n[yellow]Use without --dry-run to execute these commands[/yellow]")
             raise typer.Exit(0)
 
-        # Execute commands (both safe and risky after confirmation)
+        # Execute commands (both safe and risky after confirmation),
+        # showing each command's output as soon as it finishes
         display.show_execution_start()
-        execution_result = executor.execute_commands(
-            all_commands,
-            explanations[:len(all_commands)]
-        )
-
-        # Display results
-        display.show_execution_results(execution_result["results"], verbose)
-
-    except APIKeySetupError as e:
-        # API key setup error - already shows instructions
-        raise typer.Exit(1)
-    except typer.Exit as e:
-        # Re-raise Exit exceptions (normal flow)
-        raise e
-    except APIKeySetupError:
-        # Error message already shown by require_api_key()
-        raise typer.Exit(1)
+        if len(explanations) > len(all_commands):
+            explanations = explanations[:len(all_commands)]
+        elif len(explanations) < len(all_commands):
+            # zip() in the executor would otherwise silently drop commands
+            explanations = explanations + [""] * (len(all_commands) - len(explanations))
+        results = []
+        for result in executor.iter_execute(all_commands, explanations):
+            display.show_single_result(result)
+            results.append(result)
+
+        # Display summary
+        display.show_execution_summary(results, verbose)
+
+    except _HANDLED_BY_APP:
+        raise
     except Exception as e:
-        import traceback
         display.show_error(f"Unexpected error: {str(e)}", verbose, traceback.format_exc() if verbose else None)
         raise typer.Exit(1)
 
 
-@app.command()
-def test(
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed test output")
-):
-    """Test Terma AI components and API connectivity"""
-    typer.echo("🧪 Testing Terma AI components...")
-
-    tests_passed = 0
-    total_tests = 0
-
-    # Test LLM client
-    total_tests += 1
+def _check_llm() -> Tuple[bool, List[str]]:
+    """Self-test: LLM API connectivity"""
     try:
-        llm_client = LLMClient()
-        if llm_client.test_connection():
-            typer.echo("✅ LLM API connection successful")
-            tests_passed += 1
-        else:
-            typer.echo("❌ LLM API connection failed")
+        if _llm_client().test_connection():
+            return True, ["✅ LLM API connection successful"]
+        return False, ["❌ LLM API connection failed"]
     except APIKeySetupError:
-        typer.echo("❌ LLM API connection failed: API key not configured")
-        typer.echo("💡 Run 'terma setup-api' to configure your API key")
+        return False, [
+            "❌ LLM API connection failed: API key not configured",
+            "💡 Run 'terma setup-api' to configure your API key",
+        ]
     except Exception as e:
-        typer.echo(f"❌ LLM client error: {str(e)}")
+        return False, [f"❌ LLM client error: {str(e)}"]
+
+
+def _check_safety() -> Tuple[bool, List[str]]:
+    """Self-test: safety checker flags a known-dangerous command"""
+    from .core.safety import SafetyChecker
 
-    # Test safety checker
-    total_tests += 1
     try:
         safety_checker = SafetyChecker()
         test_commands = ["ls -la", "rm -rf /"]
         result = safety_checker.check_commands(test_commands)
 
         if not result["safe"] and len(result.get("risky_commands", [])) == 1:
-            typer.echo("✅ Safety checker working correctly")
-            tests_passed += 1
-        else:
-            typer.echo("❌ Safety checker test failed")
+            return True, ["✅ Safety checker working correctly"]
+        return False, ["❌ Safety checker test failed"]
     except Exception as e:
-        typer.echo(f"❌ Safety checker error: {str(e)}")
+        return False, [f"❌ Safety checker error: {str(e)}"]
+
+
+def _check_executor() -> Tuple[bool, List[str]]:
+    """Self-test: command executor can resolve a basic command"""
+    from .core.executor import CommandExecutor
 
-    # Test command executor
-    total_tests += 1
     try:
         executor = CommandExecutor()
         if executor.test_command("echo hello"):
-            typer.echo("✅ Command executor basic test passed")
-            tests_passed += 1
-        else:
-            typer.echo("❌ Command executor test failed")
+            return True, ["✅ Command executor basic test passed"]
+        return False, ["❌ Command executor test failed"]
     except Exception as e:
-        typer.echo(f"❌ Command executor error: {str(e)}")
+        return False, [f"❌ Command executor error: {str(e)}"]
+
+
+@app.command()
+def test(
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed test output")
+):
+    """Test Terma AI components and API connectivity"""
+    typer.echo("🧪 Testing Terma AI components...")
+
+    # The checks are independent (network round-trip vs. local work), so run
+    # them concurrently and report in a fixed order.
+    checks = (_check_llm, _check_safety, _check_executor)
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        futures = [pool.submit(check) for check in checks]
+        results = [future.result() for future in futures]
+
+    tests_passed = 0
+    total_tests = len(results)
+    for ok, messages in results:
+        for message in messages:
+            typer.echo(message)
+        if ok:
+            tests_passed += 1
 
     typer.echo(f"\n📊 Test Results: {tests_passed}/{total_tests} tests passed")
 
@@ -261,8 +305,10 @@ def test(
 @app.command()
 def config():
     """Show current configuration"""
+    from .core.api_setup import check_api_key
+
     try:
-        llm_client = LLMClient(require_key=False)
+        llm_client = _llm_client(require_key=False)
         config = llm_client.config
 
         typer.echo("⚙️  Current Configuration:")
@@ -282,6 +328,8 @@ def config():
             typer.echo(f"  API Key: ❌ Missing")
             typer.echo("\n💡 Run 'terma setup-api' to configure your API key")
 
+    except _HANDLED_BY_APP:
+        raise
     except Exception as e:
         typer.echo(f"❌ Error loading configuration: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -290,6 +338,8 @@ def config():
 @app.command("system-info")
 def system_info():
     """Show comprehensive system information collected by Terma AI"""
+    from .core.system_info import SystemInfoCollector
+
     try:
         collector = SystemInfoCollector()
         
@@ -371,6 +421,8 @@ def system_info():
         typer.echo("\n💡 This information is automatically collected and used by Terma AI")
         typer.echo("   to generate more accurate and context-aware commands.\n")
         
+    except _HANDLED_BY_APP:
+        raise
     except Exception as e:
         typer.echo(f"❌ Error collecting system information: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -383,14 +435,15 @@ def setup_api():
     
     This command will guide you through setting up your API key.
     """
+    from .core.api_setup import setup_api_key_interactive
+
     try:
         if setup_api_key_interactive():
             raise typer.Exit(0)
         else:
             raise typer.Exit(1)
-    except KeyboardInterrupt:
-        typer.echo("\n👋 Setup cancelled")
-        raise typer.Exit(0)
+    except _HANDLED_BY_APP:
+        raise
     except Exception as e:
         typer.echo(f"❌ Error during setup: {str(e)}", err=True)
         raise typer.Exit(1)
@@ -402,7 +455,9 @@ def chat(
     query: Optional[str] = typer.Argument(None, help="Your question or request"),
     cwd: Optional[str] = typer.Option(None, "--cwd", help="Working directory for command execution"),
     auto_execute: bool = typer.Option(True, "--auto-execute/--no-auto-execute", help="Automatically execute safe commands"),
-    confirm_risky: bool = typer.Option(True, "--confirm-risky/--no-confirm-risky", help="Ask for confirmation before risky commands")
+    confirm_risky: bool = typer.Option(True, "--confirm-risky/--no-confirm-risky", help="Ask for confirmation before risky commands"),
+    stream: bool = typer.Option(True, "--stream/--no-stream", help="Show the response while it is being generated"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the plan cache (enabled with TERMA_PLAN_CACHE=1)")
 ):
     """
     Chat with Terma AI - Ask questions or request actions in natural language.
@@ -418,55 +473,35 @@ def chat(
         terma chat "show me the contents of README.md"
         terma chat check git status
     """
-    try:
-        # Combine query with any remaining arguments
-        if query:
-            query_parts = [query]
-        else:
-            query_parts = []
-        
-        # Get remaining arguments from context
-        if ctx.args:
-            query_parts.extend(ctx.args)
-        
-        # Join all parts into a single query
-        if not query_parts:
-            typer.echo("❌ Error: Query is required")
-            typer.echo("Usage: terma chat <your question or request>")
-            typer.echo("Examples:")
-            typer.echo("  terma chat \"what is git?\"")
-            typer.echo("  terma chat \"list files in current directory\"")
-            typer.echo("  terma chat check git status")
-            raise typer.Exit(1)
-        
-        user_query = " ".join(query_parts)
-        
-        # Initialize components (will check for API key)
-        llm_client = LLMClient()
-        working_dir = cwd or os.getcwd()
-        
-        # Create conversational agent
-        agent = ConversationalAgent(llm_client=llm_client, working_directory=working_dir)
-        
-        # Process the query
-        result = agent.process_query(
-            user_query,
-            auto_execute=auto_execute,
-            confirm_risky=confirm_risky
-        )
-        
-        # Exit successfully
-        raise typer.Exit(0)
-        
-    except APIKeySetupError:
-        # Error message already shown by require_api_key()
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        typer.echo("\n👋 Chat cancelled")
-        raise typer.Exit(0)
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
-        raise typer.Exit(1)
+    # Combine query with any remaining arguments
+    user_query = _join_args(query, ctx.args)
+    if not user_query:
+        raise typer.BadParameter("Query is required. Example: terma chat \"what is git?\"", param_hint="query")
+
+    from .core.conversational import ConversationalAgent
+    from .core.plan_cache import PlanCache
+
+    # Initialize components (will check for API key)
+    llm_client = _llm_client()
+    working_dir = cwd or os.getcwd()
+    
+    # Create conversational agent
+    agent = ConversationalAgent(
+        llm_client=llm_client,
+        working_directory=working_dir,
+        plan_cache=PlanCache.from_env(disabled=no_cache)
+    )
+    
+    # Process the query
+    result = agent.process_query(
+        user_query,
+        auto_execute=auto_execute,
+        confirm_risky=confirm_risky,
+        stream=stream
+    )
+    
+    # Exit successfully
+    raise typer.Exit(0)
 
 
 @app.command()
@@ -474,35 +509,58 @@ def shell(
     cwd: Optional[str] = typer.Option(None, "--cwd", help="Working directory for the shell")
 ):
     """Start interactive Terma Shell for continuous AI conversations"""
+    from .core.shell import TermaShell
+
     try:
         terma_shell = TermaShell(cwd)
         terma_shell.start()
-    except KeyboardInterrupt:
-        typer.echo("\n👋 Shell exited")
-        raise typer.Exit(0)
+    except _HANDLED_BY_APP:
+        raise
     except Exception as e:
         typer.echo(f"❌ Error starting shell: {str(e)}", err=True)
         raise typer.Exit(1)
 
 
 # Preferences commands
-pref_app = typer.Typer(name="pref", help="Manage Terma AI preferences")
+_BOOL_RE = re.compile(r'^(true|false)$', re.IGNORECASE)
+_INT_RE = re.compile(r'^-?\d+$')
+_FLOAT_RE = re.compile(r'^-?\d+\.\d+$')
+
+
+def _coerce_pref_value(value: str):
+    """Convert a command-line preference value to bool/int/float/JSON, else keep the string"""
+    if _BOOL_RE.match(value):
+        return value.lower() == "true"
+    if _INT_RE.match(value):
+        return int(value)
+    if _FLOAT_RE.match(value):
+        return float(value)
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+@lru_cache(maxsize=1)
+def _prefs() -> "Preferences":
+    """Return the process-wide preferences instance"""
+    from .core.preferences import Preferences
+    return Preferences()
+
+
+pref_app = _TermaTyper(name="pref", help="Manage Terma AI preferences")
 app.add_typer(pref_app)
 
 
 @pref_app.command("list")
 def pref_list():
     """List all current preferences"""
-    try:
-        prefs = Preferences()
-        all_prefs = prefs.list_all()
-        
-        typer.echo("⚙️  Current Preferences:")
-        for key, value in all_prefs.items():
-            typer.echo(f"  {key}: {value}")
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
-        raise typer.Exit(1)
+    prefs = _prefs()
+    all_prefs = prefs.list_all()
+    
+    typer.echo("⚙️  Current Preferences:")
+    for key, value in all_prefs.items():
+        typer.echo(f"  {key}: {value}")
 
 
 @pref_app.command("set")
@@ -512,22 +570,16 @@ def pref_set(
 ):
     """Set a preference value"""
     try:
-        prefs = Preferences()
+        prefs = _prefs()
         
         # Convert value to appropriate type
-        if value.lower() in ("true", "false"):
-            value = value.lower() == "true"
-        elif value.isdigit():
-            value = int(value)
+        value = _coerce_pref_value(value)
         
         prefs.set(key, value)
         typer.echo(f"✅ Set {key} = {value}")
     except ValueError as e:
         typer.echo(f"❌ Invalid preference: {str(e)}", err=True)
         raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
-        raise typer.Exit(1)
 
 
 @pref_app.command("get")
@@ -535,29 +587,22 @@ def pref_get(
     key: str = typer.Argument(..., help="Preference key to get")
 ):
     """Get a preference value"""
-    try:
-        prefs = Preferences()
-        value = prefs.get(key)
-        if value is not None:
-            typer.echo(f"{key}: {value}")
-        else:
-            typer.echo(f"❌ Preference '{key}' not found", err=True)
-            raise typer.Exit(1)
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
+    prefs = _prefs()
+    value = prefs.get(key)
+    if value is not None:
+        typer.echo(f"{key}: {value}")
+    else:
+        typer.echo(f"❌ Preference '{key}' not found", err=True)
         raise typer.Exit(1)
 
 
 @pref_app.command("reset")
 def pref_reset():
     """Reset all preferences to defaults"""
-    try:
-        prefs = Preferences()
-        prefs.reset()
-        typer.echo("✅ Preferences reset to defaults")
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
-        raise typer.Exit(1)
+    prefs = _prefs()
+    prefs.reset()
+    _prefs.cache_clear()
+    typer.echo("✅ Preferences reset to defaults")
 
 
 @app.command()
@@ -573,49 +618,43 @@ def plan(
         termai plan "set up a Node.js project with Express"
         termai plan "create backup and compress files" --dry-run
     """
-    display = DisplayManager()
+    from .core.executor import CommandExecutor
+    from .core.planner import TaskPlanner
+
+    display = _display()
     
-    try:
-        planner = TaskPlanner()
-        executor = CommandExecutor(cwd)
-        
-        display.console.print(f"[bold cyan]📋 Planning task:[/bold cyan] {task}")
-        
-        # Create plan
-        plan_result = planner.plan_task(task)
-        
-        if plan_result.get("error"):
-            display.show_error(plan_result["error"])
-            raise typer.Exit(1)
-        
-        # Show plan
-        steps = plan_result.get("steps", [])
-        if not steps:
-            display.show_error("No steps generated in plan")
-            raise typer.Exit(1)
-        
-        # Confirm execution
-        if not dry_run:
-            if not display.confirm_execution(len(steps)):
-                display.console.print("[yellow]Plan execution cancelled[/yellow]")
-                raise typer.Exit(0)
-        
-        # Execute plan
-        execution_result = planner.execute_plan(plan_result, executor, dry_run=dry_run)
-        
-        if execution_result.get("aborted"):
-            display.console.print(f"\n[yellow]Plan aborted after {execution_result['completed_steps']} steps[/yellow]")
-        elif execution_result.get("completed"):
-            display.console.print(f"\n[green]✅ Plan completed successfully![/green]")
-            display.console.print(f"[dim]Executed {execution_result['total_steps']} steps[/dim]")
-        
-    except APIKeySetupError:
-        # Error message already shown by require_api_key()
+    planner = TaskPlanner()
+    executor = CommandExecutor(cwd)
+    
+    display.console.print(f"[bold cyan]📋 Planning task:[/bold cyan] {task}")
+    
+    # Create plan
+    plan_result = planner.plan_task(task)
+    
+    if plan_result.get("error"):
+        display.show_error(plan_result["error"])
         raise typer.Exit(1)
-    except Exception as e:
-        import traceback
-        display.show_error(f"Unexpected error: {str(e)}", verbose=False, traceback=traceback.format_exc() if False else None)
+    
+    # Show plan
+    steps = plan_result.get("steps", [])
+    if not steps:
+        display.show_error("No steps generated in plan")
         raise typer.Exit(1)
+    
+    # Confirm execution
+    if not dry_run:
+        if not display.confirm_execution(len(steps)):
+            display.console.print("[yellow]Plan execution cancelled[/yellow]")
+            raise typer.Exit(0)
+    
+    # Execute plan
+    execution_result = planner.execute_plan(plan_result, executor, dry_run=dry_run)
+    
+    if execution_result.get("aborted"):
+        display.console.print(f"\n[yellow]Plan aborted after {execution_result['completed_steps']} steps[/yellow]")
+    elif execution_result.get("completed"):
+        display.console.print(f"\n[green]✅ Plan completed successfully![/green]")
+        display.console.print(f"[dim]Executed {execution_result['total_steps']} steps[/dim]")
 
 
 @app.command()
@@ -634,67 +673,67 @@ def explain(
         termai explain "chmod 777 file" --safer
         termai explain "find . -name '*.py' -exec grep -l 'import' {} \\;" --breakdown
     """
-    display = DisplayManager()
+    from rich.console import Group
+    from rich.table import Table
+    from .core.teaching import TeachingMode
+
+    display = _display()
     teaching = TeachingMode()
     
-    try:
-        if breakdown:
-            # Break down command
-            steps = teaching.break_down_steps(command)
-            display.console.print(f"\n[bold]📚 Breaking down:[/bold] [green]{command}[/green]\n")
-            for step in steps:
-                display.console.print(f"[bold cyan]{step['step']}[/bold cyan]")
-                display.console.print(f"  {step['explanation']}\n")
+    # Each branch collects its renderables and prints them in one call
+    output = []
+
+    if breakdown:
+        # Break down command
+        steps = teaching.break_down_steps(command)
+        output.append(f"\n[bold]📚 Breaking down:[/bold] [green]{command}[/green]\n")
+        steps_table = Table(show_header=False, box=None, padding=(0, 0, 1, 0))
+        steps_table.add_column("Step")
+        for step in steps:
+            steps_table.add_row(f"[bold cyan]{step['step']}[/bold cyan]\n  {step['explanation']}")
+        output.append(steps_table)
+    
+    elif safer:
+        # Show safer alternatives
+        suggestions = teaching.suggest_safer_way(command)
+        output.append(f"\n[bold]🛡️  Safer alternatives for:[/bold] [yellow]{command}[/yellow]\n")
+        output.append(f"[bold]Risk Score:[/bold] {suggestions['risk_score']}/5\n")
         
-        elif safer:
-            # Show safer alternatives
-            suggestions = teaching.suggest_safer_way(command)
-            display.console.print(f"\n[bold]🛡️  Safer alternatives for:[/bold] [yellow]{command}[/yellow]\n")
-            display.console.print(f"[bold]Risk Score:[/bold] {suggestions['risk_score']}/5\n")
-            
-            if suggestions.get("ai_suggestions"):
-                display.console.print("[bold]AI Suggestions:[/bold]")
-                display.console.print(suggestions["ai_suggestions"])
-            
-            if suggestions.get("pattern_based_alternatives"):
-                display.console.print("\n[bold]Quick Alternatives:[/bold]")
-                for alt in suggestions["pattern_based_alternatives"]:
-                    display.console.print(f"  • {alt}")
+        if suggestions.get("ai_suggestions"):
+            output.append("[bold]AI Suggestions:[/bold]")
+            output.append(suggestions["ai_suggestions"])
         
-        elif why:
-            # Explain why command was chosen
-            explanation = teaching.explain_why(command, why)
-            display.console.print(f"\n[bold]💡 Why this command for '{why}':[/bold]\n")
-            display.console.print(f"[green]{command}[/green]\n")
-            display.console.print(explanation)
+        if suggestions.get("pattern_based_alternatives"):
+            output.append("\n[bold]Quick Alternatives:[/bold]")
+            output.extend(f"  • {alt}" for alt in suggestions["pattern_based_alternatives"])
+    
+    elif why:
+        # Explain why command was chosen
+        explanation = teaching.explain_why(command, why)
+        output.append(f"\n[bold]💡 Why this command for '{why}':[/bold]\n")
+        output.append(f"[green]{command}[/green]\n")
+        output.append(explanation)
+    
+    else:
+        # Full explanation
+        explanation = teaching.explain_command(command)
         
-        else:
-            # Full explanation
-            explanation = teaching.explain_command(command)
+        output.append(f"\n[bold]📖 Explanation:[/bold] [green]{explanation['command']}[/green]\n")
+        output.append(explanation['explanation'])
+        
+        if explanation.get("risk_score", 0) > 1:
+            output.append("\n[bold]⚠️  Risk Analysis:[/bold]")
+            output.append(f"  Risk Score: {explanation['risk_score']}/5 ({explanation['risk_level']})")
             
-            display.console.print(f"\n[bold]📖 Explanation:[/bold] [green]{explanation['command']}[/green]\n")
-            display.console.print(explanation['explanation'])
+            if explanation.get("potential_effects"):
+                output.append("\n  [bold]Potential Effects:[/bold]")
+                output.extend(f"    • {effect}" for effect in explanation["potential_effects"])
             
-            if explanation.get("risk_score", 0) > 1:
-                display.console.print(f"\n[bold]⚠️  Risk Analysis:[/bold]")
-                display.console.print(f"  Risk Score: {explanation['risk_score']}/5 ({explanation['risk_level']})")
-                
-                if explanation.get("potential_effects"):
-                    display.console.print(f"\n  [bold]Potential Effects:[/bold]")
-                    for effect in explanation["potential_effects"]:
-                        display.console.print(f"    • {effect}")
-                
-                if explanation.get("safer_alternatives"):
-                    display.console.print(f"\n  [bold]Safer Alternatives:[/bold]")
-                    for alt in explanation["safer_alternatives"]:
-                        display.console.print(f"    • {alt}")
-    
-    except APIKeySetupError:
-        # Error message already shown by require_api_key()
-        raise typer.Exit(1)
-    except Exception as e:
-        display.show_error(f"Error: {str(e)}")
-        raise typer.Exit(1)
+            if explanation.get("safer_alternatives"):
+                output.append("\n  [bold]Safer Alternatives:[/bold]")
+                output.extend(f"    • {alt}" for alt in explanation["safer_alternatives"])
+
+    display.console.print(Group(*output))
 
 
 @app.command()
@@ -714,26 +753,22 @@ def fix(
         termai fix "python script.py" --stderr "ModuleNotFoundError" --auto
         termai fix "docker run image" --stderr "permission denied" --teaching
     """
+    from .core.autofix import AutoFix
+
     autofix = AutoFix()
     
-    try:
-        result = autofix.fix_error(
-            command=command,
-            stderr=stderr,
-            stdout=stdout,
-            return_code=return_code,
-            auto_execute=auto,
-            teaching_mode=teaching
-        )
-        
-        if result.get("error"):
-            display = DisplayManager()
-            display.show_error(result["error"])
-            raise typer.Exit(1)
+    result = autofix.fix_error(
+        command=command,
+        stderr=stderr,
+        stdout=stdout,
+        return_code=return_code,
+        auto_execute=auto,
+        teaching_mode=teaching
+    )
     
-    except Exception as e:
-        display = DisplayManager()
-        display.show_error(f"Error: {str(e)}")
+    if result.get("error"):
+        display = _display()
+        display.show_error(result["error"])
         raise typer.Exit(1)
 
 
@@ -751,18 +786,10 @@ def troubleshoot(
         termai troubleshoot "system is slow"
         termai troubleshoot "network connection issues"
     """
-    try:
-        agent = TroubleshootingAgent()
-        agent.start_diagnosis(initial_symptom=symptom)
-    except APIKeySetupError:
-        # Error message already shown by require_api_key()
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        typer.echo("\n👋 Troubleshooting session ended")
-        raise typer.Exit(0)
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
-        raise typer.Exit(1)
+    from .core.troubleshoot import TroubleshootingAgent
+
+    agent = TroubleshootingAgent()
+    agent.start_diagnosis(initial_symptom=symptom)
 
 
 @app.command()
@@ -784,9 +811,13 @@ def setup(
         termai setup python --name myproject
         termai setup django --database postgresql --features "redis,cache"
     """
-    try:
-        wizard = SetupWizard()
-        
+    from .core.setup_wizard import SetupWizard
+
+    wizard = SetupWizard()
+    
+    # setup_environment() treats None as "no options"
+    options = None
+    if version or project_name or database or features:
         options = {}
         if version:
             options["version"] = version
@@ -796,38 +827,26 @@ def setup(
             options["database"] = database
         if features:
             options["features"] = [f.strip() for f in features.split(",")]
-        
-        wizard.setup_environment(environment, options)
     
-    except APIKeySetupError:
-        # Error message already shown by require_api_key()
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        typer.echo("\n👋 Setup cancelled")
-        raise typer.Exit(0)
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
-        raise typer.Exit(1)
+    wizard.setup_environment(environment, options)
 
 
 @app.command("setup-list")
 def setup_list():
     """List available environment templates"""
-    try:
-        wizard = SetupWizard()
-        templates = wizard.list_templates()
-        
-        typer.echo("📋 Available Environment Templates:")
-        for template in templates:
-            typer.echo(f"  • {template}")
-        typer.echo("\nUse: termai setup <template>")
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
-        raise typer.Exit(1)
+    from .core.setup_wizard import SetupWizard
+
+    wizard = SetupWizard()
+    templates = wizard.list_templates()
+    
+    typer.echo("📋 Available Environment Templates:")
+    for template in templates:
+        typer.echo(f"  • {template}")
+    typer.echo("\nUse: termai setup <template>")
 
 
 # Git Assistant commands
-git_app = typer.Typer(name="git", help="Natural language Git commands")
+git_app = _TermaTyper(name="git", help="Natural language Git commands")
 app.add_typer(git_app)
 
 
@@ -836,7 +855,8 @@ def run(
     ctx: typer.Context,
     request: Optional[str] = typer.Argument(None, help="Natural language Git request"),
     execute: bool = typer.Option(False, "--execute", "-e", help="Execute the generated commands"),
-    explain: bool = typer.Option(False, "--explain", help="Show detailed explanations")
+    explain: bool = typer.Option(False, "--explain", help="Show detailed explanations"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the plan cache (enabled with TERMA_PLAN_CACHE=1)")
 ):
     """
     Convert natural language to Git commands.
@@ -849,45 +869,29 @@ def run(
         termai git run stage all files and commit with message
     """
     # Combine request with any remaining arguments
-    if request:
-        request_parts = [request]
-    else:
-        request_parts = []
-    
-    # Get remaining arguments from context
-    if ctx.args:
-        request_parts.extend(ctx.args)
+    request = _join_args(request, ctx.args)
+    if not request:
+        raise typer.BadParameter("Git request is required. Example: termai git run initialize repository", param_hint="request")
+
+    from .core.git_assistant import GitAssistant
+    from .core.plan_cache import PlanCache
+
+    assistant = GitAssistant(plan_cache=PlanCache.from_env(disabled=no_cache))
+    result = assistant.process_git_request(request, execute=execute, explain=explain)
     
-    # Join all parts into a single request
-    if not request_parts:
-        typer.echo("❌ Error: Git request is required")
-        typer.echo("Usage: termai git run <request>")
-        typer.echo("Example: termai git run initialize repository")
+    if result.get("error"):
+        display = _display()
+        display.show_error(result["error"])
         raise typer.Exit(1)
     
-    request = " ".join(request_parts)
-    
-    try:
-        assistant = GitAssistant()
-        result = assistant.process_git_request(request, execute=execute, explain=explain)
-        
-        if result.get("error"):
-            display = DisplayManager()
-            display.show_error(result["error"])
-            raise typer.Exit(1)
-        
-        if result.get("warning"):
-            display = DisplayManager()
-            display.console.print(f"[yellow]⚠️  Warning:[/yellow] {result['warning']}")
+    if result.get("warning"):
+        display = _display()
+        display.console.print(f"[yellow]⚠️  Warning:[/yellow] {result['warning']}")
     
-    except Exception as e:
-        display = DisplayManager()
-        display.show_error(f"Error: {str(e)}")
-        raise typer.Exit(1)
 
 
 # Network Diagnostic commands
-network_app = typer.Typer(name="network", help="Network diagnostic tools")
+network_app = _TermaTyper(name="network", help="Network diagnostic tools")
 app.add_typer(network_app)
 
 
@@ -898,18 +902,14 @@ def network_ping(
     explain: bool = typer.Option(True, "--explain/--no-explain", help="Show AI explanation")
 ):
     """Ping a host and get AI-explained results"""
-    try:
-        diagnostic = NetworkDiagnostic()
-        result = diagnostic.ping(host, count=count, explain=explain)
-        
-        if not result.get("success") and result.get("error"):
-            display = DisplayManager()
-            display.show_error(result["error"])
+    from .core.network_diagnostic import NetworkDiagnostic
+
+    diagnostic = NetworkDiagnostic()
+    result = diagnostic.ping(host, count=count, explain=explain)
     
-    except Exception as e:
-        display = DisplayManager()
-        display.show_error(f"Error: {str(e)}")
-        raise typer.Exit(1)
+    if not result.get("success") and result.get("error"):
+        display = _display()
+        display.show_error(result["error"])
 
 
 @network_app.command("trace")
@@ -918,18 +918,14 @@ def network_trace(
     explain: bool = typer.Option(True, "--explain/--no-explain", help="Show AI explanation")
 ):
     """Trace route to a host and get AI-explained results"""
-    try:
-        diagnostic = NetworkDiagnostic()
-        result = diagnostic.trace_route(host, explain=explain)
-        
-        if not result.get("success") and result.get("error"):
-            display = DisplayManager()
-            display.show_error(result["error"])
+    from .core.network_diagnostic import NetworkDiagnostic
+
+    diagnostic = NetworkDiagnostic()
+    result = diagnostic.trace_route(host, explain=explain)
     
-    except Exception as e:
-        display = DisplayManager()
-        display.show_error(f"Error: {str(e)}")
-        raise typer.Exit(1)
+    if not result.get("success") and result.get("error"):
+        display = _display()
+        display.show_error(result["error"])
 
 
 @network_app.command("port")
@@ -939,18 +935,14 @@ def network_port(
     explain: bool = typer.Option(True, "--explain/--no-explain", help="Show AI explanation")
 ):
     """Check if a port is open and get AI-explained results"""
-    try:
-        diagnostic = NetworkDiagnostic()
-        result = diagnostic.check_port(host, port, explain=explain)
-        
-        if not result.get("success") and result.get("error"):
-            display = DisplayManager()
-            display.show_error(result["error"])
+    from .core.network_diagnostic import NetworkDiagnostic
+
+    diagnostic = NetworkDiagnostic()
+    result = diagnostic.check_port(host, port, explain=explain)
     
-    except Exception as e:
-        display = DisplayManager()
-        display.show_error(f"Error: {str(e)}")
-        raise typer.Exit(1)
+    if not result.get("success") and result.get("error"):
+        display = _display()
+        display.show_error(result["error"])
 
 
 @network_app.command("dns")
@@ -959,18 +951,14 @@ def network_dns(
     explain: bool = typer.Option(True, "--explain/--no-explain", help="Show AI explanation")
 ):
     """Perform DNS lookup and get AI-explained results"""
-    try:
-        diagnostic = NetworkDiagnostic()
-        result = diagnostic.dns_lookup(hostname, explain=explain)
-        
-        if not result.get("success") and result.get("error"):
-            display = DisplayManager()
-            display.show_error(result["error"])
+    from .core.network_diagnostic import NetworkDiagnostic
+
+    diagnostic = NetworkDiagnostic()
+    result = diagnostic.dns_lookup(hostname, explain=explain)
     
-    except Exception as e:
-        display = DisplayManager()
-        display.show_error(f"Error: {str(e)}")
-        raise typer.Exit(1)
+    if not result.get("success") and result.get("error"):
+        display = _display()
+        display.show_error(result["error"])
 
 
 @app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})
@@ -980,7 +968,8 @@ def react(
     auto_confirm: bool = typer.Option(False, "--auto", help="Auto-confirm risky actions without asking"),
     max_iterations: int = typer.Option(5, "--max-iterations", help="Maximum number of observe-reason-plan-act cycles (default: 5, 2-3 recommended mostly)"),
     verbose: bool = typer.Option(True, "--verbose/--quiet", help="Show detailed reasoning and observations"),
-    cwd: Optional[str] = typer.Option(None, "--cwd", help="Working directory for execution")
+    cwd: Optional[str] = typer.Option(None, "--cwd", help="Working directory for execution"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the plan cache (enabled with TERMA_PLAN_CACHE=1)")
 ):
     """
     ReAct Agent: Fully agentic goal achievement using Observe-Reason-Plan-Act loop.
@@ -1024,44 +1013,40 @@ def react(
         raise typer.Exit(1)
     
     goal_description = " ".join(goal_parts)
+
+    from .core.react_agent import ReActAgent
+    from .core.plan_cache import PlanCache
+
+    # Initialize ReAct agent
+    llm_client = _llm_client()
+    working_dir = cwd or os.getcwd()
+    agent = ReActAgent(
+        llm_client=llm_client,
+        working_directory=working_dir,
+        plan_cache=PlanCache.from_env(disabled=no_cache)
+    )
     
-    try:
-        # Initialize ReAct agent
-        llm_client = LLMClient()
-        working_dir = cwd or os.getcwd()
-        agent = ReActAgent(llm_client=llm_client, working_directory=working_dir)
-        
-        # Achieve the goal
-        result = agent.achieve_goal(
-            goal_description,
-            auto_confirm=auto_confirm,
-            max_iterations=max_iterations,
-            verbose=verbose
-        )
-        
-        # Show summary
-        agent.show_summary(result)
-        
-        # Exit with appropriate code
-        if result.get("goal_achieved"):
-            raise typer.Exit(0)
-        elif result.get("status") == "impossible":
-            raise typer.Exit(1)
-        elif result.get("status") == "max_iterations":
-            typer.echo("\n[yellow]⚠️  Maximum iterations reached. Goal may not be fully achieved.[/yellow]")
-            raise typer.Exit(1)
-        else:
-            raise typer.Exit(0)
+    # Achieve the goal
+    result = agent.achieve_goal(
+        goal_description,
+        auto_confirm=auto_confirm,
+        max_iterations=max_iterations,
+        verbose=verbose
+    )
     
-    except APIKeySetupError:
-        # Error message already shown by require_api_key()
-        raise typer.Exit(1)
-    except KeyboardInterrupt:
-        typer.echo("\n👋 ReAct agent interrupted")
+    # Show summary
+    agent.show_summary(result)
+    
+    # Exit with appropriate code
+    if result.get("goal_achieved"):
         raise typer.Exit(0)
-    except Exception as e:
-        typer.echo(f"❌ Error: {str(e)}", err=True)
+    elif result.get("status") == "impossible":
         raise typer.Exit(1)
+    elif result.get("status") == "max_iterations":
+        typer.echo("\n[yellow]⚠️  Maximum iterations reached. Goal may not be fully achieved.[/yellow]")
+        raise typer.Exit(1)
+    else:
+        raise typer.Exit(0)
 
 
 @app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})
@@ -1069,7 +1054,8 @@ def goal(
     ctx: typer.Context,
     goal_description: Optional[str] = typer.Argument(None, help="Natural language goal description"),
     auto_confirm: bool = typer.Option(False, "--auto", help="Auto-confirm all steps without asking"),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Show plan without executing")
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show plan without executing"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the plan cache (enabled with TERMA_PLAN_CACHE=1)")
 ):
     """
     Goal-Oriented Agent: Understand, plan, and execute complex goals.
@@ -1105,49 +1091,51 @@ def goal(
         raise typer.Exit(1)
     
     goal_description = " ".join(goal_parts)
+
+    from .core.goal_agent import GoalAgent
+    from .core.plan_cache import PlanCache
+
+    agent = GoalAgent(plan_cache=PlanCache.from_env(disabled=no_cache))
+    result = agent.process_goal(goal_description, auto_confirm=auto_confirm, dry_run=dry_run)
     
-    try:
-        agent = GoalAgent()
-        result = agent.process_goal(goal_description, auto_confirm=auto_confirm, dry_run=dry_run)
-        
-        if result.get("cancelled"):
-            typer.echo("Goal execution cancelled")
-            raise typer.Exit(0)
-        
-        if result.get("error"):
-            display = DisplayManager()
-            display.show_error(result["error"])
-            raise typer.Exit(1)
-        
-        if result.get("summary"):
-            agent.show_summary(result["summary"])
-        
-        if result.get("dry_run"):
-            raise typer.Exit(0)
-        
-        if result.get("success"):
-            raise typer.Exit(0)
-        elif result.get("cancelled"):
-            raise typer.Exit(0)
-        else:
-            raise typer.Exit(1)
+    if result.get("cancelled"):
+        typer.echo("Goal execution cancelled")
+        raise typer.Exit(0)
     
-    except APIKeySetupError:
-        # Error message already shown by require_api_key()
+    if result.get("error"):
+        display = _display()
+        display.show_error(result["error"])
         raise typer.Exit(1)
-    except KeyboardInterrupt:
-        typer.echo("\n👋 Goal execution interrupted")
+    
+    if result.get("summary"):
+        agent.show_summary(result["summary"])
+    
+    if result.get("dry_run"):
         raise typer.Exit(0)
-    except Exception as e:
-        display = DisplayManager()
-        display.show_error(f"Unexpected error: {str(e)}")
+    
+    if result.get("success"):
+        raise typer.Exit(0)
+    elif result.get("cancelled"):
+        raise typer.Exit(0)
+    else:
         raise typer.Exit(1)
 
 
+def _use_uvloop():
+    """Run asyncio.run() calls on uvloop's faster event loop when it is installed"""
+    try:
+        import asyncio
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def cli():
     """CLI entry point for pip-installed package"""
+    _use_uvloop()
     app()
 
 
 if __name__ == "__main__":
-    app()
+    cli()
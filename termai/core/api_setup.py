@@ -2,14 +2,23 @@
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from dotenv import load_dotenv, set_key, find_dotenv
+from typing import Optional, TYPE_CHECKING
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+
+# rich and dotenv are imported where they're used: this module is imported by
+# the CLI entry point, and most invocations never need either
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Console for setup messages, created on first use"""
+    from rich.console import Console
+    return Console()
 
 
 class APIKeySetupError(Exception):
@@ -17,21 +26,31 @@ class APIKeySetupError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
 def check_api_key() -> Optional[str]:
     """
     Check if API key is set. Returns the API key if found, None otherwise.
+
+    The result is cached for the lifetime of the process so that repeated
+    client construction (e.g. in shell/chat loops) doesn't re-read .env.
+    Call ``_reset_api_key_cache()`` after changing the key.
     
     Returns:
         API key string if found, None otherwise
     """
+    from dotenv import load_dotenv
+
     load_dotenv()
     api_key = os.getenv("API_KEY") or os.getenv("OPENROUTER_API_KEY")
     return api_key
 
 
-def show_api_key_instructions():
-    """Display instructions for setting up OpenRouter API key"""
-    instructions = """
+def _reset_api_key_cache():
+    """Forget the cached API key so the next check re-reads .env and the environment"""
+    check_api_key.cache_clear()
+
+
+_API_KEY_INSTRUCTIONS = """
 🔑 OpenRouter API Key Setup Required
 
 To use Terma AI, you need an OpenRouter API key. Here's how to get one:
@@ -74,13 +93,24 @@ To use Terma AI, you need an OpenRouter API key. Here's how to get one:
    • Documentation: https://openrouter.ai/docs
    • Supported Models: https://openrouter.ai/models
 """
-    
-    console.print(Panel(
-        instructions,
+
+
+@lru_cache(maxsize=1)
+def _api_key_panel() -> "Panel":
+    """The API key instructions panel, built once and reused"""
+    from rich.panel import Panel
+
+    return Panel(
+        _API_KEY_INSTRUCTIONS,
         title="[bold yellow]⚠️  API Key Not Configured[/bold yellow]",
         border_style="yellow",
         padding=(1, 2)
-    ))
+    )
+
+
+def show_api_key_instructions():
+    """Display instructions for setting up OpenRouter API key"""
+    _console().print(_api_key_panel())
 
 
 def setup_api_key_interactive() -> bool:
@@ -90,7 +120,10 @@ def setup_api_key_interactive() -> bool:
     Returns:
         True if setup was successful, False otherwise
     """
-    console.print("\n[bold cyan]🔧 Terma AI API Key Setup[/bold cyan]\n")
+    from rich.prompt import Prompt, Confirm
+    from dotenv import load_dotenv, set_key, find_dotenv
+
+    _console().print("\n[bold cyan]🔧 Terma AI API Key Setup[/bold cyan]\n")
     
     # Check if .env file exists
     env_path = find_dotenv()
@@ -102,7 +135,7 @@ def setup_api_key_interactive() -> bool:
     else:
         env_path = Path(env_path)
     
-    console.print(f"[dim]Configuration file: {env_path}[/dim]\n")
+    _console().print(f"[dim]Configuration file: {env_path}[/dim]\n")
     
     # Get API key from user
     api_key = Prompt.ask(
@@ -112,30 +145,31 @@ def setup_api_key_interactive() -> bool:
     ).strip()
     
     if not api_key:
-        console.print("[red]❌ No API key provided. Setup cancelled.[/red]")
+        _console().print("[red]❌ No API key provided. Setup cancelled.[/red]")
         return False
     
     # Validate key format (basic check)
     if not api_key.startswith("sk-or-v1-") and not api_key.startswith("sk-"):
-        console.print("[yellow]⚠️  Warning: API key format looks unusual. Make sure it's correct.[/yellow]")
+        _console().print("[yellow]⚠️  Warning: API key format looks unusual. Make sure it's correct.[/yellow]")
         if not Confirm.ask("Continue anyway?"):
             return False
     
     # Save to .env file
     try:
         set_key(str(env_path), "API_KEY", api_key)
-        console.print(f"\n[green]✅ API key saved to {env_path}[/green]")
+        _console().print(f"\n[green]✅ API key saved to {env_path}[/green]")
         
         # Reload environment
         load_dotenv(env_path, override=True)
+        _reset_api_key_cache()
         
-        console.print("\n[bold green]🎉 Setup complete![/bold green]")
-        console.print("You can now use Terma AI commands.\n")
-        console.print("[dim]Tip: Run 'terma config' to verify your configuration[/dim]\n")
+        _console().print("\n[bold green]🎉 Setup complete![/bold green]")
+        _console().print("You can now use Terma AI commands.\n")
+        _console().print("[dim]Tip: Run 'terma config' to verify your configuration[/dim]\n")
         
         return True
     except Exception as e:
-        console.print(f"[red]❌ Error saving API key: {str(e)}[/red]")
+        _console().print(f"[red]❌ Error saving API key: {str(e)}[/red]")
         return False
 
 
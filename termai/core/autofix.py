@@ -1,16 +1,51 @@
 """Auto-fix terminal errors using AI"""
 
+import asyncio
 from typing import Dict, Any, Optional, List
+
+try:
+    from pydantic import TypeAdapter
+    from typing_extensions import NotRequired, TypedDict
+except ImportError:
+    TypeAdapter = None
+
 from .llm import LLMClient
 from .safety import SafetyChecker
 from .executor import CommandExecutor
 from .display import DisplayManager
 from .teaching import TeachingMode
+from .json_utils import JSONDecodeError, loads, strip_fences
+
+
+if TypeAdapter is not None:
+    class _Fix(TypedDict):
+        command: str
+        explanation: NotRequired[str]
+        confidence: NotRequired[str]
+
+    class _Analysis(TypedDict, total=False):
+        error_summary: str
+        root_cause: str
+        fixes: List[_Fix]
+        prevention: str
+
+    # Schema check for analyses returned by the model
+    _ANALYSIS_ADAPTER = TypeAdapter(_Analysis)
+else:
+    _ANALYSIS_ADAPTER = None
 
 
 class AutoFix:
     """Automatically fix terminal command errors"""
 
+    SYSTEM_PROMPT = "You are a Linux error diagnosis and fixing assistant. Analyze errors and provide clear, safe fixes."
+
+    # Output budget for one analysis; JSON mode keeps replies compact
+    MAX_TOKENS = 300
+
+    # A response that fails to parse or validate is re-asked once
+    PARSE_ATTEMPTS = 2
+
     def __init__(self, llm_client: Optional[LLMClient] = None):
         """Initialize the auto-fix system"""
         self.llm_client = llm_client or LLMClient()
@@ -31,6 +66,150 @@ class AutoFix:
         Returns:
             Analysis with suggested fixes
         """
+        request = self._analysis_request(command, stderr, stdout, return_code)
+
+        try:
+            for _ in range(self.PARSE_ATTEMPTS):
+                response = self.llm_client.chat(**request)
+                content = response.choices[0].message.content
+                try:
+                    analyses = self._parse_analyses(content)
+                except ValueError:
+                    # Invalid JSON or schema mismatch (both are ValueErrors)
+                    continue
+                if len(analyses) == 1:
+                    return self._finish_analysis(analyses[0], command, stderr, return_code)
+            
+            return self._finish_analysis(self._parse_analysis(content), command, stderr, return_code)
+            
+        except Exception as e:
+            return self._analysis_failed(e, command, stderr)
+
+    def analyze_errors_batch(self, failures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several failed commands with a single LLM request
+        
+        Args:
+            failures: Dicts with "command", "stderr" and optionally "stdout"
+                and "return_code" (the shape of executor results)
+            
+        Returns:
+            One analysis per failure, in the same order
+
+        Raises:
+            RuntimeError: If called while an event loop is running; await
+                aanalyze_errors_batch() there instead
+        """
+        if not failures:
+            return []
+        if len(failures) == 1:
+            failure = failures[0]
+            return [self.analyze_error(
+                failure["command"],
+                failure.get("stderr", ""),
+                failure.get("stdout", ""),
+                failure.get("return_code", 1)
+            )]
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("analyze_errors_batch() can't run inside an event loop; await aanalyze_errors_batch()")
+
+        async def run() -> List[Dict[str, Any]]:
+            try:
+                return await self.aanalyze_errors_batch(failures)
+            finally:
+                await self.llm_client.aclose()
+
+        return asyncio.run(run())
+
+    async def aanalyze_errors_batch(self, failures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Async counterpart of analyze_errors_batch()
+
+        If the reply doesn't hold exactly one analysis per failure, each
+        failure is re-asked individually (concurrently). A failed request is
+        not retried that way: every failure reports the error instead.
+        """
+        if len(failures) < 2:
+            return await self._aanalyze_each(failures)
+
+        try:
+            response = await self.llm_client.achat(**self._batch_request(failures))
+        except Exception as e:
+            return [self._analysis_failed(e, f["command"], f.get("stderr", "")) for f in failures]
+
+        try:
+            analyses = self._parse_analyses(response.choices[0].message.content)
+        except ValueError:
+            # Invalid JSON or schema mismatch (both are ValueErrors)
+            analyses = []
+
+        if len(analyses) != len(failures):
+            return await self._aanalyze_each(failures)
+
+        return [
+            self._finish_analysis(analysis, f["command"], f.get("stderr", ""), f.get("return_code", 1))
+            for analysis, f in zip(analyses, failures)
+        ]
+
+    def _batch_request(self, failures: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the chat completion arguments for analyzing several failures at once"""
+        sections = []
+        for i, failure in enumerate(failures, 1):
+            sections.append(f"""Failure {i}:
+Failed Command: {failure["command"]}
+Return Code: {failure.get("return_code", 1)}
+Error Output: {failure.get("stderr", "")}
+Standard Output: {failure.get("stdout", "")}""")
+
+        batch_prompt = f"""{len(failures)} commands failed with errors. Analyze each error and suggest fixes.
+
+{chr(10).join(sections)}
+
+Return a JSON object {{"analyses": [...]}} whose array has exactly {len(failures)} objects, one per failure and in the same order, each shaped as:
+{{
+  "error_summary": "Brief description of the error",
+  "root_cause": "Why it failed",
+  "fixes": [
+    {{
+      "command": "fix command",
+      "explanation": "Why this fixes it",
+      "confidence": "high|medium|low"
+    }}
+  ],
+  "prevention": "How to avoid this in the future"
+}}"""
+
+        return {
+            "messages": self.llm_client.build_messages(self.SYSTEM_PROMPT, batch_prompt),
+            "temperature": 0.3,
+            "max_tokens": self.MAX_TOKENS * len(failures),
+            "response_format": {"type": "json_object"}
+        }
+
+    async def _aanalyze_each(self, failures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Analyze failures with one concurrent request each"""
+        async def analyze(failure: Dict[str, Any]) -> Dict[str, Any]:
+            command = failure["command"]
+            stderr = failure.get("stderr", "")
+            return_code = failure.get("return_code", 1)
+            try:
+                response = await self.llm_client.achat(
+                    **self._analysis_request(command, stderr, failure.get("stdout", ""), return_code)
+                )
+                content = response.choices[0].message.content
+                return self._finish_analysis(self._parse_analysis(content), command, stderr, return_code)
+            except Exception as e:
+                return self._analysis_failed(e, command, stderr)
+
+        return list(await asyncio.gather(*(analyze(f) for f in failures)))
+
+    def _analysis_request(self, command: str, stderr: str, stdout: str, return_code: int) -> Dict[str, Any]:
+        """Build the chat completion arguments for analyzing one failure"""
         error_analysis_prompt = f"""A command failed with an error. Analyze the error and suggest fixes.
 
 Failed Command: {command}
@@ -58,31 +237,28 @@ Return as JSON:
   "prevention": "How to avoid this in the future"
 }}"""
 
-        try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {"role": "system", "content": "You are a Linux error diagnosis and fixing assistant. Analyze errors and provide clear, safe fixes."},
-                    {"role": "user", "content": error_analysis_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=500
-            )
-            
-            content = response.choices[0].message.content
-            analysis = self._parse_analysis(content)
-            analysis["original_command"] = command
-            analysis["error_output"] = stderr
-            analysis["return_code"] = return_code
-            
-            return analysis
-            
-        except Exception as e:
-            return {
-                "error": f"Failed to analyze error: {str(e)}",
-                "original_command": command,
-                "error_output": stderr
-            }
+        return {
+            "messages": self.llm_client.build_messages(self.SYSTEM_PROMPT, error_analysis_prompt),
+            "temperature": 0.3,
+            "max_tokens": self.MAX_TOKENS,
+            # JSON mode: the reply is a bare JSON object, no code fences
+            "response_format": {"type": "json_object"}
+        }
+
+    def _finish_analysis(self, analysis: Dict[str, Any], command: str, stderr: str, return_code: int) -> Dict[str, Any]:
+        """Attach the failed command's details to a parsed analysis"""
+        analysis["original_command"] = command
+        analysis["error_output"] = stderr
+        analysis["return_code"] = return_code
+        return analysis
+
+    def _analysis_failed(self, error: Exception, command: str, stderr: str) -> Dict[str, Any]:
+        """Result returned when the LLM request for an analysis fails"""
+        return {
+            "error": f"Failed to analyze error: {str(error)}",
+            "original_command": command,
+            "error_output": stderr
+        }
 
     def fix_error(self, command: str, stderr: str, stdout: str = "", return_code: int = 1,
                   auto_execute: bool = False, teaching_mode: bool = False) -> Dict[str, Any]:
@@ -179,36 +355,9 @@ Return as JSON:
 
     def _parse_analysis(self, content: str) -> Dict[str, Any]:
         """Parse LLM response into analysis structure"""
-        import json
-        import re
-        
         try:
-            # Try to extract JSON
-            content = content.strip()
-            
-            # Find JSON block
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            
-            analysis = json.loads(content)
-            
-            # Validate structure
-            if not isinstance(analysis, dict):
-                raise ValueError("Analysis is not a dictionary")
-            
-            # Ensure fixes array exists
-            if "fixes" not in analysis:
-                analysis["fixes"] = []
-            
-            return analysis
-            
-        except json.JSONDecodeError:
+            analyses = self._parse_analyses(content)
+        except JSONDecodeError:
             # Fallback: try to extract information manually
             return {
                 "error_summary": "Could not parse error analysis",
@@ -221,3 +370,42 @@ Return as JSON:
                 "error": f"Failed to parse analysis: {str(e)}",
                 "fixes": []
             }
+
+        if len(analyses) != 1:
+            return {
+                "error": "Failed to parse analysis: expected a single analysis",
+                "fixes": []
+            }
+        return analyses[0]
+
+    def _parse_analyses(self, content: str) -> List[Dict[str, Any]]:
+        """
+        Parse an LLM response holding one analysis, a JSON array of them, or
+        an {"analyses": [...]} object (the batch reply in JSON mode)
+
+        Raises:
+            JSONDecodeError: If the response isn't valid JSON
+            ValueError: If an analysis doesn't match the expected schema
+        """
+        try:
+            parsed = loads(content)
+        except JSONDecodeError:
+            # Models that ignore JSON mode may still wrap the reply in a fence
+            parsed = loads(strip_fences(content))
+
+        if isinstance(parsed, dict) and isinstance(parsed.get("analyses"), list):
+            parsed = parsed["analyses"]
+        analyses = parsed if isinstance(parsed, list) else [parsed]
+        
+        for analysis in analyses:
+            # Validate structure
+            if not isinstance(analysis, dict):
+                raise ValueError("Analysis is not a dictionary")
+            if _ANALYSIS_ADAPTER is not None:
+                _ANALYSIS_ADAPTER.validate_python(analysis)
+            
+            # Ensure fixes array exists
+            if "fixes" not in analysis:
+                analysis["fixes"] = []
+        
+        return analyses
@@ -1,33 +1,86 @@
 """Conversational agent that answers questions naturally and executes commands when needed"""
 
+import asyncio
+import time
+from collections import deque
+from contextlib import suppress
 from typing import Dict, Any, Optional, List
-from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
+from rich.live import Live
 
 from .llm import LLMClient
 from .safety import SafetyChecker
 from .executor import CommandExecutor
-from .display import DisplayManager
+from .display import DISPLAY
+from .plan_cache import PlanCache
+from .fast_classifier import CONVERSATIONAL, UNKNOWN, classify
 
 
 class ConversationalAgent:
     """Agent that handles conversational queries and executes commands when needed"""
 
-    def __init__(self, llm_client: Optional[LLMClient] = None, working_directory: Optional[str] = None):
+    RESPONSE_REFRESH_PER_SECOND = 12
+
+    # Title and border style of each kind of response panel
+    RESPONSE_PANELS = {
+        "response": {"title": "[bold cyan]💬 Response[/bold cyan]", "border_style": "cyan"},
+        "cached": {"title": "[bold cyan]💬 Response[/bold cyan] [dim](cached)[/dim]", "border_style": "cyan"},
+        "fallback": {"title": "[bold yellow]💬 Response[/bold yellow]", "border_style": "yellow"},
+        "summary": {"title": "[bold green]✅ Summary[/bold green]", "border_style": "green"},
+    }
+
+    def __init__(
+        self,
+        llm_client: Optional[LLMClient] = None,
+        working_directory: Optional[str] = None,
+        plan_cache: Optional[PlanCache] = None
+    ):
         """Initialize the conversational agent"""
+        self.plan_cache = plan_cache
         self.llm_client = llm_client or LLMClient()
         self.safety_checker = SafetyChecker()
         self.executor = CommandExecutor(working_directory=working_directory)
-        self.display = DisplayManager()
-        self.console = Console()
+        self.display = DISPLAY
+        self.console = self.display.console
+        # Recent analysis outcomes (True = needed execution), used to decide
+        # whether speculatively generating commands is likely to pay off
+        self._recent_executions = deque(maxlen=10)
 
     def process_query(
         self, 
         user_query: str, 
         auto_execute: bool = True,
         confirm_risky: bool = True,
-        conversation_history: Optional[List[str]] = None
+        conversation_history: Optional[List[str]] = None,
+        stream: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around aprocess_query() for callers without an event loop
+        """
+        return asyncio.run(self._run_query(user_query, auto_execute, confirm_risky, conversation_history, stream))
+
+    async def _run_query(
+        self,
+        user_query: str,
+        auto_execute: bool,
+        confirm_risky: bool,
+        conversation_history: Optional[List[str]],
+        stream: bool
+    ) -> Dict[str, Any]:
+        """Run aprocess_query() and release the async client before the loop closes"""
+        try:
+            return await self.aprocess_query(user_query, auto_execute, confirm_risky, conversation_history, stream)
+        finally:
+            await self.llm_client.aclose()
+
+    async def aprocess_query(
+        self, 
+        user_query: str, 
+        auto_execute: bool = True,
+        confirm_risky: bool = True,
+        conversation_history: Optional[List[str]] = None,
+        stream: bool = True
     ) -> Dict[str, Any]:
         """
         Process a user query - answer conversationally or execute commands as needed
@@ -37,40 +90,82 @@ class ConversationalAgent:
             auto_execute: If True, automatically execute safe commands
             confirm_risky: If True, ask for confirmation before risky commands
             conversation_history: Optional list of previous conversation turns for context
+            stream: If True, render responses as they are generated
             
         Returns:
             Dict with response and execution results
         """
+        working_dir = self.executor.get_working_directory()
+
+        # Answers to standalone questions can be served from the plan cache;
+        # follow-ups depend on the conversation so they always go to the LLM.
+        # The answer is shown as-is, so only the same question may reuse it
+        use_cache = self.plan_cache is not None and not conversation_history
+        cached = self.plan_cache.lookup("conversational", user_query, exact=True) if use_cache else None
+        if cached:
+            response = cached["payload"]["response"]
+            self.console.print(self._response_panel("cached", response))
+            return {
+                "type": "conversational",
+                "response": response,
+                "executed_commands": False,
+                "query_type": cached["payload"].get("query_type", "question"),
+                "cached": True
+            }
+
+        # Obvious cases (a bare shell command, a greeting, a general question)
+        # are classified locally, saving the analysis round trip
+        label = classify(user_query) if self.llm_client.config.get("fast_classifier", True) else UNKNOWN
+
+        # Start generating commands while the query is being analyzed, so the
+        # common command case doesn't pay for two sequential LLM round trips
+        commands_task = None
+        if label == UNKNOWN and self._should_speculate():
+            commands_task = asyncio.create_task(self.llm_client.agenerate_commands(
+                user_query,
+                working_directory=working_dir,
+                conversation_history=conversation_history
+            ))
+
         # Step 1: Analyze the query
-        self.console.print(f"[dim]🤔 Analyzing query...[/dim]")
-        analysis = self.llm_client.analyze_query(
-            user_query, 
-            self.executor.get_working_directory(),
-            conversation_history=conversation_history
-        )
+        if label != UNKNOWN:
+            analysis = self._local_analysis(label)
+        else:
+            self.console.print(f"[dim]🤔 Analyzing query...[/dim]")
+            try:
+                analysis = await self.llm_client.aanalyze_query(
+                    user_query, 
+                    working_dir,
+                    conversation_history=conversation_history
+                )
+            except BaseException:
+                await self._discard(commands_task)
+                raise
         
         needs_execution = analysis.get("needs_execution", True)
         query_type = analysis.get("query_type", "command_request")
+        self._recent_executions.append(bool(needs_execution))
         
         # Step 2: Handle based on analysis
         if not needs_execution:
+            await self._discard(commands_task)
+
             # Pure conversational response
             self.console.print(f"[dim]💬 Generating conversational response...[/dim]\n")
-            response = self.llm_client.generate_conversational_response(
+            response = await self._respond(
+                "response",
+                stream,
                 user_query,
                 command_results=None,
-                working_directory=self.executor.get_working_directory(),
+                working_directory=working_dir,
                 conversation_history=conversation_history
             )
-            
-            # Display response in a nice panel
-            panel = Panel(
-                Markdown(response),
-                title="[bold cyan]💬 Response[/bold cyan]",
-                border_style="cyan",
-                padding=(1, 2)
-            )
-            self.console.print(panel)
+
+            if use_cache and not response.startswith("I encountered an error"):
+                self.plan_cache.store("conversational", user_query, {
+                    "response": response,
+                    "query_type": query_type
+                })
             
             return {
                 "type": "conversational",
@@ -83,13 +178,15 @@ class ConversationalAgent:
             # Query needs command execution
             self.console.print(f"[dim]🔧 Generating commands...[/dim]\n")
             
-            # Generate commands
-            working_dir = self.executor.get_working_directory()
-            llm_response = self.llm_client.generate_commands(
-                user_query, 
-                working_directory=working_dir,
-                conversation_history=conversation_history
-            )
+            # Generate commands (or pick up the speculative request)
+            if commands_task is not None:
+                llm_response = await commands_task
+            else:
+                llm_response = await self.llm_client.agenerate_commands(
+                    user_query, 
+                    working_directory=working_dir,
+                    conversation_history=conversation_history
+                )
             
             if llm_response.get("error"):
                 error_msg = llm_response.get("error", "Unknown error")
@@ -104,19 +201,14 @@ class ConversationalAgent:
             explanations = llm_response.get("explanations", [])
             
             if not commands:
-                response = self.llm_client.generate_conversational_response(
+                response = await self._respond(
+                    "fallback",
+                    stream,
                     user_query,
                     command_results=None,
                     working_directory=working_dir,
                     conversation_history=conversation_history
                 )
-                panel = Panel(
-                    Markdown(response),
-                    title="[bold yellow]💬 Response[/bold yellow]",
-                    border_style="yellow",
-                    padding=(1, 2)
-                )
-                self.console.print(panel)
                 return {
                     "type": "conversational",
                     "response": response,
@@ -156,29 +248,29 @@ class ConversationalAgent:
             
             # Execute commands
             self.display.show_execution_start()
-            execution_result = self.executor.execute_commands(commands, explanations)
-            
-            # Show execution results
-            self.display.show_execution_results(execution_result["results"], verbose=False)
+            results = []
+            async for result in self.executor.aiter_execute(
+                commands,
+                explanations,
+                parallel=self.executor.are_independent(commands)
+            ):
+                # Show each result as soon as its command finishes
+                self.display.show_single_result(result)
+                results.append(result)
+            execution_result = self.executor.summarize(commands, results)
+            self.display.show_execution_summary(results, verbose=False)
             
             # Generate natural language summary
             self.console.print(f"\n[dim]💬 Generating response summary...[/dim]\n")
-            response = self.llm_client.generate_conversational_response(
+            response = await self._respond(
+                "summary",
+                stream,
                 user_query,
                 command_results=execution_result["results"],
                 working_directory=working_dir,
                 conversation_history=conversation_history
             )
             
-            # Display response in a nice panel
-            panel = Panel(
-                Markdown(response),
-                title="[bold green]✅ Summary[/bold green]",
-                border_style="green",
-                padding=(1, 2)
-            )
-            self.console.print(panel)
-            
             return {
                 "type": "execution_with_summary",
                 "response": response,
@@ -188,3 +280,65 @@ class ConversationalAgent:
                 "query_type": query_type
             }
 
+
+    def _response_panel(self, kind: str, text: str) -> Panel:
+        """Panel for a response; kind is a key of RESPONSE_PANELS"""
+        return Panel(Markdown(text), padding=(1, 2), **self.RESPONSE_PANELS[kind])
+
+    async def _respond(self, kind: str, stream: bool, user_query: str, **kwargs) -> str:
+        """Generate a conversational response and display it in a panel"""
+        def panel(text: str) -> Panel:
+            return self._response_panel(kind, text)
+
+        # Live rendering only makes sense on an interactive terminal
+        if not stream or not self.console.is_terminal:
+            response = await self.llm_client.agenerate_conversational_response(user_query, **kwargs)
+            self.console.print(panel(response))
+            return response
+
+        # Re-render at most RESPONSE_REFRESH_PER_SECOND times, not on every token
+        response = ""
+        last_render = 0.0
+        with Live(panel(""), console=self.console, refresh_per_second=self.RESPONSE_REFRESH_PER_SECOND) as live:
+            async for token in self.llm_client.astream_conversational_response(user_query, **kwargs):
+                response += token
+                now = time.monotonic()
+                if now - last_render >= 1 / self.RESPONSE_REFRESH_PER_SECOND:
+                    live.update(panel(response))
+                    last_render = now
+            response = response.strip()
+            live.update(panel(response))
+        return response
+
+    @staticmethod
+    def _local_analysis(label: str) -> Dict[str, Any]:
+        """Query analysis result for a query the fast classifier labelled"""
+        if label == CONVERSATIONAL:
+            return {
+                "needs_execution": False,
+                "reason": "Classified locally as a question",
+                "query_type": "question"
+            }
+        return {
+            "needs_execution": True,
+            "reason": "Classified locally as a command request",
+            "query_type": "command_request"
+        }
+
+    def _should_speculate(self) -> bool:
+        """Whether to generate commands before the query analysis comes back"""
+        if not self.llm_client.config.get("speculative_commands", True):
+            return False
+        # Skip speculation when recent queries have mostly been conversational
+        if len(self._recent_executions) < 3:
+            return True
+        return sum(self._recent_executions) * 2 >= len(self._recent_executions)
+
+    @staticmethod
+    async def _discard(task: Optional["asyncio.Task"]):
+        """Cancel a speculative task and wait for it to wind down"""
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
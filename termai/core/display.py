@@ -1,18 +1,119 @@
 """Display utilities for rich terminal output"""
 
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 import os
-from rich.console import Console
+import re
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
-from rich.table import Table
-from rich.columns import Columns
-from .file_helper import suggest_files_for_error
-from rich.prompt import Confirm
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# rich.table, rich.prompt and file_helper are imported in the methods that
+# need them; most invocations never show a table or ask for confirmation
 
 
 console = Console()
 
+# Title prefix and color of the panel shown for each risk level
+_RISK_PANEL_STYLES = {
+    "CRITICAL": ("🚨 CRITICAL", "bold red", "red"),
+    "HIGH": ("⚠️  HIGH RISK", "yellow", "yellow"),
+    "MEDIUM": ("⚠️  RISKY", "yellow", "yellow"),
+}
+
+
+# Error outputs that file_helper.suggest_files_for_error can extract a filename from
+_MISSING_FILE_RE = re.compile(r"No such file or directory|cannot open", re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class _ResultRow:
+    """Executor result dict normalized once for display (missing keys filled, output stripped)"""
+
+    command: str
+    stdout: str
+    stderr: str
+    return_code: int
+    success: bool
+    streamed: bool
+    execution_time: float
+    command_index: int
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "_ResultRow":
+        """Build a row from an executor result dict"""
+        return_code = result.get("return_code", -1)
+        return cls(
+            command=result.get("command", "Unknown"),
+            stdout=result.get("stdout", "").strip(),
+            stderr=result.get("stderr", "").strip(),
+            return_code=return_code,
+            success=result.get("success", return_code == 0),
+            streamed=result.get("streamed", False),
+            execution_time=result.get("execution_time", 0.0),
+            command_index=result.get("command_index", 0)
+        )
+
+
+@lru_cache(maxsize=256)
+def _build_risky_panel(command: str, reason: str, level: str, idx: int) -> Panel:
+    """
+    Build the panel for one risky command
+
+    Panels are cached (and their markup parsed once) because the same
+    command/reason pairs come back again and again in an interactive session.
+    """
+    title, command_style, border_style = _RISK_PANEL_STYLES[level]
+    return Panel(
+        Text.from_markup(f"[{command_style}]{command}[/{command_style}]\n\n[white]{reason}[/white]"),
+        title=f"{title} - Command {idx + 1}",
+        border_style=border_style
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_summary_table(total: int, success_rate_str: str) -> "Table":
+    """Build the (cached) execution summary table"""
+    from rich.table import Table
+
+    summary_table = Table(title="📊 Execution Summary", show_header=False)
+    summary_table.add_column("Metric", style="cyan")
+    summary_table.add_column("Value", style="green")
+
+    summary_table.add_row("Commands executed", str(total))
+    summary_table.add_row("Success rate", success_rate_str)
+    return summary_table
+
+
+_CRITICAL_CONFIRM_TEMPLATE = (
+    "[bold red]⚠️  CRITICAL RISK WARNING ⚠️[/bold red]\n\n"
+    "[red]You are about to execute commands that can DESTROY your system![/red]\n"
+    "[red]These operations may be IRREVERSIBLE![/red]\n\n"
+    "[white]Total risky commands: {risky_count}[/white]\n"
+    "[white]Total commands: {total_count}[/white]"
+)
+_RISKY_CONFIRM_TEMPLATE = (
+    "[bold yellow]⚠️  RISKY OPERATION WARNING ⚠️[/bold yellow]\n\n"
+    "[yellow]You are about to execute commands that may modify system files or require elevated privileges.[/yellow]\n\n"
+    "[white]Total risky commands: {risky_count}[/white]\n"
+    "[white]Total commands: {total_count}[/white]"
+)
+
+
+@lru_cache(maxsize=64)
+def _build_confirm_panel(risky_count: int, total_count: int, has_critical: bool) -> Panel:
+    """Build the (cached) warning panel shown before asking to run risky commands"""
+    template = _CRITICAL_CONFIRM_TEMPLATE if has_critical else _RISKY_CONFIRM_TEMPLATE
+    return Panel(
+        Text.from_markup(template.format(risky_count=risky_count, total_count=total_count)),
+        title="🚨 DANGER" if has_critical else "⚠️  WARNING",
+        border_style="red" if has_critical else "yellow"
+    )
+
 
 class DisplayManager:
     """Manages rich terminal output for Terma AI"""
@@ -31,12 +132,20 @@ class DisplayManager:
 
     def show_commands(self, commands: List[str], explanations: List[str]):
         """Display generated commands in a nice format"""
+        from rich.cells import cell_len
+        from rich.table import Table
+
+        rows = [(f"{i}. {cmd}", explanation) for i, (cmd, explanation) in enumerate(zip(commands, explanations), 1)]
+
+        # Size the no-wrap command column up front instead of having Rich measure every cell
+        command_width = max((cell_len(label) for label, _ in rows), default=len("Command"))
+
         table = Table(title="📋 Generated Commands", show_header=True, header_style="bold magenta")
-        table.add_column("Command", style="green", no_wrap=True)
+        table.add_column("Command", style="green", no_wrap=True, width=max(command_width, len("Command")))
         table.add_column("Explanation", style="yellow")
 
-        for i, (cmd, explanation) in enumerate(zip(commands, explanations), 1):
-            table.add_row(f"{i}. {cmd}", explanation)
+        for label, explanation in rows:
+            table.add_row(label, explanation)
 
         self.console.print(table)
 
@@ -56,45 +165,37 @@ class DisplayManager:
         if not risky_commands:
             return
 
-        # Group by risk level
-        critical = [c for c in risky_commands if c.get("risk_level") == "CRITICAL"]
-        high = [c for c in risky_commands if c.get("risk_level") == "HIGH"]
-        medium = [c for c in risky_commands if c.get("risk_level") == "MEDIUM"]
+        # Group by risk level in one pass
+        buckets = {"CRITICAL": [], "HIGH": [], "MEDIUM": []}
+        for risky in risky_commands:
+            bucket = buckets.get(risky.get("risk_level"))
+            if bucket is not None:
+                bucket.append(risky)
+        critical, high, medium = buckets["CRITICAL"], buckets["HIGH"], buckets["MEDIUM"]
 
+        # Print everything at once instead of one console write per line
+        renderables = []
         if critical:
-            self.console.print("\n[bold red]⚠️  CRITICAL RISK COMMANDS DETECTED ⚠️[/bold red]")
-            self.console.print("[red]These commands can DESTROY your system or cause irreversible damage![/red]\n")
+            renderables.append("\n[bold red]⚠️  CRITICAL RISK COMMANDS DETECTED ⚠️[/bold red]")
+            renderables.append("[red]These commands can DESTROY your system or cause irreversible damage![/red]\n")
             
             for risky in critical:
-                panel = Panel(
-                    f"[bold red]{risky['command']}[/bold red]\n\n[white]{risky['reason']}[/white]",
-                    title=f"🚨 CRITICAL - Command {risky['index'] + 1}",
-                    border_style="red"
-                )
-                self.console.print(panel)
+                renderables.append(_build_risky_panel(risky['command'], risky['reason'], "CRITICAL", risky['index']))
 
         if high:
-            self.console.print("\n[bold yellow]⚠️  HIGH RISK COMMANDS DETECTED ⚠️[/bold yellow]")
-            self.console.print("[yellow]These commands modify system files or require elevated privileges![/yellow]\n")
+            renderables.append("\n[bold yellow]⚠️  HIGH RISK COMMANDS DETECTED ⚠️[/bold yellow]")
+            renderables.append("[yellow]These commands modify system files or require elevated privileges![/yellow]\n")
             
             for risky in high:
-                panel = Panel(
-                    f"[yellow]{risky['command']}[/yellow]\n\n[white]{risky['reason']}[/white]",
-                    title=f"⚠️  HIGH RISK - Command {risky['index'] + 1}",
-                    border_style="yellow"
-                )
-                self.console.print(panel)
+                renderables.append(_build_risky_panel(risky['command'], risky['reason'], "HIGH", risky['index']))
 
         if medium:
-            self.console.print("\n[bold yellow]⚠️  RISKY COMMANDS DETECTED ⚠️[/bold yellow]\n")
+            renderables.append("\n[bold yellow]⚠️  RISKY COMMANDS DETECTED ⚠️[/bold yellow]\n")
             
             for risky in medium:
-                panel = Panel(
-                    f"[yellow]{risky['command']}[/yellow]\n\n[white]{risky['reason']}[/white]",
-                    title=f"⚠️  RISKY - Command {risky['index'] + 1}",
-                    border_style="yellow"
-                )
-                self.console.print(panel)
+                renderables.append(_build_risky_panel(risky['command'], risky['reason'], "MEDIUM", risky['index']))
+
+        self.console.print(Group(*renderables))
 
     def show_alternatives(self, blocked_commands: List[Dict[str, Any]], safety_checker):
         """Show safer alternatives for blocked commands"""
@@ -111,6 +212,8 @@ class DisplayManager:
 
     def confirm_execution(self, command_count: int) -> bool:
         """Get user confirmation for command execution"""
+        from rich.prompt import Confirm
+
         return Confirm.ask(
             f"🔒 Ready to execute {command_count} safe command(s)?",
             default=False
@@ -118,30 +221,11 @@ class DisplayManager:
 
     def confirm_risky_execution(self, risky_count: int, total_count: int, has_critical: bool = False) -> bool:
         """Get user confirmation for risky command execution with extra warnings"""
-        self.console.print("\n" + "="*70)
-        
-        if has_critical:
-            warning_panel = Panel(
-                "[bold red]⚠️  CRITICAL RISK WARNING ⚠️[/bold red]\n\n"
-                "[red]You are about to execute commands that can DESTROY your system![/red]\n"
-                "[red]These operations may be IRREVERSIBLE![/red]\n\n"
-                f"[white]Total risky commands: {risky_count}[/white]\n"
-                f"[white]Total commands: {total_count}[/white]",
-                title="🚨 DANGER",
-                border_style="red"
-            )
-        else:
-            warning_panel = Panel(
-                "[bold yellow]⚠️  RISKY OPERATION WARNING ⚠️[/bold yellow]\n\n"
-                "[yellow]You are about to execute commands that may modify system files or require elevated privileges.[/yellow]\n\n"
-                f"[white]Total risky commands: {risky_count}[/white]\n"
-                f"[white]Total commands: {total_count}[/white]",
-                title="⚠️  WARNING",
-                border_style="yellow"
-            )
+        from rich.prompt import Confirm
+
+        warning_panel = _build_confirm_panel(risky_count, total_count, has_critical)
         
-        self.console.print(warning_panel)
-        self.console.print("="*70 + "\n")
+        self.console.print(Group("\n" + "="*70, warning_panel, "="*70 + "\n"))
         
         if has_critical:
             # Require explicit "yes" for critical commands
@@ -173,75 +257,128 @@ class DisplayManager:
 
     def show_execution_results(self, results: List[Dict[str, Any]], verbose: bool = False):
         """Display execution results"""
-        successful = sum(1 for r in results if r.get("success", False) or r.get("return_code", 1) == 0)
-        total = len(results)
+        if not results:
+            return
 
-        # Calculate success rate
-        if total > 0:
-            success_rate = (successful / total) * 100
-            success_rate_str = f"{success_rate:.1f}%"
-        else:
-            success_rate_str = "0%"
+        rows = [_ResultRow.from_result(result) for result in results]
+
+        # Nothing worth a panel or a table: say so in one line
+        if not verbose and all(row.success and not row.stdout and not row.stderr for row in rows):
+            self.console.print(f"[green]✅ All {len(rows)} command(s) completed successfully.[/green]")
+            return
+
+        suggestions = self._suggest_files_for_rows(rows)
 
         # Show command output for each result
-        for i, result in enumerate(results, 1):
-            command = result.get("command", "Unknown command")
-            stdout = result.get("stdout", "").strip()
-            stderr = result.get("stderr", "").strip()
-            return_code = result.get("return_code", -1)
-            success = result.get("success", return_code == 0)
-            
-            # Show output
-            if stdout:
-                self.console.print(f"\n[bold green]📄 Output:[/bold green]")
-                self.console.print(stdout)
-            
-            if stderr:
-                self.console.print(f"\n[bold red]⚠️  Error Output:[/bold red]")
-                self.console.print(stderr)
-                
-                # Check for "file not found" errors and suggest similar files
-                if "No such file or directory" in stderr or "cannot open" in stderr.lower():
-                    cwd = os.getcwd()
-                    suggestions = suggest_files_for_error(stderr, cwd)
-                    if suggestions:
-                        self.console.print(f"\n[bold yellow]💡 Did you mean one of these files?[/bold yellow]")
-                        for suggestion in suggestions[:5]:  # Show max 5 suggestions
-                            self.console.print(f"  • [cyan]{suggestion}[/cyan]")
+        for i, row in enumerate(rows):
+            self._show_row(row, suggestions.get(i))
+
+        self._show_summary_rows(rows, verbose)
+
+    @staticmethod
+    def _is_missing_file_error(stderr: str) -> bool:
+        """Whether an error output looks like a "file not found" error"""
+        return _MISSING_FILE_RE.search(stderr) is not None
+
+    def _suggest_files_for_rows(self, rows: List[_ResultRow]) -> Dict[int, Optional[List[str]]]:
+        """Look up similar files for every "file not found" error at once"""
+        failed = [(i, row.stderr) for i, row in enumerate(rows) if self._is_missing_file_error(row.stderr)]
+        if len(failed) < 2:
+            # Not worth a thread pool; show_single_result looks it up itself
+            return {}
+
+        from concurrent.futures import ThreadPoolExecutor
+        from .file_helper import suggest_files_for_error
+
+        cwd = os.getcwd()
+        with ThreadPoolExecutor(max_workers=min(8, len(failed))) as pool:
+            found = pool.map(lambda stderr: suggest_files_for_error(stderr, cwd), [stderr for _, stderr in failed])
+            return {i: suggestions or [] for (i, _), suggestions in zip(failed, found)}
+
+    def show_single_result(self, result: Dict[str, Any], file_suggestions: Optional[List[str]] = None):
+        """
+        Display the output of one executed command as soon as it finishes
+
+        Args:
+            result: Executor result dict
+            file_suggestions: Precomputed similar files for a "file not found"
+                error (looked up here when None)
+        """
+        self._show_row(_ResultRow.from_result(result), file_suggestions)
+
+    def _show_row(self, row: _ResultRow, file_suggestions: Optional[List[str]] = None):
+        """Display the output of one normalized result"""
+        stdout, stderr, return_code, success = row.stdout, row.stderr, row.return_code, row.success
+        
+        renderables = []
+
+        # Show output (unless the executor already printed it live)
+        streamed = row.streamed
+        if stdout and not streamed:
+            renderables.append(f"\n[bold green]📄 Output:[/bold green]")
+            renderables.append(stdout)
+        
+        if stderr:
+            if not streamed:
+                renderables.append(f"\n[bold red]⚠️  Error Output:[/bold red]")
+                renderables.append(stderr)
             
-            # Show status if command failed
-            if not success:
-                self.console.print(f"\n[bold red]❌ Command failed with return code: {return_code}[/bold red]")
-            elif not stdout and not stderr:
-                # Command succeeded but produced no output
-                self.console.print(f"\n[dim]✓ Command completed successfully (no output)[/dim]")
+            # Check for "file not found" errors and suggest similar files
+            if self._is_missing_file_error(stderr):
+                suggestions = file_suggestions
+                if suggestions is None:
+                    from .file_helper import suggest_files_for_error
+
+                    suggestions = suggest_files_for_error(stderr, os.getcwd())
+                if suggestions:
+                    renderables.append(f"\n[bold yellow]💡 Did you mean one of these files?[/bold yellow]")
+                    for suggestion in suggestions[:5]:  # Show max 5 suggestions
+                        renderables.append(f"  • [cyan]{suggestion}[/cyan]")
+        
+        # Show status if command failed
+        if not success:
+            renderables.append(f"\n[bold red]❌ Command failed with return code: {return_code}[/bold red]")
+        elif not stdout and not stderr:
+            # Command succeeded but produced no output
+            renderables.append(f"\n[dim]✓ Command completed successfully (no output)[/dim]")
+
+        if renderables:
+            self.console.print(Group(*renderables))
+
+    def show_execution_summary(self, results: List[Dict[str, Any]], verbose: bool = False):
+        """Display the summary table (and per-command details if verbose)"""
+        self._show_summary_rows([_ResultRow.from_result(result) for result in results], verbose)
+
+    def _show_summary_rows(self, rows: List[_ResultRow], verbose: bool = False):
+        """Display the summary table for normalized results"""
+        if not rows:
+            # Nothing ran; an all-zero table is just noise
+            return
 
-        # Summary
-        self.console.print("\n")
-        summary_table = Table(title="📊 Execution Summary", show_header=False)
-        summary_table.add_column("Metric", style="cyan")
-        summary_table.add_column("Value", style="green")
+        successful = sum(1 for row in rows if row.success or row.return_code == 0)
+        total = len(rows)
 
-        summary_table.add_row("Commands executed", str(total))
-        summary_table.add_row("Success rate", success_rate_str)
+        # Calculate success rate
+        success_rate_str = f"{successful / total:.1%}"
 
-        self.console.print(summary_table)
+        # Summary
+        self.console.print("\n")
+        self.console.print(_build_summary_table(total, success_rate_str))
 
         # Detailed results if verbose
-        if verbose and results:
+        if verbose:
             self.console.print("\n[bold]Detailed Results:[/bold]")
-            for result in results:
-                status_icon = "✅" if result.get("success", False) else "❌"
-                status_color = "green" if result.get("success", False) else "red"
-                execution_time = result.get("execution_time", 0.0)
+            for row in rows:
+                status_icon = "✅" if row.success else "❌"
+                status_color = "green" if row.success else "red"
 
-                panel_content = f"[bold]{status_icon} {result.get('command', 'Unknown')}[/bold]\n"
-                panel_content += f"Execution time: {execution_time:.2f}s\n"
-                panel_content += f"[dim]Return code: {result.get('return_code', -1)}[/dim]"
+                panel_content = f"[bold]{status_icon} {row.command}[/bold]\n"
+                panel_content += f"Execution time: {row.execution_time:.2f}s\n"
+                panel_content += f"[dim]Return code: {row.return_code}[/dim]"
 
                 panel = Panel(
                     panel_content,
-                    title=f"Command {result.get('command_index', 0) + 1}",
+                    title=f"Command {row.command_index + 1}",
                     border_style=status_color
                 )
 
@@ -260,3 +397,7 @@ class DisplayManager:
         """Display success message"""
         success_text = Text(f"✅ {message}", style="bold green")
         self.console.print(success_text)
+
+
+# Shared instance; DisplayManager is stateless apart from the console
+DISPLAY = DisplayManager()
@@ -1,29 +1,267 @@
 """Command executor for running bash commands safely"""
 
+import asyncio
+import atexit
+import codecs
 import os
+import re
+import selectors
+import shlex
+import signal
 import subprocess
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from shutil import which
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
+from .display import console
 from .file_helper import correct_filename_in_command
 
 
+# Programs that only read, so several of them can run at once in any order
+_READ_ONLY_PROGRAMS = frozenset({
+    "ls", "cat", "head", "tail", "wc", "grep", "egrep", "fgrep", "find", "du", "df",
+    "stat", "file", "pwd", "echo", "ps", "free", "uptime", "uname", "whoami", "id",
+    "which", "tree", "sort", "cut", "printenv", "hostname", "lsblk", "nproc",
+    "md5sum", "sha256sum"
+})
+# Shell syntax that sequences commands, changes directory or writes files
+_SEQUENCING_RE = re.compile(r"&&|\|\||;|>|<\(|\$\(|`|\bcd\b")
+# Arguments that make an otherwise read-only program write or run other commands
+_WRITING_ARGS = frozenset({"-delete", "-exec", "-execdir", "-ok", "-okdir", "-o"})
+# find actions that write to a file (-fprint, -fprint0, -fprintf, -fls)
+_FIND_WRITING_PREFIXES = ("-fprint", "-fls")
+
+
+def _writes_files(words: List[str]) -> bool:
+    """Whether a read-only program's arguments make it write or run other commands"""
+    args = words[1:]
+    if _WRITING_ARGS.intersection(args):
+        return True
+    if words[0] == "find":
+        return any(arg.startswith(_FIND_WRITING_PREFIXES) for arg in args)
+    if words[0] == "sort":
+        # -o FILE, -oFILE, clustered short options such as -uo, --output[=FILE]
+        return any(
+            arg.startswith("--output") or (arg.startswith("-") and not arg.startswith("--") and "o" in arg)
+            for arg in args
+        )
+    return False
+
+
+# Anything that needs a shell to interpret: quoting, expansion, redirection,
+# sequencing, comments or "VAR=value" prefixes
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>$`*?()\[\]{}~!\"'\\#=\n]")
+# Builtins and keywords; some have a same-named binary that behaves differently
+_SHELL_BUILTINS = frozenset({
+    "cd", "pwd", "echo", "printf", "test", "[", "export", "unset", "set", "alias",
+    "unalias", "source", ".", "exit", "exec", "eval", "command", "type", "hash",
+    "read", "wait", "jobs", "fg", "bg", "kill", "trap", "umask", "ulimit", "shift",
+    "local", "declare", "history", "pushd", "popd", "dirs", "times", "true", "false",
+    "if", "for", "while", "until", "case", "function", "time"
+})
+
+
+def _decode(data: bytes) -> str:
+    """Decode captured command output, replacing invalid UTF-8"""
+    return data.decode("utf-8", errors="replace")
+
+
+@lru_cache(maxsize=512)
+def _on_path(name: str, path: str) -> bool:
+    """Whether a program is found on the given PATH (cached per PATH value)"""
+    return which(name, path=path) is not None
+
+
+def _direct_argv(command: str) -> Optional[List[str]]:
+    """
+    Split a command into argv if it can be run without a shell
+
+    Only a plain program invocation qualifies: no shell syntax at all, not a
+    builtin, and a program found on PATH. Everything else returns None and
+    runs through the shell as before.
+    """
+    argv = _split_direct(command, os.environ.get("PATH", os.defpath))
+    return list(argv) if argv is not None else None
+
+
+@lru_cache(maxsize=512)
+def _split_direct(command: str, path: str) -> Optional[Tuple[str, ...]]:
+    """_direct_argv() for a given PATH, cached so re-running a command (e.g. a retry) skips the parsing"""
+    if _SHELL_SYNTAX_RE.search(command):
+        return None
+    argv = shlex.split(command)
+    if not argv or argv[0] in _SHELL_BUILTINS:
+        return None
+    if not _on_path(argv[0], path):
+        return None
+    return tuple(argv)
+
+
+# Written after each command on the persistent shell: "\x1e<exit code>\x1f<cwd>\x1e"
+# on stdout and a lone "\x1e" on stderr mark the end of the command's output
+_SENTINEL_RE = re.compile(rb"\x1e(\d+)\x1f([^\x1e]*)\x1e$")
+
+# Output kept per stream for the result dict when output is streamed live
+STREAM_TAIL_BYTES = 64 * 1024
+
+# Worker threads for blocking command execution from async code, shared by
+# every executor so an interactive session doesn't start new threads (and a new
+# default executor per asyncio.run()) for each batch of commands
+_POOL = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 2) * 2), thread_name_prefix="termai-exec")
+atexit.register(_POOL.shutdown, wait=False, cancel_futures=True)
+
+
+class _PersistentShell:
+    """
+    A long-lived bash process that runs commands one after another
+
+    Saves the fork/exec and shell startup of a new process per command and
+    keeps shell state (cd, exported variables) between commands.
+    """
+
+    def __init__(self, working_directory: str):
+        """Start bash in the given directory"""
+        self.process = subprocess.Popen(
+            ["bash", "--noprofile", "--norc"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=working_directory,
+            bufsize=0,
+            start_new_session=True
+        )
+        self.lock = threading.Lock()
+
+    def alive(self) -> bool:
+        """Whether the bash process is still running"""
+        return self.process.poll() is None
+
+    def run(self, command: str, timeout: float) -> Dict[str, Any]:
+        """
+        Run a command and collect its output
+
+        Returns:
+            Dict with return_code, stdout, stderr, timed_out and cwd (the
+            shell's working directory afterwards, None if the shell exited)
+        """
+        # eval keeps a syntax error inside the command from leaving bash
+        # waiting for more input; stdin is /dev/null so the command can't
+        # swallow the lines that follow it
+        script = (
+            f"eval {shlex.quote(command)} </dev/null\n"
+            "printf '\\036%d\\037%s\\036' $? \"$PWD\"; printf '\\036' >&2\n"
+        )
+        with self.lock:
+            try:
+                self.process.stdin.write(script.encode("utf-8"))
+                self.process.stdin.flush()
+                return self._collect(timeout)
+            except BaseException:
+                # Interrupted mid-command (e.g. Ctrl+C): the shell's output is
+                # out of step with us now, so it has to go
+                self.close()
+                raise
+
+    def _collect(self, timeout: float) -> Dict[str, Any]:
+        """Read stdout/stderr until both sentinels arrive, the shell exits or time runs out"""
+        buffers = {self.process.stdout: b"", self.process.stderr: b""}
+        done = {self.process.stdout: False, self.process.stderr: False}
+        deadline = time.monotonic() + timeout
+
+        with selectors.DefaultSelector() as selector:
+            for stream in buffers:
+                selector.register(stream, selectors.EVENT_READ)
+
+            while not all(done.values()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.close()
+                    return {"return_code": -1, "stdout": "", "stderr": "", "timed_out": True, "cwd": None}
+
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        # The command exited the shell (e.g. "exit 3")
+                        selector.unregister(key.fileobj)
+                        done[key.fileobj] = True
+                        continue
+                    buffers[key.fileobj] += chunk
+                    if key.fileobj is self.process.stdout:
+                        done[key.fileobj] = bool(_SENTINEL_RE.search(buffers[key.fileobj]))
+                    else:
+                        done[key.fileobj] = buffers[key.fileobj].endswith(b"\x1e")
+
+        stdout = buffers[self.process.stdout]
+        stderr = buffers[self.process.stderr]
+        match = _SENTINEL_RE.search(stdout)
+        if match:
+            return_code = int(match.group(1))
+            cwd = _decode(match.group(2))
+            stdout = stdout[:match.start()]
+            stderr = stderr[:-1]
+        else:
+            return_code = self.process.wait()
+            cwd = None
+
+        return {
+            "return_code": return_code,
+            "stdout": _decode(stdout),
+            "stderr": _decode(stderr),
+            "timed_out": False,
+            "cwd": cwd
+        }
+
+    def close(self):
+        """Terminate the bash process"""
+        if self.alive():
+            # Kill the whole process group so a hung command goes too
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout, self.process.stderr):
+            stream.close()
+
+
 class CommandExecutor:
     """Execute bash commands safely with proper output handling"""
 
-    def __init__(self, working_directory: Optional[str] = None):
-        """Initialize the command executor"""
+    # Upper bound on commands run concurrently by aiter_execute(parallel=True)
+    MAX_PARALLEL = 5
+
+    def __init__(
+        self,
+        working_directory: Optional[str] = None,
+        persistent_shell: bool = False,
+        stream_output: bool = False
+    ):
+        """
+        Initialize the command executor
+
+        Args:
+            working_directory: Directory commands run in (default: current directory)
+            persistent_shell: Run commands in one long-lived bash process, so
+                shell state such as `cd` carries over between commands
+            stream_output: Print command output to the console as it arrives
+                (results then only keep the last STREAM_TAIL_BYTES per stream)
+        """
         self.working_directory = working_directory or os.getcwd()
         self.last_execution_time = 0.0
-        self.console = Console()
+        self.console = console
+        self.persistent_shell = persistent_shell
+        self.stream_output = stream_output
+        self._shell: Optional[_PersistentShell] = None
 
     def execute_commands(self, commands: List[str], explanations: List[str]) -> Dict[str, Any]:
         """
-        Execute a list of commands sequentially
+        Execute a list of commands
+
+        Commands that only read (ls, cat, grep, ...) are independent of each
+        other and run concurrently; anything else runs sequentially.
 
         Args:
             commands: List of bash commands to execute
@@ -32,34 +270,14 @@ class CommandExecutor:
         Returns:
             Dict with execution results
         """
-        results = []
-
-        for i, (cmd, explanation) in enumerate(zip(commands, explanations)):
-            # Auto-correct filenames (case-insensitive matching)
-            corrected_cmd, was_corrected = correct_filename_in_command(cmd, self.working_directory)
-            if was_corrected:
-                self.console.print(f"\n[dim yellow]🔧 Auto-corrected filename:[/dim yellow] [dim]{cmd}[/dim] → [green]{corrected_cmd}[/green]")
-                cmd = corrected_cmd
-            
-            self.console.print(f"\n[bold]🔄 Executing:[/bold] [cyan]{cmd}[/cyan]")
-            self.console.print(f"[dim]📝 {explanation}[/dim]")
-
-            start_time = time.time()
-            result = self._execute_single_command(cmd)
-            end_time = time.time()
-
-            result["execution_time"] = end_time - start_time
-            result["command_index"] = i
-            result["command"] = cmd
-            result["explanation"] = explanation
-
-            results.append(result)
-
-            # Stop execution if a command fails critically
-            if result["return_code"] != 0 and self._is_critical_failure(cmd, result):
-                self.console.print(f"[red]❌ Critical failure in command {i+1}, stopping execution[/red]")
-                break
+        if (len(commands) > 1 and not self.persistent_shell
+                and self.are_independent(commands) and not self._in_event_loop()):
+            results = asyncio.run(self._execute_concurrently(commands, explanations))
+            return self.summarize(commands, results)
+        return self.summarize(commands, list(self.iter_execute(commands, explanations)))
 
+    def summarize(self, commands: List[str], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the execute_commands() result dict from per-command results"""
         return {
             "total_commands": len(commands),
             "executed_commands": len(results),
@@ -67,25 +285,172 @@ class CommandExecutor:
             "all_successful": all(r["return_code"] == 0 for r in results)
         }
 
+    def iter_execute(self, commands: List[str], explanations: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Execute commands sequentially, yielding each result as soon as it is available
+
+        Args:
+            commands: List of bash commands to execute
+            explanations: Explanations for each command
+
+        Yields:
+            Result dict for each executed command
+        """
+        for i, (cmd, explanation) in enumerate(zip(commands, explanations)):
+            result = self._execute_indexed(i, cmd, explanation)
+            yield result
+
+            # Stop execution if a command fails critically
+            if result["return_code"] != 0 and self._is_critical_failure(result["command"], result):
+                self.console.print(f"[red]❌ Critical failure in command {i+1}, stopping execution[/red]")
+                break
+
+    async def aiter_execute(
+        self,
+        commands: List[str],
+        explanations: List[str],
+        parallel: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async counterpart of iter_execute(); commands run in worker threads
+
+        Args:
+            commands: List of bash commands to execute
+            explanations: Explanations for each command
+            parallel: If True, the commands are independent and up to
+                MAX_PARALLEL of them run at once (ignored with a persistent
+                shell, which runs one command at a time)
+
+        Yields:
+            Result dict for each executed command, in command order
+        """
+        if not parallel or self.persistent_shell:
+            loop = asyncio.get_running_loop()
+            for i, (cmd, explanation) in enumerate(zip(commands, explanations)):
+                result = await loop.run_in_executor(_POOL, self._execute_indexed, i, cmd, explanation)
+                yield result
+
+                if result["return_code"] != 0 and self._is_critical_failure(result["command"], result):
+                    self.console.print(f"[red]❌ Critical failure in command {i+1}, stopping execution[/red]")
+                    break
+            return
+
+        semaphore = asyncio.Semaphore(self.MAX_PARALLEL)
+
+        async def run(i: int, cmd: str, explanation: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._aexecute_indexed(i, cmd, explanation)
+
+        tasks = [
+            asyncio.create_task(run(i, cmd, explanation))
+            for i, (cmd, explanation) in enumerate(zip(commands, explanations))
+        ]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _execute_concurrently(self, commands: List[str], explanations: List[str]) -> List[Dict[str, Any]]:
+        """Execute independent commands at once, returning results in command order"""
+        return [result async for result in self.aiter_execute(commands, explanations, parallel=True)]
+
+    def are_independent(self, commands: List[str]) -> bool:
+        """
+        Whether commands can run concurrently, in any order
+
+        Only plain (optionally piped) invocations of read-only programs
+        qualify; any sequencing, redirection or directory change does not.
+        """
+        for command in commands:
+            if _SEQUENCING_RE.search(command):
+                return False
+            for stage in command.split("|"):
+                try:
+                    words = shlex.split(stage)
+                except ValueError:
+                    return False
+                if not words or words[0] not in _READ_ONLY_PROGRAMS:
+                    return False
+                if _writes_files(words):
+                    return False
+        return True
+
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Whether this thread is already running an event loop (asyncio.run would fail)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def _execute_indexed(self, i: int, cmd: str, explanation: str) -> Dict[str, Any]:
+        """Execute the i-th command of a batch and annotate its result"""
+        cmd = self._prepare_command(cmd, explanation)
+
+        start_time = time.time()
+        result = self._execute_single_command(cmd)
+        end_time = time.time()
+
+        return self._annotate_result(result, i, cmd, explanation, end_time - start_time)
+
+    async def _aexecute_indexed(self, i: int, cmd: str, explanation: str) -> Dict[str, Any]:
+        """Async counterpart of _execute_indexed(), using an asyncio subprocess"""
+        cmd = self._prepare_command(cmd, explanation)
+
+        start_time = time.time()
+        result = await self._execute_single_async(cmd)
+        end_time = time.time()
+
+        return self._annotate_result(result, i, cmd, explanation, end_time - start_time)
+
+    def _prepare_command(self, cmd: str, explanation: str) -> str:
+        """Auto-correct filenames in a command and announce it"""
+        # Auto-correct filenames (case-insensitive matching)
+        corrected_cmd, was_corrected = correct_filename_in_command(cmd, self.working_directory)
+        if was_corrected:
+            self.console.print(f"\n[dim yellow]🔧 Auto-corrected filename:[/dim yellow] [dim]{cmd}[/dim] → [green]{corrected_cmd}[/green]")
+            cmd = corrected_cmd
+        
+        # One print call, so the two lines stay together when commands run in parallel
+        self.console.print(f"\n[bold]🔄 Executing:[/bold] [cyan]{cmd}[/cyan]\n[dim]📝 {explanation}[/dim]")
+        return cmd
+
+    @staticmethod
+    def _annotate_result(result: Dict[str, Any], i: int, cmd: str, explanation: str, elapsed: float) -> Dict[str, Any]:
+        """Add batch position, command and timing to a command result"""
+        result["execution_time"] = elapsed
+        result["command_index"] = i
+        result["command"] = cmd
+        result["explanation"] = explanation
+        return result
+
     def _execute_single_command(self, command: str) -> Dict[str, Any]:
         """Execute a single bash command"""
+        if self.persistent_shell:
+            return self._execute_in_shell(command)
+        if self.stream_output:
+            return self._execute_streaming(command)
+
+        # Plain program invocations skip the intermediate /bin/sh
+        argv = _direct_argv(command)
+
         try:
             # Execute command in bash shell
             process = subprocess.run(
-                command,
-                shell=True,
+                argv or command,
+                shell=argv is None,
                 cwd=self.working_directory,
                 capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',  # Replace invalid characters
                 timeout=30  # 30 second timeout
             )
 
             return {
                 "return_code": process.returncode,
-                "stdout": process.stdout,
-                "stderr": process.stderr,
+                "stdout": _decode(process.stdout),
+                "stderr": _decode(process.stderr),
                 "success": process.returncode == 0,
                 "timed_out": False
             }
@@ -108,6 +473,156 @@ class CommandExecutor:
                 "timed_out": False
             }
 
+    def _execute_streaming(self, command: str, timeout: float = 30) -> Dict[str, Any]:
+        """Execute a command, printing its output as it arrives"""
+        try:
+            argv = _direct_argv(command)
+            process = subprocess.Popen(
+                argv or command,
+                shell=argv is None,
+                cwd=self.working_directory,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except Exception as e:
+            return {
+                "return_code": -1,
+                "stdout": "",
+                "stderr": f"Execution error: {str(e)}",
+                "success": False,
+                "timed_out": False
+            }
+
+        tails = {process.stdout: bytearray(), process.stderr: bytearray()}
+        decoders = {stream: codecs.getincrementaldecoder("utf-8")(errors="replace") for stream in tails}
+        timed_out = False
+        deadline = time.monotonic() + timeout
+
+        try:
+            with selectors.DefaultSelector() as selector:
+                for stream in tails:
+                    selector.register(stream, selectors.EVENT_READ)
+
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+
+                    for key, _ in selector.select(remaining):
+                        chunk = os.read(key.fd, 65536)
+                        if not chunk:
+                            selector.unregister(key.fileobj)
+                            continue
+
+                        text = decoders[key.fileobj].decode(chunk)
+                        style = "red" if key.fileobj is process.stderr else None
+                        self.console.out(text, end="", style=style, highlight=False)
+
+                        # Keep only the tail of the output for the result
+                        tail = tails[key.fileobj]
+                        tail += chunk
+                        if len(tail) > STREAM_TAIL_BYTES:
+                            del tail[:len(tail) - STREAM_TAIL_BYTES]
+        finally:
+            if process.poll() is None:
+                process.terminate()
+                try:
+                    process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+            return_code = process.wait()
+            process.stdout.close()
+            process.stderr.close()
+
+        stdout = _decode(tails[process.stdout])
+        stderr = _decode(tails[process.stderr])
+        if timed_out:
+            return {
+                "return_code": -1,
+                "stdout": stdout,
+                "stderr": (stderr + "\n" if stderr and not stderr.endswith("\n") else stderr)
+                          + f"Command timed out after {timeout:g} seconds",
+                "success": False,
+                "timed_out": True,
+                "streamed": True
+            }
+
+        return {
+            "return_code": return_code,
+            "stdout": stdout,
+            "stderr": stderr,
+            "success": return_code == 0,
+            "timed_out": False,
+            "streamed": True
+        }
+
+    def _execute_in_shell(self, command: str) -> Dict[str, Any]:
+        """Execute a command on the persistent shell, (re)starting it as needed"""
+        try:
+            if self._shell is None or not self._shell.alive():
+                self._shell = _PersistentShell(self.working_directory)
+            result = self._shell.run(command, timeout=30)
+        except OSError as e:
+            return {
+                "return_code": -1,
+                "stdout": "",
+                "stderr": f"Execution error: {str(e)}",
+                "success": False,
+                "timed_out": False
+            }
+
+        if result["timed_out"]:
+            result["stderr"] = "Command timed out after 30 seconds"
+        # Follow `cd` in the shell so file auto-correction looks in the right place
+        cwd = result.pop("cwd")
+        if cwd and os.path.isdir(cwd):
+            self.working_directory = cwd
+        result["success"] = result["return_code"] == 0 and not result["timed_out"]
+        return result
+
+    async def _execute_single_async(self, command: str) -> Dict[str, Any]:
+        """Async counterpart of _execute_single_command()"""
+        try:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                cwd=self.working_directory,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            return {
+                "return_code": -1,
+                "stdout": "",
+                "stderr": f"Execution error: {str(e)}",
+                "success": False,
+                "timed_out": False
+            }
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return {
+                "return_code": -1,
+                "stdout": "",
+                "stderr": "Command timed out after 30 seconds",
+                "success": False,
+                "timed_out": True
+            }
+        except asyncio.CancelledError:
+            process.kill()
+            raise
+
+        return {
+            "return_code": process.returncode,
+            "stdout": _decode(stdout),
+            "stderr": _decode(stderr),
+            "success": process.returncode == 0,
+            "timed_out": False
+        }
+
     def _is_critical_failure(self, command: str, result: Dict[str, Any]) -> bool:
         """Determine if a command failure should stop execution"""
         # For now, we'll continue execution even if commands fail
@@ -118,6 +633,8 @@ class CommandExecutor:
         """Set the working directory for command execution"""
         if Path(directory).exists() and Path(directory).is_dir():
             self.working_directory = directory
+            # The persistent shell is restarted in the new directory on next use
+            self.close()
         else:
             raise ValueError(f"Directory does not exist: {directory}")
 
@@ -128,19 +645,14 @@ class CommandExecutor:
     def test_command(self, command: str) -> bool:
         """Test if a command would execute successfully (dry run)"""
         # This is a basic implementation - could be enhanced
-        try:
-            # Just check if the command exists (first word)
-            cmd_parts = command.strip().split()
-            if not cmd_parts:
-                return False
-
-            base_cmd = cmd_parts[0]
-            result = subprocess.run(
-                f"which {base_cmd}",
-                shell=True,
-                capture_output=True,
-                text=True
-            )
-            return result.returncode == 0
-        except Exception:
+        # Just check if the command exists (first word)
+        cmd_parts = command.strip().split(maxsplit=1)
+        if not cmd_parts:
             return False
+        return _on_path(cmd_parts[0], os.environ.get("PATH", os.defpath))
+
+    def close(self):
+        """Stop the persistent shell, if one is running"""
+        if self._shell is not None:
+            self._shell.close()
+            self._shell = None
@@ -0,0 +1,91 @@
+"""Local classifier for queries that obviously do or don't need execution
+
+ConversationalAgent asks the LLM whether a query needs command execution
+before doing anything else. Many queries don't need that round trip: a bare
+shell command ("ls -la", "git status") clearly needs execution and a greeting
+or a general "what is ..." question clearly doesn't. classify() recognises
+those cases with a few regexes and returns "unknown" for everything else, so
+the LLM still decides anything ambiguous.
+"""
+
+import re
+from typing import Tuple
+
+CONVERSATIONAL = "conv"
+EXECUTION = "exec"
+UNKNOWN = "unknown"
+
+DEFAULT_THRESHOLD = 0.9
+
+# Commands that are also typed verbatim as queries
+_SHELL_COMMANDS = (
+    "ls", "ll", "pwd", "cat", "head", "tail", "wc", "grep", "find", "tree",
+    "du", "df", "free", "ps", "top", "uptime", "uname", "whoami", "date", "which",
+    "git", "mkdir", "touch", "cp", "mv", "rm", "chmod", "echo", "stat"
+)
+_SHELL_COMMAND_RE = re.compile(rf"^(?:{'|'.join(_SHELL_COMMANDS)})(?:\s+[-\w./~*'\"=:]+)*$")
+_SHELL_SYNTAX_RE = re.compile(r"\s(?:\||&&|>>?)\s|;\s*\w")
+
+# Leading imperative verbs of task requests ("list all python files")
+_IMPERATIVE_RE = re.compile(
+    r"^(?:please\s+)?(?:list|show|display|find|search|count|create|make|delete|remove|"
+    r"move|copy|rename|run|check|print|open|compress|extract|install)\b"
+)
+
+_GREETING_RE = re.compile(r"^(?:hi|hello|hey|thanks|thank you|good (?:morning|afternoon|evening))\b[\s!.?]*$")
+_QUESTION_RE = re.compile(
+    r"^(?:what (?:is|are|does)|why|explain|describe|define|"
+    r"how (?:do i|do you|to|can i|does)|what's the difference|difference between)\b"
+)
+# References to the user's own machine turn a question into a command request
+# ("what is in my home directory?", "how much space is left here?")
+_LOCAL_REFERENCE_RE = re.compile(
+    r"\b(?:my|this|these|here|current|currently|installed|running|i have|"
+    r"this directory|this folder)\b|[\w-]+\.\w{1,5}\b|/"
+)
+
+
+def score(query: str) -> Tuple[str, float]:
+    """
+    Classify a query and estimate how confident the classification is
+
+    Args:
+        query: The user's question or request
+
+    Returns:
+        (label, confidence) where label is "conv", "exec" or "unknown"
+    """
+    text = " ".join(query.strip().lower().split())
+    if not text:
+        return UNKNOWN, 0.0
+
+    if _GREETING_RE.match(text):
+        return CONVERSATIONAL, 0.99
+
+    if _SHELL_SYNTAX_RE.search(text) and "?" not in text:
+        return EXECUTION, 0.95
+    if _SHELL_COMMAND_RE.match(text):
+        return EXECUTION, 0.95
+
+    is_question = bool(_QUESTION_RE.match(text))
+    if is_question and not _LOCAL_REFERENCE_RE.search(text):
+        return CONVERSATIONAL, 0.9
+    if _IMPERATIVE_RE.match(text) and not is_question and "?" not in text:
+        return EXECUTION, 0.9
+
+    return UNKNOWN, 0.0
+
+
+def classify(query: str, threshold: float = DEFAULT_THRESHOLD) -> str:
+    """
+    Classify a query as "conv" or "exec", or "unknown" below the threshold
+
+    Args:
+        query: The user's question or request
+        threshold: Minimum confidence for a definite label
+
+    Returns:
+        "conv", "exec" or "unknown"
+    """
+    label, confidence = score(query)
+    return label if confidence >= threshold else UNKNOWN
@@ -2,22 +2,114 @@
 
 import os
 import re
+import shlex
+import stat
 from pathlib import Path
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from difflib import get_close_matches
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+# Filename in "file not found" errors, e.g. "cat: filename: No such file or directory"
+_ERROR_FILENAME_PATTERNS = [
+    re.compile(r':\s*([^:]+):\s*No such file or directory', re.IGNORECASE),
+    re.compile(r':\s*([^:]+):\s*cannot open', re.IGNORECASE),
+    re.compile(r'No such file or directory:\s*([^\s]+)', re.IGNORECASE),
+]
+# Quotes and escapes only shlex.split handles
+_QUOTING_RE = re.compile(r"[\"'\\]")
+# Whitespace-separated tokens of an unquoted command
+_TOKEN_RE = re.compile(r"\S+")
+# Characters that mean a token is shell syntax or a pattern, not a filename
+_SHELL_SPECIALS_RE = re.compile(r"[|&;<>()$*?\[]")
+# Fallback for commands shlex can't split: a file-taking command and its first argument
+_COMMAND_FILE_RE = re.compile(
+    r'\b(cat|less|more|head|tail|grep|sed|awk|find|ls|cd|mv|cp|rm|chmod|chown|touch|nano|vim|vi|code)\s+([^\s|&;<>()$]+)',
+    re.IGNORECASE
+)
+
+
+def list_entries(directory: str = ".") -> Tuple[str, ...]:
+    """
+    List a directory's files and subdirectories (with a trailing "/")
+
+    The listing is cached until the directory's mtime changes, so correcting
+    several commands in the same directory scans it only once.
+    """
+    abs_dir = os.path.abspath(directory)
+    return _list_dir_entries(abs_dir, os.stat(abs_dir).st_mtime_ns)
+
+
+def _casefold_index(directory: str = ".") -> Dict[str, str]:
+    """Map each case-folded entry of list_entries() to its original name"""
+    abs_dir = os.path.abspath(directory)
+    return _build_casefold_index(abs_dir, os.stat(abs_dir).st_mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _list_dir_entries(abs_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Scan a directory (cached per path and mtime; see list_entries())"""
+    entries = []
+    # DirEntry.is_file()/is_dir() answer from the directory read itself; only
+    # symlinks need a stat() to see what they point to
+    with os.scandir(abs_dir) as it:
+        for entry in it:
+            if entry.is_file():
+                entries.append(entry.name)
+            elif entry.is_dir():
+                entries.append(entry.name + "/")
+    return tuple(entries)
+
+
+@lru_cache(maxsize=128)
+def _build_casefold_index(abs_dir: str, mtime_ns: int) -> Dict[str, str]:
+    """Build the case-folded index for a listing (cached like the listing)"""
+    index = {}
+    for entry in _list_dir_entries(abs_dir, mtime_ns):
+        # Names differing only in case: the first one listed wins
+        index.setdefault(entry.casefold(), entry)
+    return index
+
+
+def _close_matches(query: str, index: Dict[str, str], limit: int, cutoff: float) -> List[str]:
+    """
+    Return up to limit entries similar to query (case-insensitive), best first
+
+    Args:
+        query: Name to match
+        index: Case-folded name -> original name, as from _casefold_index()
+        limit: Maximum number of matches
+        cutoff: Minimum similarity (greater than 0, at most 1)
+
+    Uses RapidFuzz when installed. Its ratio (normalized Indel distance,
+    scaled to 0..100) is similar to but not the same as difflib's
+    Ratcliff/Obershelp ratio, so suggestions may differ with the extra
+    installed.
+    """
+    query = query.casefold()
+    if process is not None:
+        matches = process.extract(query, index.keys(), scorer=fuzz.ratio, limit=limit, score_cutoff=cutoff * 100)
+        similar = [match[0] for match in matches]
+    else:
+        # ratio() is at most 2*min(len)/(len_a + len_b), so names much shorter or
+        # longer than the query can't reach the cutoff; skip them before
+        # difflib builds a matcher for each one (RapidFuzz prunes these itself)
+        lo = len(query) * cutoff / (2 - cutoff)
+        hi = len(query) * (2 - cutoff) / cutoff
+        candidates = [name for name in index if lo <= len(name) <= hi]
+        similar = get_close_matches(query, candidates, n=limit, cutoff=cutoff)
+    # Map back to original filenames (preserve case)
+    return [index[sim] for sim in similar]
+
 
 def extract_filename_from_error(error_message: str) -> Optional[str]:
     """Extract filename from 'No such file or directory' error"""
-    # Pattern: "cat: filename: No such file or directory"
-    patterns = [
-        r':\s*([^:]+):\s*No such file or directory',
-        r':\s*([^:]+):\s*cannot open',
-        r'No such file or directory:\s*([^\s]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, error_message, re.IGNORECASE)
+    for pattern in _ERROR_FILENAME_PATTERNS:
+        match = pattern.search(error_message)
         if match:
             return match.group(1).strip()
     
@@ -32,36 +124,13 @@ def find_similar_files(filename: str, directory: str = ".", max_results: int = 5
             return []
         
         # Get all files in directory
-        all_files = []
-        for item in path.iterdir():
-            if item.is_file():
-                all_files.append(item.name)
-            elif item.is_dir():
-                all_files.append(item.name + "/")
+        index = _casefold_index(directory)
         
-        if not all_files:
+        if not index:
             return []
         
         # Use fuzzy matching to find similar files
-        # Normalize filename for comparison
-        normalized_filename = filename.lower()
-        similar = get_close_matches(
-            normalized_filename,
-            [f.lower() for f in all_files],
-            n=max_results,
-            cutoff=0.3  # Minimum similarity threshold
-        )
-        
-        # Map back to original filenames (preserve case)
-        result = []
-        for sim in similar:
-            # Find original filename with case preserved
-            for orig_file in all_files:
-                if orig_file.lower() == sim:
-                    result.append(orig_file)
-                    break
-        
-        return result
+        return _close_matches(filename, index, max_results, cutoff=0.3)  # Minimum similarity threshold
     
     except Exception:
         return []
@@ -80,52 +149,40 @@ def suggest_files_for_error(error_message: str, directory: str = ".") -> Optiona
 def find_case_insensitive_match(filename: str, directory: str = ".") -> Optional[str]:
     """Find a case-insensitive or fuzzy match for a filename in the directory"""
     try:
-        path = Path(directory).resolve()
-        if not path.exists() or not path.is_dir():
+        abs_dir = str(Path(directory).resolve())
+        st = os.stat(abs_dir)
+        if not stat.S_ISDIR(st.st_mode):
             return None
         
         # Normalize filename
-        filename_clean = filename.strip().lstrip('./')
-        filename_lower = filename_clean.lower()
-        
-        # First try exact case-insensitive match
-        for item in path.iterdir():
-            item_name_lower = item.name.lower()
-            if item_name_lower == filename_lower:
-                if item.is_file():
-                    return item.name
-                elif item.is_dir():
-                    return item.name + "/"
-        
-        # If no exact match, try fuzzy matching for similar filenames
-        all_files = []
-        for item in path.iterdir():
-            if item.is_file():
-                all_files.append(item.name)
-            elif item.is_dir():
-                all_files.append(item.name + "/")
-        
-        if all_files:
-            # Use fuzzy matching
-            similar = get_close_matches(
-                filename_lower,
-                [f.lower() for f in all_files],
-                n=1,
-                cutoff=0.6  # Higher threshold for auto-correction
-            )
-            
-            if similar:
-                # Find original filename with case preserved
-                for orig_file in all_files:
-                    if orig_file.lower() == similar[0]:
-                        return orig_file
+        filename_folded = filename.strip().lstrip('./').casefold()
         
-        return None
+        return _match_in_directory(filename_folded, abs_dir, st.st_mtime_ns)
     
     except Exception:
         return None
 
 
+@lru_cache(maxsize=1024)
+def _match_in_directory(filename_folded: str, abs_dir: str, mtime_ns: int) -> Optional[str]:
+    """Match a normalized filename against a directory listing (cached per listing)"""
+    index = _build_casefold_index(abs_dir, mtime_ns)
+    
+    # First try exact case-insensitive match (a file, then a directory)
+    exact = index.get(filename_folded) or index.get(filename_folded + "/")
+    if exact:
+        return exact
+    
+    # If no exact match, try fuzzy matching for similar filenames
+    if index:
+        # Use fuzzy matching (higher threshold for auto-correction)
+        similar = _close_matches(filename_folded, index, 1, cutoff=0.6)
+        if similar:
+            return similar[0]
+    
+    return None
+
+
 def correct_filename_in_command(command: str, directory: str = ".") -> tuple[str, bool]:
     """
     Correct filenames in a command using case-insensitive matching.
@@ -133,16 +190,21 @@ def correct_filename_in_command(command: str, directory: str = ".") -> tuple[str
     Returns:
         (corrected_command, was_corrected)
     """
-    import re
-    import shlex
-    
     corrected_command = command
     was_corrected = False
     
     try:
         # Try to parse command into parts
         # Handle commands like: cat file, ls -la file, grep pattern file
-        parts = shlex.split(command)
+        if _QUOTING_RE.search(command):
+            parts = shlex.split(command)
+            spans = None
+        else:
+            # Nothing for the shell lexer to do beyond splitting on whitespace,
+            # and each token's position in the command comes for free
+            tokens = list(_TOKEN_RE.finditer(command))
+            parts = [token.group() for token in tokens]
+            spans = [token.span() for token in tokens]
         
         if len(parts) < 2:
             return command, False
@@ -154,7 +216,7 @@ def correct_filename_in_command(command: str, directory: str = ".") -> tuple[str
                 continue
             
             # Skip if it's clearly not a file path (has special chars)
-            if any(char in part for char in ['|', '&', ';', '>', '<', '(', ')', '$', '*', '?', '[']):
+            if _SHELL_SPECIALS_RE.search(part):
                 continue
             
             # Check if it looks like a file path (has extension or is a relative path)
@@ -171,16 +233,23 @@ def correct_filename_in_command(command: str, directory: str = ".") -> tuple[str
             # Try to find case-insensitive match
             corrected_file = find_case_insensitive_match(part, directory)
             if corrected_file and corrected_file != part:
-                # Replace in original command (preserve quotes if any)
-                corrected_command = corrected_command.replace(part, corrected_file, 1)
+                if spans is not None:
+                    # Splice the token out by position
+                    start, end = spans[i]
+                    corrected_command = command[:start] + corrected_file + command[end:]
+                elif part in command:
+                    # Replace in original command (preserve quotes if any)
+                    corrected_command = command.replace(part, corrected_file, 1)
+                else:
+                    # Escaped in the command (e.g. "my\ file"); leave it alone
+                    continue
                 was_corrected = True
                 break  # Only correct first match to avoid over-correction
     
     except (ValueError, Exception):
         # If parsing fails, try regex fallback
         # Pattern: command followed by filename
-        pattern = r'\b(cat|less|more|head|tail|grep|sed|awk|find|ls|cd|mv|cp|rm|chmod|chown|touch|nano|vim|vi|code)\s+([^\s|&;<>()$]+)'
-        match = re.search(pattern, command, re.IGNORECASE)
+        match = _COMMAND_FILE_RE.search(command)
         if match:
             potential_file = match.group(2).strip()
             # Remove quotes if present
@@ -6,14 +6,47 @@ from .safety import SafetyChecker
 from .executor import CommandExecutor
 from .display import DisplayManager
 from .teaching import TeachingMode
+from .json_utils import JSONDecodeError, loads, strip_fences
+from .plan_cache import PlanCache
+
+
+# Static system prompt (the request goes in the user message) so consecutive
+# requests share a cacheable prompt prefix
+_STATIC_SYSTEM_GIT = """You are a Git expert assistant. Convert natural language Git requests into safe, correct Git commands.
+
+Common Git operations:
+- Commit: git commit -m "message"
+- Add files: git add <files>
+- Status: git status
+- Log: git log, git log --oneline
+- Branch: git branch, git checkout, git switch
+- Merge: git merge <branch>
+- Push/Pull: git push, git pull
+- Undo: git reset, git revert, git restore
+- Stash: git stash, git stash pop
+- Remote: git remote, git remote add
+
+Return as JSON:
+{
+  "commands": ["git command1", "git command2"],
+  "explanations": ["explanation1", "explanation2"],
+  "warning": "optional warning if operation is destructive"
+}
+
+Guidelines:
+- Use safe Git commands
+- Warn about destructive operations (force push, hard reset)
+- Provide clear explanations
+- Break complex operations into steps"""
 
 
 class GitAssistant:
     """Natural language Git command assistant"""
 
-    def __init__(self, llm_client: Optional[LLMClient] = None):
+    def __init__(self, llm_client: Optional[LLMClient] = None, plan_cache: Optional[PlanCache] = None):
         """Initialize Git assistant"""
         self.llm_client = llm_client or LLMClient()
+        self.plan_cache = plan_cache
         self.safety_checker = SafetyChecker()
         self.display = DisplayManager()
         self.teaching = TeachingMode()
@@ -31,21 +64,8 @@ class GitAssistant:
         Returns:
             Dictionary with commands and results
         """
-        git_prompt = self._get_git_prompt(request)
-        
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {"role": "system", "content": self._get_git_system_prompt()},
-                    {"role": "user", "content": git_prompt}
-                ],
-                temperature=0.2,
-                max_tokens=400
-            )
-            
-            content = response.choices[0].message.content
-            result = self._parse_git_response(content)
+            result = self._generate_commands(request)
             result["original_request"] = request
             
             # Show commands
@@ -102,34 +122,32 @@ class GitAssistant:
                 "original_request": request
             }
 
-    def _get_git_system_prompt(self) -> str:
-        """Get system prompt for Git assistant"""
-        return """You are a Git expert assistant. Convert natural language Git requests into safe, correct Git commands.
+    def _generate_commands(self, request: str) -> Dict[str, Any]:
+        """
+        Get the commands for a request from the LLM, or from the plan cache
 
-Common Git operations:
-- Commit: git commit -m "message"
-- Add files: git add <files>
-- Status: git status
-- Log: git log, git log --oneline
-- Branch: git branch, git checkout, git switch
-- Merge: git merge <branch>
-- Push/Pull: git push, git pull
-- Undo: git reset, git revert, git restore
-- Stash: git stash, git stash pop
-- Remote: git remote, git remote add
+        Only an identical earlier request is reused: a merely similar one
+        ("undo last commit" vs "undo last two commits") can need different
+        commands. Cached commands still go through the safety checks.
+        """
+        cached = self.plan_cache.lookup("git", request) if self.plan_cache else None
+        if cached and cached["query"].strip().lower() == request.strip().lower():
+            self.display.console.print("[dim]♻️  Using cached commands for this request[/dim]")
+            return dict(cached["payload"])
 
-Return as JSON:
-{
-  "commands": ["git command1", "git command2"],
-  "explanations": ["explanation1", "explanation2"],
-  "warning": "optional warning if operation is destructive"
-}
+        response = self.llm_client.chat(
+            messages=self.llm_client.build_messages(_STATIC_SYSTEM_GIT, self._get_git_prompt(request)),
+            temperature=0.2,
+            max_tokens=400
+        )
+        
+        content = response.choices[0].message.content
+        result = self._parse_git_response(content)
 
-Guidelines:
-- Use safe Git commands
-- Warn about destructive operations (force push, hard reset)
-- Provide clear explanations
-- Break complex operations into steps"""
+        if self.plan_cache and result.get("commands") and not result.get("error"):
+            self.plan_cache.store("git", request, result)
+        
+        return result
 
     def _get_git_prompt(self, request: str) -> str:
         """Get user prompt for Git request"""
@@ -139,23 +157,9 @@ Return only valid JSON with commands and explanations."""
 
     def _parse_git_response(self, content: str) -> Dict[str, Any]:
         """Parse LLM response into Git command structure"""
-        import json
-        import re
-        
         try:
-            content = content.strip()
-            
-            # Extract JSON
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            
-            result = json.loads(content)
+            # Extract JSON (models sometimes wrap it in a code fence)
+            result = loads(strip_fences(content))
             
             # Validate
             if not isinstance(result, dict):
@@ -176,7 +180,7 @@ Return only valid JSON with commands and explanations."""
                 "warning": result.get("warning", "")
             }
             
-        except json.JSONDecodeError:
+        except JSONDecodeError:
             return {
                 "error": "Invalid JSON response from AI",
                 "commands": [],
@@ -1,30 +1,153 @@
 """Goal-Oriented Agent for Terma AI"""
 
+import asyncio
 import json
+import re
 import time
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
+from rich.live import Live
 from .llm import LLMClient
 from .safety import SafetyChecker
 from .executor import CommandExecutor
 from .display import DisplayManager
+from .plan_cache import PlanCache
+from .json_utils import ArrayItemStream, JSONDecodeError, parse_llm_json
+
+
+# System prompts are kept static (per-step data goes in the user message)
+# so consecutive requests share a cacheable prompt prefix
+_STATIC_SYSTEM_GOAL_ANALYZE = (
+    "You are a goal analysis and decomposition expert. "
+    "Identify ambiguities in user goals and break clear goals into safe, ordered steps."
+)
+_STATIC_SYSTEM_GOAL_PLAN = "You are a goal decomposition expert. Break goals into safe, ordered steps."
+_STATIC_SYSTEM_GOAL_SUMMARY = "You are a goal execution analyst. Provide clear summaries and learning insights."
+
+
+# JSON shape of a plan, shared by the analysis and decomposition prompts
+_PLAN_FORMAT = """{
+  "summary": "Brief goal summary",
+  "steps": [
+    {
+      "step": 1,
+      "description": "What this step does",
+      "command": "bash command",
+      "dependencies": [],
+      "risky": false,
+      "requires_confirmation": false
+    }
+  ],
+  "estimated_time": "estimated completion time",
+  "warnings": ["warning1", "warning2"]
+}"""
+
+_PLAN_REQUIREMENTS = """- Each step must be a single bash command
+- Steps must be in correct dependency order
+- Include safety considerations
+- Identify which steps are risky"""
+
+# Prompt templates, assembled once; only the goal (or the execution
+# counts) is filled in per request
+_ANALYZE_PROMPT_PREFIX = """Analyze this user goal and identify if clarification is needed:
+
+Goal: \""""
+_ANALYZE_PROMPT_SUFFIX = """"
+
+Determine:
+1. Is the goal clear and actionable?
+2. What ambiguities exist?
+3. What questions should be asked?
+
+If no clarification is needed, also break the goal down into ordered,
+executable steps:
+""" + _PLAN_REQUIREMENTS + """
+
+Return as JSON (omit "plan" if clarification is needed):
+{
+  "needs_clarification": true/false,
+  "ambiguities": ["ambiguity1", "ambiguity2"],
+  "questions": ["question1", "question2"],
+  "interpreted_goal": "clarified version of goal",
+  "plan": """ + _PLAN_FORMAT + """
+}"""
+
+_DECOMPOSE_PROMPT_PREFIX = """Break down this goal into ordered, executable steps:
+
+Goal: \""""
+_DECOMPOSE_PROMPT_SUFFIX = """"
+
+Requirements:
+""" + _PLAN_REQUIREMENTS + """
+
+Return as JSON:
+""" + _PLAN_FORMAT
+
+_SUMMARY_PROMPT = """Summarize this goal execution:
+
+Goal: %(goal)s
+Total Steps: %(total)d
+Successful: %(successful)d
+Failed: %(failed)d
+Skipped: %(skipped)d
+Total Time: %(total_time).2fs
+
+Provide:
+1. Brief execution summary
+2. Key achievements
+3. Any issues encountered
+4. Suggestions for improvement or safer alternatives
+5. Learning insights"""
+
+
+# Clarification questions not worth asking: we know the OS (Linux) and that
+# commands run in a terminal
+_OBVIOUS_QUESTION_RE = re.compile(
+    r"\b(?:operating system|os|windows|macos|environment|terminal|command line)\b",
+    re.IGNORECASE
+)
+
+# Short requests that start with a read-only verb ("list files in /tmp",
+# "show disk usage") are clear enough to plan without asking questions,
+# unless they refer to something vague
+_CLEAR_GOAL_RE = re.compile(r"^(?:list|show|find|display|count|grep|cat)\s.{1,80}$", re.IGNORECASE)
+_WORD_RE = re.compile(r"[a-z]+")
+_VAGUE_WORDS = frozenset({"it", "them", "this", "that", "these", "those", "stuff", "things", "something"})
 
 
 class GoalAgent:
     """Goal-oriented agent that understands, plans, and executes user goals"""
 
-    def __init__(self, llm_client: Optional[LLMClient] = None):
+    # Streamed previews re-render at most this often, not on every token
+    PREVIEW_REFRESH_PER_SECOND = 12
+
+    def __init__(self, llm_client: Optional[LLMClient] = None, plan_cache: Optional[PlanCache] = None):
         """Initialize the goal agent"""
         self.console = Console()
+        self.plan_cache = plan_cache
         self.llm_client = llm_client or LLMClient()
         self.safety_checker = SafetyChecker()
         self.display = DisplayManager()
         self.executor = CommandExecutor()
 
     def process_goal(self, user_goal: str, auto_confirm: bool = False, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around aprocess_goal() for callers without an event loop
+        """
+        return asyncio.run(self._run_goal(user_goal, auto_confirm, dry_run))
+
+    async def _run_goal(self, user_goal: str, auto_confirm: bool, dry_run: bool) -> Dict[str, Any]:
+        """Run aprocess_goal() and release the async client before the loop closes"""
+        try:
+            return await self.aprocess_goal(user_goal, auto_confirm, dry_run)
+        finally:
+            await self.llm_client.aclose()
+
+    async def aprocess_goal(self, user_goal: str, auto_confirm: bool = False, dry_run: bool = False) -> Dict[str, Any]:
         """
         Process a user goal from start to finish
         
@@ -43,17 +166,29 @@ class GoalAgent:
             border_style="blue"
         ))
 
-        # Step 1: Understand and clarify goal
-        goal_understanding = self._understand_goal(user_goal)
+        # Step 1: Understand the goal and plan it in the same request. The
+        # plan is only thrown away if clarification rewrites the goal.
+        # Obviously clear goals skip the analysis and are just planned
+        if self._is_clear_goal(user_goal):
+            goal_understanding = {"needs_clarification": False, "interpreted_goal": user_goal}
+            plan = None
+        else:
+            goal_understanding = await self._aanalyze_goal(user_goal)
+            plan = goal_understanding.pop("plan", None)
         
         if goal_understanding.get("needs_clarification"):
             clarified_goal = self._clarification_loop(goal_understanding)
             if not clarified_goal:
                 return {"cancelled": True, "reason": "User cancelled clarification"}
+            if clarified_goal != user_goal:
+                plan = None
             user_goal = clarified_goal
 
-        # Step 2: Decompose goal into steps
-        plan = self._decompose_goal(user_goal)
+        # Step 2: Decompose goal into steps (unless the analysis already did)
+        if isinstance(plan, dict) and plan.get("steps"):
+            plan = self._finish_plan(user_goal, plan)
+        else:
+            plan = await self._adecompose_goal(user_goal)
         
         if plan.get("error"):
             self.display.show_error(plan["error"])
@@ -76,15 +211,17 @@ class GoalAgent:
                 "dry_run": True
             }
 
+        preapproved = set()
         if not auto_confirm:
             if not Confirm.ask("\n[bold]Proceed with goal execution?[/bold]", default=True):
                 return {"cancelled": True, "reason": "User cancelled"}
+            preapproved = self._preapprove_steps(steps)
 
-        # Step 4: Execute steps sequentially
-        execution_results = self._execute_goal_steps(steps, auto_confirm)
+        # Step 4: Execute steps (independent read-only steps at once)
+        execution_results = await self._aexecute_goal_steps(steps, auto_confirm, preapproved)
 
         # Step 5: Generate completion summary
-        summary = self._generate_completion_summary(user_goal, steps, execution_results)
+        summary = await self._agenerate_completion_summary(user_goal, steps, execution_results)
 
         return {
             "goal": user_goal,
@@ -95,39 +232,27 @@ class GoalAgent:
             "success": execution_results.get("all_successful", False)
         }
 
-    def _understand_goal(self, goal: str) -> Dict[str, Any]:
-        """Understand the goal and identify ambiguities"""
-        prompt = f"""Analyze this user goal and identify if clarification is needed:
+    @staticmethod
+    def _is_clear_goal(goal: str) -> bool:
+        """Whether a goal is a short, self-contained request that needs no clarification"""
+        goal = goal.strip()
+        if not _CLEAR_GOAL_RE.match(goal):
+            return False
+        return _VAGUE_WORDS.isdisjoint(_WORD_RE.findall(goal.lower()))
 
-Goal: "{goal}"
-
-Determine:
-1. Is the goal clear and actionable?
-2. What ambiguities exist?
-3. What questions should be asked?
-
-Return as JSON:
-{{
-  "needs_clarification": true/false,
-  "ambiguities": ["ambiguity1", "ambiguity2"],
-  "questions": ["question1", "question2"],
-  "interpreted_goal": "clarified version of goal"
-}}"""
+    async def _aanalyze_goal(self, goal: str) -> Dict[str, Any]:
+        """Identify ambiguities in the goal and, if there are none, plan it"""
+        prompt = _ANALYZE_PROMPT_PREFIX + goal + _ANALYZE_PROMPT_SUFFIX
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {"role": "system", "content": "You are a goal analysis expert. Identify ambiguities in user goals."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=400
+            return await self._arequest_plan(
+                goal,
+                _STATIC_SYSTEM_GOAL_ANALYZE,
+                prompt,
+                max_tokens=800,
+                response_format={"type": "json_object"}
             )
             
-            content = response.choices[0].message.content
-            return self._parse_json_response(content)
-            
         except Exception as e:
             return {
                 "needs_clarification": False,
@@ -144,16 +269,7 @@ Return as JSON:
             return understanding.get("interpreted_goal", "")
         
         # Filter out obvious questions (we know we're on Linux)
-        filtered_questions = []
-        for q in questions:
-            q_lower = q.lower()
-            # Skip OS questions - we know it's Linux
-            if any(word in q_lower for word in ["operating system", "os", "windows", "macos", "environment"]):
-                continue
-            # Skip obvious context questions
-            if any(word in q_lower for word in ["shell environment", "terminal", "command line"]):
-                continue
-            filtered_questions.append(q)
+        filtered_questions = [q for q in questions if not _OBVIOUS_QUESTION_RE.search(q)]
         
         if not filtered_questions:
             # No critical questions, use interpreted goal
@@ -188,60 +304,13 @@ Return as JSON:
         
         return clarified if clarified else understanding.get("interpreted_goal", "")
 
-    def _decompose_goal(self, goal: str) -> Dict[str, Any]:
+    async def _adecompose_goal(self, goal: str) -> Dict[str, Any]:
         """Decompose goal into sequential steps with dependencies"""
-        prompt = f"""Break down this goal into ordered, executable steps:
-
-Goal: "{goal}"
-
-Requirements:
-- Each step must be a single bash command
-- Steps must be in correct dependency order
-- Include safety considerations
-- Identify which steps are risky
-
-Return as JSON:
-{{
-  "summary": "Brief goal summary",
-  "steps": [
-    {{
-      "step": 1,
-      "description": "What this step does",
-      "command": "bash command",
-      "dependencies": [],
-      "risky": false,
-      "requires_confirmation": false
-    }}
-  ],
-  "estimated_time": "estimated completion time",
-  "warnings": ["warning1", "warning2"]
-}}"""
+        prompt = _DECOMPOSE_PROMPT_PREFIX + goal + _DECOMPOSE_PROMPT_SUFFIX
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {"role": "system", "content": "You are a goal decomposition expert. Break goals into safe, ordered steps."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=600
-            )
-            
-            content = response.choices[0].message.content
-            plan = self._parse_json_response(content)
-            
-            # Validate and enhance steps
-            steps = plan.get("steps", [])
-            for step in steps:
-                if "dependencies" not in step:
-                    step["dependencies"] = []
-                if "risky" not in step:
-                    step["risky"] = False
-                if "requires_confirmation" not in step:
-                    step["requires_confirmation"] = False
-            
-            return plan
+            plan = await self._arequest_plan(goal, _STATIC_SYSTEM_GOAL_PLAN, prompt, max_tokens=600)
+            return self._finish_plan(goal, plan)
             
         except Exception as e:
             return {
@@ -249,7 +318,74 @@ Return as JSON:
                 "steps": []
             }
 
-    def _show_goal_plan(self, plan: Dict[str, Any], steps: List[Dict[str, Any]]):
+    def _cached_plan_hint(self, goal: str) -> str:
+        """Prompt text asking to adapt the cached plan of a similar goal, if any"""
+        cached = self.plan_cache.lookup("goal", goal) if self.plan_cache else None
+        if not cached:
+            return ""
+
+        self.console.print(f"[dim]♻️  Adapting cached plan for a similar goal: {cached['query']}[/dim]")
+        return f"""
+
+A plan was previously made for the similar goal "{cached['query']}":
+{json.dumps(cached['payload'], indent=2)}
+
+Adapt this plan to the current goal instead of planning from scratch."""
+
+    async def _arequest_plan(self, goal: str, system_prompt: str, prompt: str, max_tokens: int,
+                             **request) -> Dict[str, Any]:
+        """
+        Request a plan for a goal and parse it, previewing each step as soon
+        as its JSON object is complete. An identical earlier request is
+        answered from the plan cache without calling the LLM; otherwise the
+        cached plan of a similar goal, if any, is offered as a starting point.
+        """
+        request.update(temperature=0.3, max_tokens=max_tokens)
+        key = PlanCache.response_key(self.llm_client.model, request, system_prompt, prompt)
+        cached = self.plan_cache.get_response(key) if self.plan_cache else None
+        if isinstance(cached, dict):
+            return cached
+        prompt += self._cached_plan_hint(goal)
+
+        table = self._new_plan_table()
+        steps_stream = ArrayItemStream("steps")
+
+        def on_text(delta: str, content: str):
+            for step in steps_stream.feed(delta):
+                if isinstance(step, dict):
+                    self._add_plan_row(table, step)
+            return table
+
+        content = await self._astream_completion(
+            table,
+            on_text,
+            messages=self.llm_client.build_messages(system_prompt, prompt),
+            **request
+        )
+        result = self._parse_json_response(content)
+
+        if self.plan_cache and not result.get("error"):
+            self.plan_cache.put_response(key, result)
+        return result
+
+    def _finish_plan(self, goal: str, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in step defaults and remember the plan for similar goals"""
+        # Validate and enhance steps
+        steps = plan.get("steps", [])
+        for step in steps:
+            if "dependencies" not in step:
+                step["dependencies"] = []
+            if "risky" not in step:
+                step["risky"] = False
+            if "requires_confirmation" not in step:
+                step["requires_confirmation"] = False
+
+        if self.plan_cache and steps:
+            self.plan_cache.store("goal", goal, plan)
+        
+        return plan
+
+    def _show_goal_plan(self, plan: Dict[str, Any], steps: Iterable[Dict[str, Any]]):
         """Display the goal plan"""
         summary = plan.get("summary", "Goal execution plan")
         estimated_time = plan.get("estimated_time", "Unknown")
@@ -264,44 +400,192 @@ Return as JSON:
                 self.console.print(f"  • {warning}")
         
         # Show steps table
+        table = self._new_plan_table()
+        for step in steps:
+            self._add_plan_row(table, step)
+        
+        self.console.print(table)
+
+    @staticmethod
+    def _new_plan_table() -> Table:
+        """Empty table of plan steps"""
         table = Table(title="Execution Steps", show_header=True, header_style="bold magenta")
         table.add_column("Step", style="cyan", width=6)
         table.add_column("Description", style="white")
         table.add_column("Command", style="green", no_wrap=False)
         table.add_column("Risk", style="yellow", width=8)
+        return table
+
+    @staticmethod
+    def _add_plan_row(table: Table, step: Dict[str, Any]):
+        """Add a plan step to a table made by _new_plan_table()"""
+        step_num = step.get("step", "?")
+        desc = step.get("description", "")
+        cmd = step.get("command", "")
+        risk_icon = "⚠️" if step.get("risky") else "✅"
         
-        for step in steps:
-            step_num = step.get("step", "?")
-            desc = step.get("description", "")
-            cmd = step.get("command", "")
-            risk_icon = "⚠️" if step.get("risky") else "✅"
-            
-            table.add_row(str(step_num), desc, cmd[:50] + "..." if len(cmd) > 50 else cmd, risk_icon)
-        
-        self.console.print(table)
+        table.add_row(str(step_num), desc, cmd[:50] + "..." if len(cmd) > 50 else cmd, risk_icon)
+
+    async def _astream_completion(self, placeholder, on_text, messages: List[Dict[str, Any]], **request) -> str:
+        """
+        Stream a completion, showing a transient preview while it arrives
+
+        Args:
+            placeholder: Renderable shown until the first text arrives
+            on_text: Called as on_text(delta, content_so_far) for each chunk;
+                returns the renderable to preview
+            messages: Chat messages
+            **request: Completion arguments replacing the client defaults
+
+        Returns:
+            The full completion text
+        """
+        stream = await self.llm_client.achat(messages, stream=True, **request)
+
+        # The preview is replaced by the normal output once the text is complete,
+        # and is only drawn on an interactive terminal
+        live = None
+        if self.console.is_terminal:
+            live = Live(placeholder, console=self.console, transient=True,
+                        refresh_per_second=self.PREVIEW_REFRESH_PER_SECOND)
+            live.start()
+
+        content = ""
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    content += delta
+                    preview = on_text(delta, content)
+                    if live is not None:
+                        live.update(preview)
+        finally:
+            if live is not None:
+                live.stop()
+        return content
+
+    def _show_step(self, step: Dict[str, Any], step_num: Any, total: int):
+        """Display the step about to run"""
+        step_panel = Panel(
+            f"[bold]Step {step_num}:[/bold] {step.get('description', '')}\n\n"
+            f"[dim]Command:[/dim] [green]{step.get('command', '')}[/green]",
+            title=f"Step {step_num}/{total}",
+            border_style="blue"
+        )
+        self.console.print(step_panel)
+
+    @staticmethod
+    def _dependencies(step: Dict[str, Any]) -> List[Any]:
+        """The step numbers a step depends on, as given by the plan"""
+        dependencies = step.get("dependencies") or []
+        return dependencies if isinstance(dependencies, list) else [dependencies]
+
+    def _parallel_batch(self, steps: List[Dict[str, Any]], start: int) -> List[Dict[str, Any]]:
+        """
+        The run of steps from steps[start] on that can execute at once
+
+        Only plain read-only commands qualify (executor.are_independent), so
+        steps that write still run one at a time in plan order, even when the
+        plan forgot to declare a dependency on them. A step that depends on
+        another step of the run, or is risky or needs confirmation, ends it.
+        """
+        batch = []
+        batch_steps = set()
+        for step in steps[start:]:
+            command = step.get("command", "")
+            if step.get("risky") or step.get("requires_confirmation"):
+                break
+            if not command or not self.executor.are_independent([command]):
+                break
+            if any(dependency in batch_steps for dependency in self._dependencies(step)):
+                break
+            if self.safety_checker.check_commands([command]).get("has_risky"):
+                break
+            batch.append(step)
+            batch_steps.add(step.get("step"))
+        return batch
+
+    async def _aexecute_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute independent steps concurrently, returning results in step order"""
+        commands = [step.get("command", "") for step in batch]
+        descriptions = [step.get("description", "") for step in batch]
+        return [result async for result in self.executor.aiter_execute(commands, descriptions, parallel=True)]
+
+    def _preapprove_steps(self, steps: List[Dict[str, Any]]) -> Set[int]:
+        """
+        Offer to approve all risky but non-critical steps at once
+
+        Returns:
+            Positions (1-based) of the steps that won't ask again
+        """
+        approvable = set()
+        for i, step in enumerate(steps, 1):
+            safety_result = self.safety_checker.check_commands([step.get("command", "")])
+            if not (step.get("risky") or step.get("requires_confirmation") or safety_result.get("has_risky")):
+                continue
+            if any(c.get("risk_level") == "CRITICAL" for c in safety_result.get("risky_commands", [])):
+                # Critical commands are always confirmed individually
+                continue
+            approvable.add(i)
+
+        if approvable and Confirm.ask(
+            f"[bold]Approve all {len(approvable)} risky non-critical step(s) in advance?[/bold]",
+            default=False
+        ):
+            return approvable
+        return set()
+
+    async def _aexecute_goal_steps(self, steps: List[Dict[str, Any]], auto_confirm: bool = False,
+                                   preapproved: Optional[Set[int]] = None) -> Dict[str, Any]:
+        """
+        Execute goal steps in plan order with monitoring
 
-    def _execute_goal_steps(self, steps: List[Dict[str, Any]], auto_confirm: bool = False) -> Dict[str, Any]:
-        """Execute goal steps sequentially with monitoring"""
+        Consecutive read-only steps that don't depend on each other run
+        concurrently; their results are then handled in order like any other.
+        Steps whose positions are in preapproved run without asking.
+        """
+        preapproved = preapproved or set()
         self.console.print("\n[bold green]🚀 Executing Goal Steps...[/bold green]\n")
         
         results = []
-        start_time = time.time()
+        # Monotonic, so NTP adjustments can't skew the timings
+        start_ns = time.perf_counter_ns()
+        # Results of steps already run as part of a concurrent batch, by position
+        prefetched: Dict[int, Dict[str, Any]] = {}
         
         for i, step in enumerate(steps, 1):
             step_num = step.get("step", i)
             description = step.get("description", "")
             command = step.get("command", "")
-            is_risky = step.get("risky", False)
             requires_confirmation = step.get("requires_confirmation", False)
+            approved = auto_confirm or i in preapproved
+            
+            if i not in prefetched:
+                batch = self._parallel_batch(steps, i - 1)
+                if len(batch) > 1:
+                    for offset, batch_step in enumerate(batch):
+                        self._show_step(batch_step, batch_step.get("step", i + offset), len(steps))
+                    batch_results = await self._aexecute_batch(batch)
+                    prefetched.update(zip(range(i, i + len(batch)), batch_results))
+            
+            if i in prefetched:
+                # Already shown, checked and run with its batch
+                step_result = prefetched.pop(i)
+                step_result["step"] = step_num
+                step_result["description"] = description
+                step_result["command"] = command
+                results.append(step_result)
+                if not self._handle_step_failure(step_result, step_num, command, description, auto_confirm, results):
+                    return {
+                        "aborted": True,
+                        "completed_steps": i - 1,
+                        "total_steps": len(steps),
+                        "results": results
+                    }
+                continue
             
             # Show step
-            step_panel = Panel(
-                f"[bold]Step {step_num}:[/bold] {description}\n\n"
-                f"[dim]Command:[/dim] [green]{command}[/green]",
-                title=f"Step {step_num}/{len(steps)}",
-                border_style="blue"
-            )
-            self.console.print(step_panel)
+            self._show_step(step, step_num, len(steps))
             
             # Safety check
             safety_result = self.safety_checker.check_commands([command])
@@ -310,7 +594,7 @@ Return as JSON:
                 self.display.show_risky_commands(safety_result["risky_commands"])
                 has_critical = any(c.get("risk_level") == "CRITICAL" for c in safety_result.get("risky_commands", []))
                 
-                if not auto_confirm:
+                if not approved:
                     if not self.display.confirm_risky_execution(1, 1, has_critical):
                         self.console.print(f"[yellow]Step {step_num} skipped. Continue?[/yellow]")
                         if not Confirm.ask("", default=True):
@@ -328,7 +612,7 @@ Return as JSON:
                         continue
             
             # Confirmation for steps that require it
-            if requires_confirmation and not auto_confirm:
+            if requires_confirmation and not approved:
                 if not Confirm.ask(f"[bold]Execute step {step_num}?[/bold]", default=True):
                     results.append({
                         "step": step_num,
@@ -338,99 +622,122 @@ Return as JSON:
                     continue
             
             # Execute step
-            step_start = time.time()
+            step_start_ns = time.perf_counter_ns()
             execution_result = self.executor.execute_commands([command], [description])
-            step_end = time.time()
+            step_end_ns = time.perf_counter_ns()
             
             step_result = execution_result["results"][0] if execution_result["results"] else {}
             step_result["step"] = step_num
             step_result["description"] = description
             step_result["command"] = command
-            step_result["execution_time"] = step_end - step_start
+            step_result["execution_time"] = (step_end_ns - step_start_ns) / 1e9
             
             results.append(step_result)
             
-            # Check if step failed
-            if not step_result.get("success", False):
-                self.console.print(f"[red]❌ Step {step_num} failed[/red]")
-                self.console.print(f"[dim]Error: {step_result.get('stderr', 'Unknown error')}[/dim]")
-                
-                # Ask what to do
-                if not auto_confirm:
-                    self.console.print("\n[bold]What would you like to do?[/bold]")
-                    choice = Prompt.ask(
-                        "[dim]Options: retry, skip, abort[/dim]",
-                        default="skip"
-                    )
-                    
-                    if choice.lower() == "retry":
-                        # Retry the step
-                        retry_result = self.executor.execute_commands([command], [description])
-                        if retry_result["results"][0].get("success"):
-                            results[-1] = retry_result["results"][0]
-                            results[-1]["step"] = step_num
-                            results[-1]["retried"] = True
-                            self.console.print("[green]✅ Retry successful![/green]")
-                        else:
-                            self.console.print("[red]❌ Retry also failed[/red]")
-                    elif choice.lower() == "abort":
-                        return {
-                            "aborted": True,
-                            "completed_steps": i - 1,
-                            "total_steps": len(steps),
-                            "results": results
-                        }
-                    # else: skip (continue)
+            if not self._handle_step_failure(step_result, step_num, command, description, auto_confirm, results):
+                return {
+                    "aborted": True,
+                    "completed_steps": i - 1,
+                    "total_steps": len(steps),
+                    "results": results
+                }
         
-        end_time = time.time()
+        end_ns = time.perf_counter_ns()
         
         return {
             "completed": True,
             "total_steps": len(steps),
             "results": results,
             "all_successful": all(r.get("success", False) for r in results if not r.get("skipped")),
-            "total_time": end_time - start_time
+            "total_time": (end_ns - start_ns) / 1e9
         }
 
-    def _generate_completion_summary(self, goal: str, steps: List[Dict[str, Any]], 
-                                     execution_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_step_failure(
+        self,
+        step_result: Dict[str, Any],
+        step_num: Any,
+        command: str,
+        description: str,
+        auto_confirm: bool,
+        results: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Report a failed step and let the user retry, skip or abort
+
+        Returns:
+            False if the user chose to abort the goal
+        """
+        if step_result.get("success", False):
+            return True
+
+        self.console.print(f"[red]❌ Step {step_num} failed[/red]")
+        self.console.print(f"[dim]Error: {step_result.get('stderr', 'Unknown error')}[/dim]")
+        
+        # Ask what to do
+        if not auto_confirm:
+            self.console.print("\n[bold]What would you like to do?[/bold]")
+            choice = Prompt.ask(
+                "[dim]Options: retry, skip, abort[/dim]",
+                default="skip"
+            )
+            
+            if choice.lower() == "retry":
+                # Retry the step
+                retry_result = self.executor.execute_commands([command], [description])
+                if retry_result["results"][0].get("success"):
+                    results[-1] = retry_result["results"][0]
+                    results[-1]["step"] = step_num
+                    results[-1]["retried"] = True
+                    self.console.print("[green]✅ Retry successful![/green]")
+                else:
+                    self.console.print("[red]❌ Retry also failed[/red]")
+            elif choice.lower() == "abort":
+                return False
+            # else: skip (continue)
+        return True
+
+    async def _agenerate_completion_summary(self, goal: str, steps: List[Dict[str, Any]],
+                                            execution_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate completion summary with learning insights"""
         results = execution_results.get("results", [])
-        successful = sum(1 for r in results if r.get("success") and not r.get("skipped"))
-        failed = sum(1 for r in results if not r.get("success") and not r.get("skipped"))
-        skipped = sum(1 for r in results if r.get("skipped"))
+        successful = failed = skipped = 0
+        steps_detail = []
+        for r in results:
+            step_skipped = r.get("skipped")
+            step_success = r.get("success")
+            if step_skipped:
+                skipped += 1
+            elif step_success:
+                successful += 1
+            else:
+                failed += 1
+            steps_detail.append({
+                "step": r.get("step"),
+                "success": step_success,
+                "skipped": step_skipped,
+                "description": r.get("description", "")
+            })
         total_time = execution_results.get("total_time", 0)
         
         # Generate AI summary
-        summary_prompt = f"""Summarize this goal execution:
-
-Goal: {goal}
-Total Steps: {len(steps)}
-Successful: {successful}
-Failed: {failed}
-Skipped: {skipped}
-Total Time: {total_time:.2f}s
-
-Provide:
-1. Brief execution summary
-2. Key achievements
-3. Any issues encountered
-4. Suggestions for improvement or safer alternatives
-5. Learning insights"""
+        summary_prompt = _SUMMARY_PROMPT % {
+            "goal": goal,
+            "total": len(steps),
+            "successful": successful,
+            "failed": failed,
+            "skipped": skipped,
+            "total_time": total_time
+        }
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {"role": "system", "content": "You are a goal execution analyst. Provide clear summaries and learning insights."},
-                    {"role": "user", "content": summary_prompt}
-                ],
+            ai_summary = await self._astream_completion(
+                Text("📊 Summarizing...", style="dim"),
+                lambda delta, content: Text(content),
+                messages=self.llm_client.build_messages(_STATIC_SYSTEM_GOAL_SUMMARY, summary_prompt),
                 temperature=0.4,
                 max_tokens=400
             )
             
-            ai_summary = response.choices[0].message.content
-            
             return {
                 "goal": goal,
                 "total_steps": len(steps),
@@ -440,15 +747,7 @@ Provide:
                 "total_time": total_time,
                 "all_successful": execution_results.get("all_successful", False),
                 "ai_summary": ai_summary,
-                "steps_detail": [
-                    {
-                        "step": r.get("step"),
-                        "success": r.get("success"),
-                        "skipped": r.get("skipped"),
-                        "description": r.get("description", "")
-                    }
-                    for r in results
-                ]
+                "steps_detail": steps_detail
             }
             
         except Exception as e:
@@ -464,25 +763,9 @@ Provide:
 
     def _parse_json_response(self, content: str) -> Dict[str, Any]:
         """Parse JSON response from LLM"""
-        import json
-        import re
-        
         try:
-            content = content.strip()
-            
-            # Extract JSON
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            
-            return json.loads(content)
-            
-        except json.JSONDecodeError:
+            return parse_llm_json(content)
+        except JSONDecodeError:
             return {"error": "Invalid JSON response", "needs_clarification": False}
         except Exception as e:
             return {"error": str(e), "needs_clarification": False}
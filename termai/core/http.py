@@ -0,0 +1,84 @@
+"""Shared HTTP connection pools for the OpenAI clients"""
+
+import asyncio
+import importlib.util
+import os
+import weakref
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+
+DEFAULT_POOL_SIZE = 64
+
+# httpx async pools are bound to the event loop they were created on, so
+# there is one client per loop rather than a single process-wide one
+_clients = weakref.WeakKeyDictionary()
+# The sync pool isn't tied to anything, so it is process-wide
+_sync_client = None
+
+
+def _pool_size() -> int:
+    """Maximum number of connections, from TERMA_HTTP_POOL_SIZE"""
+    try:
+        return max(1, int(os.getenv("TERMA_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def get_async_http_client() -> Optional["httpx.AsyncClient"]:
+    """
+    Return the pooled async HTTP client for the running event loop
+
+    HTTP/2 is used when the h2 package is installed, so concurrent requests
+    share one TLS connection. Returns None if httpx isn't importable, in
+    which case the OpenAI SDK falls back to its own default client.
+    """
+    # Imported here: openai is slow to import and only needed once a client is made
+    try:
+        import httpx
+        from openai import DefaultAsyncHttpxClient
+    except ImportError:
+        return None
+
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        pool_size = _pool_size()
+        client = DefaultAsyncHttpxClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=max(1, pool_size // 2)
+            )
+        )
+        _clients[loop] = client
+    return client
+
+
+def get_http_client() -> Optional["httpx.Client"]:
+    """
+    Return the process-wide pooled HTTP client for sync OpenAI clients
+
+    Keep-alive connections are held for a minute, so requests made shortly
+    after each other (or by another LLMClient) skip the TCP/TLS handshake.
+    Returns None if httpx isn't importable.
+    """
+    global _sync_client
+    try:
+        import httpx
+        from openai import DefaultHttpxClient
+    except ImportError:
+        return None
+
+    if _sync_client is None or _sync_client.is_closed:
+        pool_size = _pool_size()
+        _sync_client = DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=max(1, pool_size // 4),
+                keepalive_expiry=60
+            )
+        )
+    return _sync_client
@@ -0,0 +1,140 @@
+"""JSON helpers for parsing LLM responses"""
+
+import json
+import re
+from typing import Any, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Contents of the first fenced code block (```json ... ``` or ``` ... ```)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Characters that change ArrayItemStream's state outside and inside strings
+_STRUCTURAL_RE = re.compile(r'[{}\[\]"]')
+_STRING_SPECIAL_RE = re.compile(r'[\\"]')
+
+# orjson.JSONDecodeError subclasses this, so callers can catch it either way
+JSONDecodeError = json.JSONDecodeError
+
+
+def strip_fences(content: str) -> str:
+    """Return the body of the first fenced code block, or the stripped content"""
+    match = _FENCE_RE.search(content)
+    return match.group(1) if match else content.strip()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_llm_json(content: str) -> Any:
+    """
+    Parse JSON from an LLM response
+
+    Most responses are bare JSON, so that is tried first. Otherwise the body
+    of a fenced code block is parsed, and finally the text between the first
+    "{" and the last "}" (models sometimes add prose around the object).
+
+    Raises:
+        JSONDecodeError: If none of those parse
+    """
+    try:
+        return loads(content)
+    except JSONDecodeError:
+        pass
+
+    stripped = strip_fences(content)
+    try:
+        return loads(stripped)
+    except JSONDecodeError:
+        start = stripped.find("{")
+        end = stripped.rfind("}")
+        if start == -1 or end < start:
+            raise
+    return loads(stripped[start:end + 1])
+
+
+class ArrayItemStream:
+    """
+    Pull the objects of one JSON array out of a document as it streams in
+
+    feed() takes the next chunk of text and returns the array's objects that
+    were completed by it, so each item can be used before the rest of the
+    document arrives. The full document should still be parsed at the end;
+    this only tracks nesting and strings, it doesn't validate anything.
+    """
+
+    def __init__(self, key: str):
+        """
+        Args:
+            key: Name of the array to follow (e.g. "steps")
+        """
+        self._key_re = re.compile(rf'"{re.escape(key)}"\s*:\s*\[')
+        self._buffer = ""
+        self._pos: Optional[int] = None  # Scan position once inside the array
+        self._depth = 0
+        self._item_start: Optional[int] = None
+        self._in_string = False
+        self._escaped = False
+        self._closed = False
+
+    def feed(self, text: str) -> List[Any]:
+        """Add streamed text and return the array items it completed"""
+        self._buffer += text
+        if self._pos is None:
+            match = self._key_re.search(self._buffer)
+            if not match:
+                return []
+            self._pos = match.end()
+
+        items = []
+        buffer = self._buffer
+        end = len(buffer)
+        i = self._pos
+        while i < end and not self._closed:
+            if self._escaped:
+                # The character after a backslash is part of the string
+                self._escaped = False
+                i += 1
+                continue
+
+            # Jump straight to the next character that can change the state
+            match = (_STRING_SPECIAL_RE if self._in_string else _STRUCTURAL_RE).search(buffer, i)
+            if not match:
+                i = end
+                break
+            i = match.start()
+            ch = buffer[i]
+
+            if self._in_string:
+                if ch == "\\":
+                    self._escaped = True
+                else:
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                if self._depth == 0 and ch == "{":
+                    self._item_start = i
+                self._depth += 1
+            elif self._depth == 0:
+                # End of the array itself
+                self._closed = True
+            else:
+                self._depth -= 1
+                if self._depth == 0 and self._item_start is not None:
+                    try:
+                        items.append(loads(buffer[self._item_start:i + 1]))
+                    except JSONDecodeError:
+                        pass
+                    self._item_start = None
+            i += 1
+        self._pos = i
+        return items
@@ -1,14 +1,136 @@
 """OpenRouter API client for LLM communication"""
 
+import asyncio
 import os
-import json
-from typing import Dict, List, Optional, Any
-from openai import OpenAI
-import yaml
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
 from dotenv import load_dotenv
 from .api_setup import require_api_key, APIKeySetupError
 from .system_info import SystemInfoCollector
+from .file_helper import list_entries
+from .json_utils import JSONDecodeError, parse_llm_json
+from .http import get_async_http_client, get_http_client
+from .rate_limit import AsyncRateLimiter, retry_with_backoff
+
+if TYPE_CHECKING:
+    import openai
+
+# The openai package takes most of a second to import, so it's only imported
+# when the first client is created (see _openai()). Until then these are None;
+# tests may patch them.
+OpenAI = None
+AsyncOpenAI = None
+RateLimitError = None
+
+
+# Static system prompts. They are kept byte-identical between requests (and
+# always sent as the first message) so providers that support prompt caching
+# can reuse the cached prefix; per-request data goes into later messages.
+_STATIC_SYSTEM_COMMANDS = """You are a Linux command generator for Terma AI.
+
+Your task is to convert user requests into SAFE bash commands that can be executed in a Linux terminal.
+
+CRITICAL SAFETY RULES:
+- NEVER generate destructive commands like 'rm -rf /', 'mkfs', 'dd if=/dev/zero'
+- NEVER use 'sudo' or privilege escalation
+- NEVER edit system files in /etc, /boot, /bin, /usr/bin
+- NEVER modify permissions dangerously (chmod 777, chown root)
+- Prefer safe alternatives and read-only operations
+- Always use absolute paths when possible
+- Suggest commands that are informative rather than destructive
+
+Return your response as valid JSON with this exact structure:
+{
+  "commands": ["command1", "command2"],
+  "explanations": ["explanation1", "explanation2"],
+  "safe": true
+}
+
+Guidelines:
+- Generate 1-5 commands maximum
+- Each explanation should be 1 short sentence
+- If the request is too dangerous, set "safe": false and provide safe alternatives
+- Focus on common Linux tasks: file operations, searching, monitoring, text processing"""
+
+_STATIC_SYSTEM_ANALYSIS = """You are an intelligent assistant that analyzes user queries to determine if they need command execution.
+
+Analyze the query and determine:
+1. Does this query require executing terminal commands? (e.g., "list files", "check disk usage", "show git status")
+2. Or is this a general question that can be answered conversationally? (e.g., "what is git?", "how does ls work?", "explain bash")
+
+Return your response as valid JSON:
+{
+  "needs_execution": true/false,
+  "reason": "brief explanation of why execution is/isn't needed",
+  "query_type": "command_request" | "question" | "explanation_request" | "conversational"
+}
+
+Examples:
+- "list files in current directory" → needs_execution: true, query_type: "command_request"
+- "what is git?" → needs_execution: false, query_type: "question"
+- "how do I check disk usage?" → needs_execution: false, query_type: "explanation_request"
+- "show me the contents of README.md" → needs_execution: true, query_type: "command_request"
+- "hello" → needs_execution: false, query_type: "conversational"
+"""
+
+_STATIC_SYSTEM_CONVERSATIONAL = """You are a helpful Linux terminal assistant. Provide clear, friendly, and informative responses.
+
+Guidelines:
+- Be conversational and natural, like ChatGPT
+- Explain things clearly without being overly technical
+- If command results are provided, summarize them in a user-friendly way
+- Answer questions about Linux, commands, and terminal usage
+- Be concise but thorough
+"""
+
+
+DEFAULT_MODEL = "x-ai/grok-4.1-fast:free"
+
+
+def _openai(name: str) -> Any:
+    """Return an attribute of the openai package, importing it on first use"""
+    value = globals()[name]
+    if value is None:
+        import openai
+        value = globals()[name] = getattr(openai, name)
+    return value
+
+
+# Sync OpenAI clients, shared process-wide by every LLMClient with the same
+# credentials so they reuse one connection pool (see _shared_client())
+_sync_clients: Dict[Tuple[Any, str, str], Any] = {}
+
+
+def _shared_client(api_key: str, base_url: str) -> "openai.OpenAI":
+    """Return the process-wide OpenAI client for an API key and base URL"""
+    factory = _openai("OpenAI")
+    key = (factory, api_key, base_url)
+    client = _sync_clients.get(key)
+    if client is None:
+        client = _sync_clients[key] = factory(api_key=api_key, base_url=base_url, http_client=get_http_client())
+    return client
+
+
+@lru_cache(maxsize=8)
+def _read_config(config_path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """
+    Parse a settings file
+
+    Cached, since every LLMClient reads the same file; the modification time
+    is part of the key so an edited file is parsed again.
+    """
+    import yaml
+    try:
+        # libyaml's C loader (PyYAML wheels include it); same safe subset of YAML
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    # Binary, so libyaml reads the bytes itself instead of through a text wrapper
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=Loader)
 
 
 class LLMClient:
@@ -27,6 +149,16 @@ class LLMClient:
         load_dotenv()
         self.config = self._load_config(config_path)
         self.preferences = preferences
+
+        # Request defaults, resolved once instead of on every call
+        self._model = self.config.get("model", DEFAULT_MODEL)
+        self._temperature = self.config.get("temperature", 0.2)
+        self._max_tokens = self.config.get("max_tokens", 300)
+        self._chat_kwargs = MappingProxyType({
+            "model": self._model,
+            "temperature": self._temperature,
+            "max_tokens": self._max_tokens
+        })
         
         # Collect system information for better context
         try:
@@ -35,6 +167,15 @@ class LLMClient:
             # Fallback if system info collection fails
             self.system_info = None
 
+        # System prompt including the system context, built on first use
+        self._system_prompt: Optional[str] = None
+
+        # Async client is created lazily, per event loop (see aclient)
+        self._aclient = None
+        self._aclient_loop = None
+        # Keep concurrent async requests under the provider's requests-per-minute limit
+        self._limiter = AsyncRateLimiter(self._requests_per_minute(), 60)
+
         # Check for API key with helpful error messages
         if require_key:
             self.api_key = require_api_key()
@@ -45,10 +186,7 @@ class LLMClient:
                 self.client = None
                 return
 
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=self.config.get("api_base", "https://openrouter.ai/api/v1")
-        )
+        self.client = _shared_client(self.api_key, self.config.get("api_base", "https://openrouter.ai/api/v1"))
 
     def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """Load configuration from YAML file"""
@@ -56,91 +194,212 @@ class LLMClient:
             config_path = Path(__file__).parent.parent / "settings.yaml"
 
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            config_path = Path(config_path).resolve()
+            # Copy, so a client adjusting its config doesn't change the cached one
+            return dict(_read_config(str(config_path), config_path.stat().st_mtime_ns) or {})
         except FileNotFoundError:
             # Return default configuration
             return {
                 "provider": "openrouter",
-                "model": "x-ai/grok-4.1-fast:free",
+                "model": DEFAULT_MODEL,
                 "temperature": 0.2,
                 "max_tokens": 300,
                 "api_base": "https://openrouter.ai/api/v1"
             }
 
-    def generate_commands(self, user_input: str, working_directory: Optional[str] = None, conversation_history: Optional[List[str]] = None) -> Dict[str, Any]:
+    @property
+    def aclient(self) -> "openai.AsyncOpenAI":
         """
-        Convert natural language input to bash commands using LLM
+        AsyncOpenAI client for the running event loop.
+
+        httpx async connection pools are bound to the loop that created them,
+        so a new client is built whenever the caller runs on a different loop
+        (e.g. successive asyncio.run() calls from the shell). All clients on
+        a loop share that loop's connection pool (see http.py).
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop or self._aclient.is_closed():
+            self._aclient = _openai("AsyncOpenAI")(
+                api_key=self.api_key,
+                base_url=self.config.get("api_base", "https://openrouter.ai/api/v1"),
+                http_client=get_async_http_client(),
+                # acomplete() retries with backoff under the rate limiter; SDK
+                # retries on top would multiply attempts and bypass the limiter
+                max_retries=0
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    def _requests_per_minute(self) -> int:
+        """Client-side request budget, from TERMA_RPM (default 300)"""
+        try:
+            return max(1, int(os.getenv("TERMA_RPM", "300")))
+        except ValueError:
+            return 300
+
+    @property
+    def model(self) -> str:
+        """Model requests are sent to"""
+        return self._model
+
+    def chat(self, messages: List[Dict[str, Any]], **overrides):
+        """
+        Create a chat completion with the configured model and defaults
 
         Args:
-            user_input: Natural language description of desired action
-            working_directory: Optional working directory to get file context from
-            conversation_history: Optional list of previous conversation turns for context
+            messages: Chat messages (see build_messages())
+            **overrides: Completion arguments replacing the defaults
+                (temperature, max_tokens, ...)
+        """
+        return self.client.chat.completions.create(**{**self._chat_kwargs, **overrides}, messages=messages)
 
-        Returns:
-            Dict containing commands and explanations
+    async def achat(self, messages: List[Dict[str, Any]], **overrides):
+        """Async counterpart of chat(), throttled and retried like acomplete()"""
+        return await self.acomplete(**{**self._chat_kwargs, **overrides}, messages=messages)
+
+    async def acomplete(self, **request):
         """
-        system_prompt = self._get_system_prompt()
-        user_prompt = self._get_user_prompt(user_input, working_directory, conversation_history)
+        Create a chat completion on the async client
 
-        # Build messages with conversation history
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add conversation history if provided
+        Requests are throttled by the client's rate limiter and retried with
+        exponential backoff when the provider still answers 429.
+        """
+        async def create():
+            async with self._limiter:
+                return await self.aclient.chat.completions.create(**request)
+
+        return await retry_with_backoff(create, retry_on=(_openai("RateLimitError"),))
+
+    async def aclose(self):
+        """Close the async client and its connection pool (call before the event loop shuts down)"""
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+            self._aclient_loop = None
+
+    def _history_messages(self, conversation_history: Optional[List[str]]) -> List[Dict[str, str]]:
+        """Convert "User:"/"AI:" history turns into chat messages"""
+        messages = []
         if conversation_history:
             for turn in conversation_history[-10:]:  # Last 10 turns for context
                 if turn.startswith("User:"):
                     messages.append({"role": "user", "content": turn[5:].strip()})
                 elif turn.startswith("AI:"):
                     messages.append({"role": "assistant", "content": turn[3:].strip()})
-        
+        return messages
+
+    def build_messages(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        conversation_history: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build a chat message list in a prompt-cache friendly order
+
+        The static system prompt always comes first, followed by the history
+        turns as separate messages and the per-request prompt last, so the
+        prefix of consecutive requests stays identical.
+
+        Args:
+            system_prompt: Static system prompt (should not vary per request)
+            user_prompt: Prompt for this request
+            conversation_history: Optional "User:"/"AI:" history turns
+
+        Returns:
+            List of chat messages
+        """
+        messages = [self._system_message(system_prompt)]
+        messages.extend(self._history_messages(conversation_history))
         messages.append({"role": "user", "content": user_prompt})
+        return messages
+
+    def _system_message(self, system_prompt: str) -> Dict[str, Any]:
+        """System message, marked as a cache breakpoint for Anthropic models"""
+        # OpenRouter caches OpenAI/DeepSeek/Gemini prefixes automatically, but
+        # Anthropic models only cache up to an explicit cache_control marker
+        model = str(self.config.get("model", ""))
+        if self.config.get("prompt_cache", True) and model.startswith("anthropic/"):
+            return {
+                "role": "system",
+                "content": [{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            }
+        return {"role": "system", "content": system_prompt}
+
+    def generate_commands(self, user_input: str, working_directory: Optional[str] = None, conversation_history: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Convert natural language input to bash commands using LLM
+
+        Args:
+            user_input: Natural language description of desired action
+            working_directory: Optional working directory to get file context from
+            conversation_history: Optional list of previous conversation turns for context
+
+        Returns:
+            Dict containing commands and explanations
+        """
+        request = self._command_request(user_input, working_directory, conversation_history)
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=messages,
-                temperature=self.config.get("temperature", 0.2),
-                max_tokens=self.config.get("max_tokens", 300)
-            )
+            response = self.client.chat.completions.create(**request)
 
             content = response.choices[0].message.content
             return self._parse_response(content)
 
         except Exception as e:
-            return {
-                "error": f"Failed to generate commands: {str(e)}",
-                "commands": [],
-                "explanations": []
-            }
+            return self._command_error(e)
 
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt for command generation"""
-        base_prompt = """You are a Linux command generator for Terma AI.
+    async def agenerate_commands(self, user_input: str, working_directory: Optional[str] = None, conversation_history: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Async counterpart of generate_commands()"""
+        request = self._command_request(user_input, working_directory, conversation_history)
 
-Your task is to convert user requests into SAFE bash commands that can be executed in a Linux terminal.
+        try:
+            response = await self.acomplete(**request)
 
-CRITICAL SAFETY RULES:
-- NEVER generate destructive commands like 'rm -rf /', 'mkfs', 'dd if=/dev/zero'
-- NEVER use 'sudo' or privilege escalation
-- NEVER edit system files in /etc, /boot, /bin, /usr/bin
-- NEVER modify permissions dangerously (chmod 777, chown root)
-- Prefer safe alternatives and read-only operations
-- Always use absolute paths when possible
-- Suggest commands that are informative rather than destructive
+            content = response.choices[0].message.content
+            return self._parse_response(content)
 
-Return your response as valid JSON with this exact structure:
-{
-  "commands": ["command1", "command2"],
-  "explanations": ["explanation1", "explanation2"],
-  "safe": true
-}
+        except Exception as e:
+            return self._command_error(e)
 
-Guidelines:
-- Generate 1-5 commands maximum
-- Each explanation should be 1 short sentence
-- If the request is too dangerous, set "safe": false and provide safe alternatives
-- Focus on common Linux tasks: file operations, searching, monitoring, text processing"""
+    def _command_request(self, user_input: str, working_directory: Optional[str], conversation_history: Optional[List[str]]) -> Dict[str, Any]:
+        """Build the chat completion arguments for command generation"""
+        system_prompt = self._get_system_prompt()
+        user_prompt = self._get_user_prompt(user_input, working_directory, conversation_history)
+
+        messages = self.build_messages(system_prompt, user_prompt, conversation_history)
+
+        return {**self._chat_kwargs, "messages": messages}
+
+    def _command_error(self, error: Exception) -> Dict[str, Any]:
+        """Result returned when command generation fails"""
+        return {
+            "error": f"Failed to generate commands: {str(error)}",
+            "commands": [],
+            "explanations": []
+        }
+
+    def _get_system_prompt(self) -> str:
+        """Get the system prompt for command generation"""
+        if self._system_prompt is None:
+            self._system_prompt = self._build_system_prompt()
+        base_prompt = self._system_prompt
+        
+        # Add preferences if available (they can change between calls)
+        if self.preferences:
+            prefs_text = self.preferences.get_system_prompt_addition()
+            if prefs_text:
+                base_prompt += f"\n\nUser Preferences:\n{prefs_text}"
+        
+        return base_prompt
+
+    def _build_system_prompt(self) -> str:
+        """Build the command-generation system prompt with the (fixed) system context"""
+        base_prompt = _STATIC_SYSTEM_COMMANDS
         
         # Add system information for better context
         if self.system_info:
@@ -155,12 +414,6 @@ Guidelines:
             except Exception:
                 pass  # Silently fail if system info can't be added
         
-        # Add preferences if available
-        if self.preferences:
-            prefs_text = self.preferences.get_system_prompt_addition()
-            if prefs_text:
-                base_prompt += f"\n\nUser Preferences:\n{prefs_text}"
-        
         return base_prompt
 
     def _get_user_prompt(self, user_input: str, working_directory: Optional[str] = None, conversation_history: Optional[List[str]] = None) -> str:
@@ -168,14 +421,6 @@ Guidelines:
         base_prompt = f"""Convert this user request into safe bash commands: "{user_input}"
 """
         
-        # Add conversation context if available
-        if conversation_history and len(conversation_history) > 0:
-            base_prompt += "\nPrevious conversation context (for reference):\n"
-            # Include last 5 turns for context
-            for turn in conversation_history[-5:]:
-                base_prompt += f"  {turn}\n"
-            base_prompt += "\n"
-        
         # Add system summary for quick reference
         if self.system_info:
             try:
@@ -209,14 +454,15 @@ CRITICAL: Use the EXACT filenames (including case) from the list above.
             if not path.exists() or not path.is_dir():
                 return ""
             
+            # One scandir pass, shared with filename auto-correction
             files = []
             dirs = []
             
-            for item in sorted(path.iterdir()):
-                if item.is_file():
-                    files.append(item.name)
-                elif item.is_dir():
-                    dirs.append(item.name + "/")
+            for name in sorted(list_entries(directory), key=lambda n: n.rstrip("/")):
+                if name.endswith("/"):
+                    dirs.append(name)
+                else:
+                    files.append(name)
             
             # Combine and limit
             all_items = files + dirs
@@ -234,8 +480,8 @@ CRITICAL: Use the EXACT filenames (including case) from the list above.
     def _parse_response(self, content: str) -> Dict[str, Any]:
         """Parse the LLM response into structured data"""
         try:
-            # Try to parse as JSON
-            result = json.loads(content.strip())
+            # Models sometimes wrap the JSON in a code fence or add prose around it
+            result = parse_llm_json(content)
 
             # Validate structure
             if not isinstance(result, dict):
@@ -260,7 +506,7 @@ CRITICAL: Use the EXACT filenames (including case) from the list above.
                 "error": None
             }
 
-        except json.JSONDecodeError:
+        except JSONDecodeError:
             # Fallback parsing for non-JSON responses
             return {
                 "commands": [],
@@ -273,7 +519,7 @@ CRITICAL: Use the EXACT filenames (including case) from the list above.
         """Test the connection to OpenRouter API"""
         try:
             response = self.client.chat.completions.create(
-                model=self.config.get("model", "x-ai/grok-4.1-fast:free"),
+                model=self._model,
                 messages=[{"role": "user", "content": "Hello"}],
                 max_tokens=10
             )
@@ -293,68 +539,56 @@ CRITICAL: Use the EXACT filenames (including case) from the list above.
         Returns:
             Dict with analysis result indicating if commands are needed
         """
-        system_prompt = """You are an intelligent assistant that analyzes user queries to determine if they need command execution.
+        request = self._analysis_request(user_query, conversation_history)
 
-Analyze the query and determine:
-1. Does this query require executing terminal commands? (e.g., "list files", "check disk usage", "show git status")
-2. Or is this a general question that can be answered conversationally? (e.g., "what is git?", "how does ls work?", "explain bash")
-
-Return your response as valid JSON:
-{
-  "needs_execution": true/false,
-  "reason": "brief explanation of why execution is/isn't needed",
-  "query_type": "command_request" | "question" | "explanation_request" | "conversational"
-}
+        try:
+            response = self.client.chat.completions.create(**request)
 
-Examples:
-- "list files in current directory" → needs_execution: true, query_type: "command_request"
-- "what is git?" → needs_execution: false, query_type: "question"
-- "how do I check disk usage?" → needs_execution: false, query_type: "explanation_request"
-- "show me the contents of README.md" → needs_execution: true, query_type: "command_request"
-- "hello" → needs_execution: false, query_type: "conversational"
-"""
+            content = response.choices[0].message.content
+            return self._parse_analysis_response(content)
 
-        user_prompt = f"""Analyze this user query: "{user_query}"
+        except Exception as e:
+            return self._analysis_error(e)
 
-Determine if it needs command execution or can be answered conversationally."""
-        
-        # Add conversation context if available
-        if conversation_history and len(conversation_history) > 0:
-            user_prompt += "\n\nPrevious conversation context (for reference):\n"
-            for turn in conversation_history[-5:]:
-                user_prompt += f"  {turn}\n"
-
-        # Build messages with conversation history
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add conversation history if provided
-        if conversation_history:
-            for turn in conversation_history[-10:]:  # Last 10 turns for context
-                if turn.startswith("User:"):
-                    messages.append({"role": "user", "content": turn[5:].strip()})
-                elif turn.startswith("AI:"):
-                    messages.append({"role": "assistant", "content": turn[3:].strip()})
-        
-        messages.append({"role": "user", "content": user_prompt})
+    async def aanalyze_query(self, user_query: str, working_directory: Optional[str] = None, conversation_history: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Async counterpart of analyze_query()"""
+        request = self._analysis_request(user_query, conversation_history)
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=messages,
-                temperature=0.3,
-                max_tokens=200
-            )
+            response = await self.acomplete(**request)
 
             content = response.choices[0].message.content
             return self._parse_analysis_response(content)
 
         except Exception as e:
-            # Default to needing execution if analysis fails
-            return {
-                "needs_execution": True,
-                "reason": f"Analysis failed: {str(e)}",
-                "query_type": "command_request"
-            }
+            return self._analysis_error(e)
+
+    def _analysis_request(self, user_query: str, conversation_history: Optional[List[str]]) -> Dict[str, Any]:
+        """Build the chat completion arguments for query analysis"""
+        system_prompt = _STATIC_SYSTEM_ANALYSIS
+
+        user_prompt = f"""Analyze this user query: "{user_query}"
+
+Determine if it needs command execution or can be answered conversationally."""
+
+        messages = self.build_messages(system_prompt, user_prompt, conversation_history)
+
+        return {
+            "model": self._model,
+            "messages": messages,
+            "temperature": 0.3,
+            "max_tokens": 200
+        }
+
+
+    def _analysis_error(self, error: Exception) -> Dict[str, Any]:
+        """Result returned when query analysis fails"""
+        # Default to needing execution if analysis fails
+        return {
+            "needs_execution": True,
+            "reason": f"Analysis failed: {str(error)}",
+            "query_type": "command_request"
+        }
 
     def generate_conversational_response(
         self, 
@@ -375,15 +609,80 @@ Determine if it needs command execution or can be answered conversationally."""
         Returns:
             Natural language response string
         """
-        system_prompt = """You are a helpful Linux terminal assistant. Provide clear, friendly, and informative responses.
+        request = self._conversational_request(user_query, command_results, working_directory, conversation_history)
 
-Guidelines:
-- Be conversational and natural, like ChatGPT
-- Explain things clearly without being overly technical
-- If command results are provided, summarize them in a user-friendly way
-- Answer questions about Linux, commands, and terminal usage
-- Be concise but thorough
-"""
+        try:
+            response = self.client.chat.completions.create(**request)
+
+            return response.choices[0].message.content.strip()
+
+        except Exception as e:
+            return f"I encountered an error while generating a response: {str(e)}"
+
+    async def agenerate_conversational_response(
+        self,
+        user_query: str,
+        command_results: Optional[List[Dict[str, Any]]] = None,
+        working_directory: Optional[str] = None,
+        conversation_history: Optional[List[str]] = None
+    ) -> str:
+        """Async counterpart of generate_conversational_response()"""
+        request = self._conversational_request(user_query, command_results, working_directory, conversation_history)
+
+        try:
+            response = await self.acomplete(**request)
+
+            return response.choices[0].message.content.strip()
+
+        except Exception as e:
+            return f"I encountered an error while generating a response: {str(e)}"
+
+    def stream_conversational_response(
+        self,
+        user_query: str,
+        command_results: Optional[List[Dict[str, Any]]] = None,
+        working_directory: Optional[str] = None,
+        conversation_history: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """Like generate_conversational_response(), but yields the text as it arrives"""
+        request = self._conversational_request(user_query, command_results, working_directory, conversation_history)
+
+        try:
+            for chunk in self.client.chat.completions.create(stream=True, **request):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            yield f"I encountered an error while generating a response: {str(e)}"
+
+    async def astream_conversational_response(
+        self,
+        user_query: str,
+        command_results: Optional[List[Dict[str, Any]]] = None,
+        working_directory: Optional[str] = None,
+        conversation_history: Optional[List[str]] = None
+    ) -> AsyncIterator[str]:
+        """Async counterpart of stream_conversational_response()"""
+        request = self._conversational_request(user_query, command_results, working_directory, conversation_history)
+
+        try:
+            stream = await self.acomplete(stream=True, **request)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            yield f"I encountered an error while generating a response: {str(e)}"
+
+    def _conversational_request(
+        self,
+        user_query: str,
+        command_results: Optional[List[Dict[str, Any]]],
+        working_directory: Optional[str],
+        conversation_history: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Build the chat completion arguments for a conversational response"""
+        system_prompt = _STATIC_SYSTEM_CONVERSATIONAL
 
         user_prompt = f"""User query: "{user_query}"
 """
@@ -414,49 +713,26 @@ Guidelines:
             file_context = self._get_file_context(working_directory)
             if file_context:
                 user_prompt += f"\n\nCurrent directory context: {file_context}"
-        
-        # Add conversation context if available
-        if conversation_history and len(conversation_history) > 0:
-            user_prompt += "\n\nPrevious conversation context (for reference):\n"
-            for turn in conversation_history[-5:]:
-                user_prompt += f"  {turn}\n"
-
-        # Build messages with conversation history
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add conversation history if provided
-        if conversation_history:
-            for turn in conversation_history[-10:]:  # Last 10 turns for context
-                if turn.startswith("User:"):
-                    messages.append({"role": "user", "content": turn[5:].strip()})
-                elif turn.startswith("AI:"):
-                    messages.append({"role": "assistant", "content": turn[3:].strip()})
-        
-        messages.append({"role": "user", "content": user_prompt})
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=messages,
-                temperature=0.7,  # Higher temperature for more natural responses
-                max_tokens=800  # More tokens for conversational responses
-            )
 
-            return response.choices[0].message.content.strip()
+        messages = self.build_messages(system_prompt, user_prompt, conversation_history)
 
-        except Exception as e:
-            return f"I encountered an error while generating a response: {str(e)}"
+        return {
+            "model": self._model,
+            "messages": messages,
+            "temperature": 0.7,  # Higher temperature for more natural responses
+            "max_tokens": 800  # More tokens for conversational responses
+        }
 
     def _parse_analysis_response(self, content: str) -> Dict[str, Any]:
         """Parse the query analysis response"""
         try:
-            result = json.loads(content.strip())
+            result = parse_llm_json(content)
             return {
                 "needs_execution": result.get("needs_execution", True),
                 "reason": result.get("reason", ""),
                 "query_type": result.get("query_type", "command_request")
             }
-        except json.JSONDecodeError:
+        except JSONDecodeError:
             # Try to extract information from text response
             content_lower = content.lower()
             needs_execution = any(keyword in content_lower for keyword in [
@@ -292,8 +292,7 @@ Explain:
 4. How to interpret the numbers"""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": "You are a network diagnostic expert. Explain network test results clearly."},
                     {"role": "user", "content": prompt}
@@ -321,8 +320,7 @@ Explain:
 4. What the results indicate"""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": "You are a network diagnostic expert."},
                     {"role": "user", "content": prompt}
@@ -354,8 +352,7 @@ Explain:
 4. How to troubleshoot"""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": "You are a network security and diagnostic expert."},
                     {"role": "user", "content": prompt}
@@ -385,8 +382,7 @@ Explain:
 4. What this tells us about the hostname"""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": "You are a DNS and network expert."},
                     {"role": "user", "content": prompt}
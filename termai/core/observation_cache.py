@@ -0,0 +1,85 @@
+"""Cache of the ReAct agent's directory observations
+
+The ReAct loop observes the working directory before and after every action.
+Between the "after action" observation of one iteration and the "before
+action" observation of the next nothing runs but LLM calls, and read-only
+actions (ls, cat, grep, ...) don't change the directory either, so the
+listing can be reused instead of re-scanning and re-stat'ing every entry.
+
+The cached listing is keyed on the directory path and its st_mtime_ns, which
+changes whenever an entry is created, removed or renamed. Rewriting an
+existing file doesn't touch the directory's mtime, so callers must also
+invalidate() the cache after any action that may write.
+"""
+
+import os
+from typing import Any, Dict, Optional, Tuple
+
+
+def snapshot(directory: str) -> Dict[str, Any]:
+    """
+    List a directory with a single scandir pass
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Dict with sorted "files" and "directories" names and "file_sizes"
+    """
+    files = []
+    dirs = []
+    file_sizes = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                try:
+                    if entry.is_file():
+                        files.append(entry.name)
+                        file_sizes[entry.name] = entry.stat().st_size
+                    elif entry.is_dir():
+                        dirs.append(entry.name)
+                except OSError:
+                    # Entry vanished or can't be stat'ed; skip it
+                    pass
+    except OSError:
+        pass
+
+    return {
+        "files": files,
+        "directories": dirs,
+        "file_sizes": file_sizes
+    }
+
+
+class ObservationCache:
+    """Reuse the last directory snapshot while nothing can have changed"""
+
+    def __init__(self):
+        """Initialize an empty cache"""
+        self._key: Optional[Tuple[str, int]] = None
+        self._snapshot: Dict[str, Any] = {}
+
+    def get(self, directory: str) -> Dict[str, Any]:
+        """
+        Return the directory snapshot, re-scanning only if it may have changed
+
+        Args:
+            directory: Directory to observe
+
+        Returns:
+            Snapshot dict as returned by snapshot()
+        """
+        try:
+            key = (directory, os.stat(directory).st_mtime_ns)
+        except OSError:
+            self.invalidate()
+            return snapshot(directory)
+
+        if key != self._key:
+            self._snapshot = snapshot(directory)
+            self._key = key
+        return self._snapshot
+
+    def invalidate(self):
+        """Force the next get() to re-scan (call after actions that may write)"""
+        self._key = None
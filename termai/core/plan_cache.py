@@ -0,0 +1,254 @@
+"""Similarity-keyed cache of previous plans and responses
+
+Repeated goals such as "check git status" or "organize text files" are
+otherwise re-planned from scratch on every run. Entries are stored in
+~/.termai/plan_cache.sqlite and looked up by cosine similarity of the query.
+Embeddings come from fastembed when it is installed; otherwise a lexical
+bag-of-words vector is used. Neither is reliable about word order, so entries
+that are replayed verbatim are looked up by exact query instead.
+
+Identical LLM requests (same model, arguments and prompt) are also cached
+by hash in a separate table, so a repeated goal can skip the request
+altogether. Those entries expire after RESPONSE_TTL seconds.
+
+The cache is opt-in: set TERMA_PLAN_CACHE=1 to enable it.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    from fastembed import TextEmbedding
+except ImportError:
+    TextEmbedding = None
+
+
+DEFAULT_MODEL = "BAAI/bge-small-en-v1.5"
+DEFAULT_THRESHOLD = 0.90
+MAX_ENTRIES_PER_KIND = 500
+MAX_RESPONSES = 1000
+RESPONSE_TTL = 24 * 60 * 60
+
+_TOKEN_RE = re.compile(r"[a-z0-9_.\-/]+")
+# Filler words that shouldn't make two otherwise identical goals look different
+_STOPWORDS = frozenset({"a", "an", "the", "my", "all", "in", "of", "to", "and", "for", "please", "me"})
+
+Vector = Union[List[float], Dict[str, float]]
+
+
+def plan_cache_enabled() -> bool:
+    """Whether the plan cache has been switched on via TERMA_PLAN_CACHE"""
+    return os.getenv("TERMA_PLAN_CACHE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _normalize(text: str) -> str:
+    """Lower-case a query and collapse its whitespace"""
+    return " ".join(text.lower().split())
+
+
+def _cosine(a: Vector, b: Vector) -> float:
+    """Cosine similarity of two dense (list) or sparse (dict) vectors"""
+    if isinstance(a, dict):
+        if len(a) > len(b):
+            a, b = b, a
+        dot = sum(weight * b.get(token, 0.0) for token, weight in a.items())
+        norm_a = math.sqrt(sum(w * w for w in a.values()))
+        norm_b = math.sqrt(sum(w * w for w in b.values()))
+    else:
+        dot = sum(x * y for x, y in zip(a, b))
+        norm_a = math.sqrt(sum(x * x for x in a))
+        norm_b = math.sqrt(sum(y * y for y in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class PlanCache:
+    """On-disk cache of plans/responses keyed by query similarity"""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        threshold: float = DEFAULT_THRESHOLD,
+        model_name: str = DEFAULT_MODEL
+    ):
+        """Initialize the plan cache"""
+        if db_path is None:
+            cache_dir = Path.home() / ".termai"
+            cache_dir.mkdir(exist_ok=True)
+            db_path = str(cache_dir / "plan_cache.sqlite")
+
+        self.db_path = db_path
+        self.threshold = threshold
+        self.model_name = model_name
+        self._model = None
+        self.embedder = f"fastembed:{model_name}" if TextEmbedding is not None else "lexical"
+
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS plans (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                embedder TEXT NOT NULL,
+                query TEXT NOT NULL,
+                vector TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS plans_kind ON plans (kind, embedder)")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls, disabled: bool = False) -> Optional["PlanCache"]:
+        """Return a cache if TERMA_PLAN_CACHE is set (and not disabled), else None"""
+        if disabled or not plan_cache_enabled():
+            return None
+        try:
+            return cls()
+        except (OSError, sqlite3.Error):
+            # The cache is an optimisation; never fail a command over it
+            return None
+
+    def _embed(self, text: str) -> Vector:
+        """Embed a query with fastembed, or as a lexical token vector"""
+        text = _normalize(text)
+        if TextEmbedding is not None:
+            if self._model is None:
+                self._model = TextEmbedding(model_name=self.model_name)
+            return [float(x) for x in next(iter(self._model.embed([text])))]
+        tokens = [t for t in _TOKEN_RE.findall(text) if t not in _STOPWORDS]
+        return {token: float(count) for token, count in Counter(tokens).items()}
+
+    def lookup(self, kind: str, query: str, exact: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Find the most similar cached entry for a query
+
+        Args:
+            kind: Entry namespace ("goal", "react", "conversational", ...)
+            query: Goal or question to look up
+            exact: Only match the same query (ignoring case and whitespace).
+                Use this when the payload is replayed as-is: similarity
+                ignores word order, so "convert jpg to png" would match
+                "convert png to jpg".
+
+        Returns:
+            Dict with "query", "payload" and "similarity", or None on a miss
+        """
+        if exact:
+            return self._lookup_exact(kind, query)
+        try:
+            vector = self._embed(query)
+            rows = self._conn.execute(
+                "SELECT query, vector, payload FROM plans WHERE kind = ? AND embedder = ? "
+                "ORDER BY id DESC LIMIT ?",
+                (kind, self.embedder, MAX_ENTRIES_PER_KIND)
+            ).fetchall()
+        except (sqlite3.Error, ValueError):
+            return None
+
+        best = None
+        best_score = self.threshold
+        for cached_query, cached_vector, payload in rows:
+            score = _cosine(vector, json.loads(cached_vector))
+            if score >= best_score:
+                best, best_score = (cached_query, payload), score
+
+        if best is None:
+            return None
+        return {
+            "query": best[0],
+            "payload": json.loads(best[1]),
+            "similarity": best_score
+        }
+
+    def _lookup_exact(self, kind: str, query: str) -> Optional[Dict[str, Any]]:
+        """The most recent entry whose normalized query equals query's"""
+        normalized = _normalize(query)
+        try:
+            rows = self._conn.execute(
+                "SELECT query, payload FROM plans WHERE kind = ? AND embedder = ? "
+                "ORDER BY id DESC LIMIT ?",
+                (kind, self.embedder, MAX_ENTRIES_PER_KIND)
+            ).fetchall()
+        except sqlite3.Error:
+            return None
+
+        for cached_query, payload in rows:
+            if _normalize(cached_query) == normalized:
+                return {"query": cached_query, "payload": json.loads(payload), "similarity": 1.0}
+        return None
+
+    def store(self, kind: str, query: str, payload: Any):
+        """Store (or replace) the plan/response for a query"""
+        try:
+            vector = self._embed(query)
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM plans WHERE kind = ? AND embedder = ? AND query = ?",
+                    (kind, self.embedder, query)
+                )
+                self._conn.execute(
+                    "INSERT INTO plans (kind, embedder, query, vector, payload, created) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (kind, self.embedder, query, json.dumps(vector), json.dumps(payload), time.time())
+                )
+                # Keep only the most recent entries per kind
+                self._conn.execute(
+                    "DELETE FROM plans WHERE kind = ? AND id NOT IN "
+                    "(SELECT id FROM plans WHERE kind = ? ORDER BY id DESC LIMIT ?)",
+                    (kind, kind, MAX_ENTRIES_PER_KIND)
+                )
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
+    @staticmethod
+    def response_key(*parts: Any) -> str:
+        """Hash the parts of an LLM request (model, arguments, prompts) into a cache key"""
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+    def get_response(self, key: str, max_age: float = RESPONSE_TTL) -> Optional[Any]:
+        """Return the cached result of an identical request, or None if missing or expired"""
+        try:
+            row = self._conn.execute(
+                "SELECT payload FROM responses WHERE key = ? AND created > ?",
+                (key, time.time() - max_age)
+            ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def put_response(self, key: str, payload: Any):
+        """Cache the result of a request under a response_key()"""
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, payload, created) VALUES (?, ?, ?)",
+                    (key, json.dumps(payload), time.time())
+                )
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY created DESC LIMIT ?)",
+                    (MAX_RESPONSES,)
+                )
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
+    def close(self):
+        """Close the underlying database connection"""
+        self._conn.close()
@@ -1,11 +1,11 @@
 """Multi-step task planner for complex operations"""
 
-import json
 from typing import List, Dict, Any, Optional
 from .llm import LLMClient
 from .safety import SafetyChecker
 from .executor import CommandExecutor
 from .display import DisplayManager
+from .json_utils import JSONDecodeError, parse_llm_json
 
 
 class TaskPlanner:
@@ -30,8 +30,7 @@ class TaskPlanner:
         planning_prompt = self._get_planning_prompt(user_request)
         
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": self._get_planning_system_prompt()},
                     {"role": "user", "content": planning_prompt}
@@ -178,20 +177,8 @@ Return only valid JSON with the plan."""
     def _parse_plan(self, content: str) -> Dict[str, Any]:
         """Parse LLM response into plan structure"""
         try:
-            # Try to extract JSON from response
-            content = content.strip()
-            
-            # Find JSON block if wrapped in markdown
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            
-            plan = json.loads(content)
+            # Models sometimes wrap the JSON in a code fence or add prose around it
+            plan = parse_llm_json(content)
             
             # Validate structure
             if not isinstance(plan, dict):
@@ -209,7 +196,7 @@ Return only valid JSON with the plan."""
             
             return plan
             
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             return {
                 "error": f"Invalid JSON in plan response: {str(e)}",
                 "steps": [],
@@ -5,6 +5,12 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    # libyaml's C loader (PyYAML wheels include it); same safe subset of YAML
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Preferences:
     """Manage user preferences for Terma AI"""
@@ -35,8 +41,9 @@ class Preferences:
         """Load preferences from file"""
         if os.path.exists(self.prefs_file):
             try:
-                with open(self.prefs_file, 'r') as f:
-                    loaded = yaml.safe_load(f) or {}
+                # Binary, so libyaml reads the bytes itself instead of through a text wrapper
+                with open(self.prefs_file, 'rb') as f:
+                    loaded = yaml.load(f, Loader=_YamlLoader) or {}
                     # Merge with defaults
                     prefs = self.DEFAULT_PREFS.copy()
                     prefs.update(loaded)
@@ -57,6 +64,10 @@ class Preferences:
         except Exception as e:
             raise Exception(f"Failed to save preferences: {e}")
 
+    def reload(self):
+        """Re-read preferences from disk, discarding in-memory state"""
+        self.prefs = self._load_preferences()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a preference value"""
         return self.prefs.get(key, default)
@@ -0,0 +1,72 @@
+"""Client-side rate limiting and retry for LLM requests"""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per `period` seconds
+
+    Used as ``async with limiter:``. The bucket starts full, so short bursts
+    up to `rate` go through immediately. It holds no loop-bound primitives
+    and can be shared across successive event loops.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        """Initialize the limiter"""
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self.capacity = float(rate)
+        self.fill_rate = rate / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait until a request may be made"""
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+async def retry_with_backoff(
+    call: Callable[[], Awaitable[T]],
+    retry_on: Tuple[Type[BaseException], ...],
+    attempts: int = 5,
+    initial: float = 1.0,
+    maximum: float = 30.0
+) -> T:
+    """
+    Await call(), retrying on the given exceptions with exponential backoff
+
+    The delay doubles from `initial` up to `maximum`, plus up to a second of
+    random jitter so concurrent callers don't retry in lockstep.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except retry_on:
+            attempt += 1
+            if attempt >= attempts:
+                raise
+            await asyncio.sleep(min(maximum, initial * 2 ** (attempt - 1)) + random.uniform(0, 1))
@@ -10,11 +10,10 @@ Implements a fully agentic system that:
 7. Loops until goal is achieved or determined impossible
 """
 
+import asyncio
 import json
 import time
-import os
 from typing import Dict, Any, List, Optional
-from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -24,18 +23,41 @@ from .llm import LLMClient
 from .safety import SafetyChecker
 from .executor import CommandExecutor
 from .display import DisplayManager
+from .plan_cache import PlanCache
+from .observation_cache import ObservationCache
+from .json_utils import JSONDecodeError, parse_llm_json
+
+
+# System prompts are kept static (per-step data goes in the user message)
+# so consecutive requests share a cacheable prompt prefix
+_STATIC_SYSTEM_REACT_PLAN = "You are a ReAct planning agent. Create structured todo lists for goal achievement."
+_STATIC_SYSTEM_REACT_UPDATE = "You are a ReAct planning agent. Update todo lists based on observations."
+_STATIC_SYSTEM_REACT_REASON = "You are a ReAct reasoning agent. Analyze situations and determine if goals are achieved."
+_STATIC_SYSTEM_REACT_ACT = "You are a ReAct planning agent. Plan safe, specific bash commands to achieve goals."
+_STATIC_SYSTEM_REACT_SUMMARY = "You are a helpful assistant. Provide clear, friendly, conversational summaries."
+
+
+# Upper bound on planned actions executed concurrently within one group
+MAX_PARALLEL_ACTIONS = 5
 
 
 class ReActAgent:
     """Fully agentic ReAct agent with todo list management"""
 
-    def __init__(self, llm_client: Optional[LLMClient] = None, working_directory: Optional[str] = None):
+    def __init__(
+        self,
+        llm_client: Optional[LLMClient] = None,
+        working_directory: Optional[str] = None,
+        plan_cache: Optional[PlanCache] = None
+    ):
         """Initialize the ReAct agent"""
         self.console = Console()
+        self.plan_cache = plan_cache
         self.llm_client = llm_client or LLMClient()
         self.safety_checker = SafetyChecker()
         self.executor = CommandExecutor(working_directory=working_directory)
         self.display = DisplayManager()
+        self.observation_cache = ObservationCache()
         
         # Agent state
         self.goal = ""
@@ -72,6 +94,7 @@ class ReActAgent:
         self.action_history = []
         self.reasoning_history = []
         self.todo_list = []
+        self.observation_cache.invalidate()
         
         # Initial observation
         initial_state = self._observe()
@@ -188,25 +211,23 @@ class ReActAgent:
                 if verbose:
                     self.console.print(f"\n[bold green]⚡ Acting:[/bold green]")
                 
-                action_results = []
-                for i, action in enumerate(actions, 1):
-                    if verbose and len(actions) > 1:
-                        self.console.print(f"\n[dim]Action {i}/{len(actions)}:[/dim]")
-                    
-                    action_result = self._act(action, auto_confirm, verbose)
-                    action_results.append(action_result)
+                action_results = asyncio.run(self._execute_plan(actions, auto_confirm, verbose))
+                # Read-only actions leave the directory as it was; anything else
+                # may have rewritten files without changing the directory mtime
+                if not all(self.safety_checker.is_read_only(a.get("command", "")) for a in actions):
+                    self.observation_cache.invalidate()
+                for action, action_result in zip(actions, action_results):
                     self.action_history.append({
                         "iteration": self.current_iteration,
                         "action": action,
                         "result": action_result
                     })
-                    
-                    # If action failed critically, break
-                    if action_result.get("critical_failure", False):
-                        if verbose:
-                            self.console.print(f"[red]❌ Critical failure, stopping[/red]")
-                        goal_impossible = True
-                        break
+                
+                # If action failed critically, stop
+                if any(r.get("critical_failure", False) for r in action_results):
+                    if verbose:
+                        self.console.print(f"[red]❌ Critical failure, stopping[/red]")
+                    goal_impossible = True
                 
                 # Step 6: OBSERVE - Check the new state after action
                 new_state = self._observe()
@@ -267,24 +288,8 @@ class ReActAgent:
         """Observe the current state of the system - updated at each iteration"""
         working_dir = self.executor.get_working_directory()
         
-        # Get file system state
-        files = []
-        dirs = []
-        file_sizes = {}
-        try:
-            path = Path(working_dir)
-            if path.exists() and path.is_dir():
-                for item in sorted(path.iterdir()):
-                    if item.is_file():
-                        files.append(item.name)
-                        try:
-                            file_sizes[item.name] = item.stat().st_size
-                        except:
-                            pass
-                    elif item.is_dir():
-                        dirs.append(item.name)
-        except Exception:
-            pass
+        # Get file system state (reused while the directory is unchanged)
+        listing = self.observation_cache.get(working_dir)
         
         # Get recent command outputs (last 5)
         recent_outputs = []
@@ -306,9 +311,9 @@ class ReActAgent:
         
         return {
             "working_directory": working_dir,
-            "files": files[:30],  # Increased limit
-            "directories": dirs[:15],
-            "file_sizes": file_sizes,
+            "files": listing["files"][:30],  # Increased limit
+            "directories": listing["directories"][:15],
+            "file_sizes": dict(listing["file_sizes"]),
             "recent_outputs": recent_outputs,
             "completed_todos": completed_todos,
             "total_todos": total_todos,
@@ -352,16 +357,19 @@ Return as JSON:
 
 Aim for 3-7 todos that can be completed in 2-3 iterations mostly."""
 
+        cached = self.plan_cache.lookup("react", goal) if self.plan_cache else None
+        if cached:
+            self.console.print(f"[dim]♻️  Adapting cached todo list for a similar goal: {cached['query']}[/dim]")
+            prompt += f"""
+
+A todo list was previously made for the similar goal "{cached['query']}":
+{json.dumps(cached['payload'], indent=2)}
+
+Adapt this todo list to the current goal and state instead of planning from scratch."""
+
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a ReAct planning agent. Create structured todo lists for goal achievement."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
+            response = self.llm_client.chat(
+                messages=self.llm_client.build_messages(_STATIC_SYSTEM_REACT_PLAN, prompt),
                 temperature=0.3,
                 max_tokens=600
             )
@@ -370,6 +378,8 @@ Aim for 3-7 todos that can be completed in 2-3 iterations mostly."""
             result = self._parse_json_response(content)
             
             todos = result.get("todos", [])
+            if self.plan_cache and todos:
+                self.plan_cache.store("react", goal, {"todos": todos})
             for todo in todos:
                 todo["completed"] = False
             
@@ -434,15 +444,8 @@ Return as JSON:
 }}"""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a ReAct planning agent. Update todo lists based on observations."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
+            response = self.llm_client.chat(
+                messages=self.llm_client.build_messages(_STATIC_SYSTEM_REACT_UPDATE, prompt),
                 temperature=0.3,
                 max_tokens=600
             )
@@ -516,15 +519,8 @@ Return as JSON:
 }}"""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a ReAct reasoning agent. Analyze situations and determine if goals are achieved."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
+            response = self.llm_client.chat(
+                messages=self.llm_client.build_messages(_STATIC_SYSTEM_REACT_REASON, prompt),
                 temperature=0.4,
                 max_tokens=500
             )
@@ -587,22 +583,18 @@ Return as JSON:
       "command": "bash command to execute",
       "description": "What this command does",
       "expected_outcome": "What should happen if this succeeds",
-      "todo_id": {next_todo.get('id') if next_todo else None}
+      "todo_id": {next_todo.get('id') if next_todo else None},
+      "parallel_safe": false
     }}
   ],
   "no_action_needed": false
-}}"""
+}}
+
+Set "parallel_safe" to true only for read-only commands that don't depend on another action in this plan."""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a ReAct planning agent. Plan safe, specific bash commands to achieve goals."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
+            response = self.llm_client.chat(
+                messages=self.llm_client.build_messages(_STATIC_SYSTEM_REACT_ACT, prompt),
                 temperature=0.3,
                 max_tokens=400
             )
@@ -617,6 +609,81 @@ Return as JSON:
                 "error": str(e)
             }
 
+    async def _execute_plan(
+        self,
+        actions: List[Dict[str, Any]],
+        auto_confirm: bool,
+        verbose: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute planned actions, running independent ones concurrently
+
+        Actions are grouped (see _group_actions); groups run in order and the
+        actions within a group run in parallel, bounded by MAX_PARALLEL_ACTIONS.
+        Execution stops after a group that had a critical failure.
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_ACTIONS)
+
+        async def run_with_sem(action: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(self._run_action, action)
+
+        results: List[Dict[str, Any]] = []
+        for group in self._group_actions(actions):
+            if verbose and len(group) > 1:
+                self.console.print(f"\n[dim]Running {len(group)} independent actions in parallel[/dim]")
+
+            # Confirmation prompts are interactive, so they happen up front and in order
+            pending = []
+            group_results: List[Optional[Dict[str, Any]]] = []
+            for action in group:
+                if verbose and len(actions) > 1:
+                    self.console.print(f"\n[dim]Action {len(results) + len(group_results) + 1}/{len(actions)}:[/dim]")
+                skipped = self._prepare_action(action, auto_confirm, verbose)
+                group_results.append(skipped)
+                if skipped is None:
+                    pending.append(action)
+
+            outcomes = await asyncio.gather(*(run_with_sem(a) for a in pending), return_exceptions=True)
+            outcomes = iter(outcomes)
+            for i, action in enumerate(group):
+                if group_results[i] is not None:
+                    continue
+                outcome = next(outcomes)
+                if isinstance(outcome, BaseException):
+                    outcome = {"success": False, "stderr": f"Execution error: {str(outcome)}"}
+                group_results[i] = self._action_result(action, outcome, verbose)
+
+            results.extend(group_results)
+            if any(r.get("critical_failure", False) for r in group_results):
+                break
+
+        return results
+
+    def _group_actions(self, actions: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Split actions into consecutive groups that are safe to run concurrently
+
+        Adjacent actions share a group when the model flagged them parallel_safe
+        and the command is plain and read-only (executor.are_independent);
+        anything else, including every command that writes, runs on its own.
+        """
+        groups: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+
+        for action in actions:
+            if action.get("parallel_safe", False) and self.executor.are_independent([action.get("command", "")]):
+                current.append(action)
+                continue
+            if current:
+                groups.append(current)
+                current = []
+            groups.append([action])
+
+        if current:
+            groups.append(current)
+        return groups
+
     def _act(
         self, 
         action: Dict[str, Any],
@@ -624,6 +691,18 @@ Return as JSON:
         verbose: bool
     ) -> Dict[str, Any]:
         """Execute an action (command)"""
+        skipped = self._prepare_action(action, auto_confirm, verbose)
+        if skipped is not None:
+            return skipped
+        return self._action_result(action, self._run_action(action), verbose)
+
+    def _prepare_action(
+        self,
+        action: Dict[str, Any],
+        auto_confirm: bool,
+        verbose: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Safety-check an action; returns a result if it must not run, else None"""
         
         command = action.get("command", "")
         description = action.get("description", "")
@@ -664,20 +743,25 @@ Return as JSON:
                         "reason": "User cancelled risky action",
                         "critical_failure": False
                     }
-        
-        # Execute command
-        execution_result = self.executor.execute_commands([command], [description])
-        result = execution_result["results"][0] if execution_result["results"] else {}
-        
+
+        return None
+
+    def _run_action(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute an action's command and return the executor result"""
+        execution_result = self.executor.execute_commands([action.get("command", "")], [action.get("description", "")])
+        return execution_result["results"][0] if execution_result["results"] else {}
+
+    def _action_result(self, action: Dict[str, Any], result: Dict[str, Any], verbose: bool) -> Dict[str, Any]:
+        """Report an executed action and build its result"""
         if verbose:
             if result.get("success"):
-                self.console.print(f"    [green]✓ Success[/green]")
+                self.console.print(f"    [green]✓ Success[/green] [dim]{action.get('command', '')}[/dim]")
                 if result.get("stdout"):
                     output = result.get("stdout", "").strip()
                     if output and len(output) < 200:
                         self.console.print(f"      [dim]{output}[/dim]")
             else:
-                self.console.print(f"    [red]✗ Failed[/red]")
+                self.console.print(f"    [red]✗ Failed[/red] [dim]{action.get('command', '')}[/dim]")
                 if result.get("stderr"):
                     self.console.print(f"      [dim]Error: {result.get('stderr', '')[:200]}[/dim]")
         
@@ -780,15 +864,8 @@ Provide a friendly, natural language response that:
 Write as if you're explaining to a friend what happened."""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant. Provide clear, friendly, conversational summaries."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
+            response = self.llm_client.chat(
+                messages=self.llm_client.build_messages(_STATIC_SYSTEM_REACT_SUMMARY, prompt),
                 temperature=0.7,
                 max_tokens=600
             )
@@ -801,22 +878,9 @@ Write as if you're explaining to a friend what happened."""
     def _parse_json_response(self, content: str) -> Dict[str, Any]:
         """Parse JSON response from LLM"""
         try:
-            content = content.strip()
-            
-            # Extract JSON from markdown code blocks
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                if end > start:
-                    content = content[start:end].strip()
-            
-            return json.loads(content)
+            return parse_llm_json(content)
             
-        except json.JSONDecodeError:
+        except JSONDecodeError:
             return {
                 "error": "Invalid JSON response",
                 "goal_achieved": False,
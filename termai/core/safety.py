@@ -18,7 +18,257 @@ SAFE COMMANDS (Auto-execute):
 """
 
 import re
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Generic, Optional, Pattern, Tuple, TypeVar
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+T = TypeVar("T")
+
+
+# Patterns for dangerous commands that require confirmation, in priority order
+# (the first match provides the reason shown to the user).
+DANGEROUS_PATTERNS: List[Tuple[str, str]] = [
+    # ===== FILE DELETION (RISKY CATEGORY 1) =====
+    (r'\brm\s+-rf\s+/', "CRITICAL: 'rm -rf /' can destroy entire system"),
+    (r'\brm\s+-rf\s+\*', "CRITICAL: 'rm -rf *' can delete all files"),
+    (r'\brm\s+-rf\b', "HIGH: Recursive deletion can remove multiple files"),
+    (r'\brm\s+', "MEDIUM: File deletion - data cannot be recovered easily"),
+    (r'\bunlink\b', "MEDIUM: File deletion command"),
+    (r'\bdelete\b', "MEDIUM: File deletion operation"),
+
+    # ===== FILE MODIFICATION (RISKY CATEGORY 2) =====
+    (r'\bmv\s+', "MEDIUM: Moving/renaming files can overwrite existing files"),
+    (r'\bcp\s+', "LOW-MEDIUM: Copying files can overwrite existing files"),
+    (r'\bchmod\s+', "MEDIUM: Changing file permissions"),
+    (r'\bchown\s+', "MEDIUM: Changing file ownership"),
+    (r'\bchgrp\s+', "MEDIUM: Changing file group"),
+    (r'\btouch\s+', "LOW: Creating/modifying file timestamps"),
+
+    # ===== FILE WRITING/OVERWRITING (RISKY CATEGORY 3) =====
+    (r'>\s+', "MEDIUM: Redirecting output can overwrite files"),
+    (r'>>\s+', "LOW: Appending to files (safer but still modification)"),
+    (r'\btee\s+', "MEDIUM: Writing to files"),
+
+    # ===== SYSTEM DESTRUCTION (RISKY CATEGORY 4 - CRITICAL) =====
+    (r'\bdd\s+if=/dev/zero', "CRITICAL: 'dd if=/dev/zero' can overwrite disks"),
+    (r'\bmkfs\b', "CRITICAL: Filesystem formatting can destroy data"),
+    (r'\bfdisk\b', "CRITICAL: Disk partitioning can destroy data"),
+    (r'\bparted\b', "CRITICAL: Partition editing can destroy data"),
+    (r'\bformat\b', "CRITICAL: Formatting can destroy data"),
+
+    # ===== PRIVILEGE ESCALATION (RISKY CATEGORY 5) =====
+    (r'\bsudo\b', "HIGH: Sudo commands require elevated privileges"),
+    (r'\bsu\b', "HIGH: Privilege escalation"),
+    (r'\bdoas\b', "HIGH: Privilege escalation"),
+
+    # ===== SYSTEM FILE MODIFICATION (RISKY CATEGORY 6) =====
+    (r'>\s*/etc/', "CRITICAL: Modifying system configuration files"),
+    (r'>\s*/boot/', "CRITICAL: Modifying boot files"),
+    (r'>\s*/bin/', "CRITICAL: Modifying system binaries"),
+    (r'>\s*/usr/bin/', "CRITICAL: Modifying system binaries"),
+    (r'>\s*/sbin/', "CRITICAL: Modifying system binaries"),
+    (r'>\s*/lib/', "CRITICAL: Modifying system libraries"),
+
+    # ===== DANGEROUS PERMISSIONS (RISKY CATEGORY 7) =====
+    (r'\bchmod\s+777\s+-R\b', "HIGH: Recursive 777 permissions are insecure"),
+    (r'\bchmod\s+777\b', "MEDIUM-HIGH: 777 permissions are insecure"),
+    (r'\bchown\s+root\b', "HIGH: Changing ownership to root"),
+    (r'\bchmod\s+-R\b', "MEDIUM: Recursive permission changes"),
+    (r'\bchown\s+-R\b', "MEDIUM: Recursive ownership changes"),
+
+    # ===== NETWORK/FIREWALL (RISKY CATEGORY 8) =====
+    (r'\biptables\s+-F', "HIGH: Flushing firewall rules"),
+    (r'\biptables\s+-X', "HIGH: Deleting firewall rules"),
+    (r'\bip\s+route\s+del', "MEDIUM: Deleting network routes"),
+
+    # ===== PROCESS MANAGEMENT (RISKY CATEGORY 9) =====
+    (r'\bkill\s+-9\s+-1', "CRITICAL: Killing all processes"),
+    (r'\bkillall\s+-9', "HIGH: Force killing all instances"),
+    (r'\bkill\s+-9\b', "MEDIUM: Force killing processes"),
+    (r'\bpkill\s+', "MEDIUM: Killing processes by name"),
+
+    # ===== PACKAGE MANAGEMENT (RISKY CATEGORY 10) =====
+    (r'\bapt\s+(remove|purge|autoremove)', "MEDIUM: Removing packages"),
+    (r'\byum\s+remove', "MEDIUM: Removing packages"),
+    (r'\bdnf\s+remove', "MEDIUM: Removing packages"),
+    (r'\bpacman\s+-R', "MEDIUM: Removing packages"),
+
+    # ===== DIRECTORY OPERATIONS (RISKY CATEGORY 11) =====
+    (r'\brmdir\s+', "MEDIUM: Removing directories"),
+    (r'\bmkdir\s+-p\s+/', "HIGH: Creating directories in system paths"),
+]
+
+# Patterns for commands that should have warnings
+WARNING_PATTERNS: List[Tuple[str, str]] = [
+    # Recursive operations
+    (r'\bchmod\s+-R\b', "Warning: recursive permission changes can be dangerous"),
+    (r'\bchown\s+-R\b', "Warning: recursive ownership changes can be dangerous"),
+
+    # Large file operations
+    (r'\bgrep\s+-r\b', "Warning: recursive grep on large directories may be slow"),
+    (r'\bfind\s+/\b', "Warning: searching from root may take a long time"),
+
+    # Network operations
+    (r'\bwget\b', "Warning: downloading files from internet"),
+    (r'\bcurl\b', "Warning: network requests can be slow or fail"),
+
+    # Package management (might need sudo)
+    (r'\bapt\b', "Warning: package management may require privileges"),
+    (r'\byum\b', "Warning: package management may require privileges"),
+    (r'\bdnf\b', "Warning: package management may require privileges"),
+    (r'\bpacman\b', "Warning: package management may require privileges"),
+]
+
+# Level 5 - System destruction
+_LEVEL5_PATTERNS = [
+    r'\brm\s+-rf\s+/',
+    r'\bdd\s+if=/dev/zero',
+    r'\bmkfs\b',
+    r'\bfdisk\b',
+    r'\bparted\b',
+    r'\bkill\s+-9\s+-1',
+]
+
+# Level 4 - Critical system modification
+_LEVEL4_PATTERNS = [
+    r'>\s*/etc/',
+    r'>\s*/boot/',
+    r'>\s*/bin/',
+    r'\bchmod\s+777\s+-R\s+/',
+    r'\bchown\s+root\s+/',
+]
+
+# Level 3 - System modification with sudo
+_LEVEL3_PATTERNS = [
+    r'\bsudo\b',
+    r'\biptables\s+-F',
+    r'\bchmod\s+777\s+-R\b',
+]
+
+# Level 2 - File deletion and modification operations
+_LEVEL2_PATTERNS = [
+    r'\brm\s+',  # Any rm command (file deletion)
+    r'\bunlink\b',  # File deletion
+    r'\bmv\s+',  # Moving files (can overwrite)
+    r'\bchmod\s+',  # Permission changes
+    r'\bchown\s+',  # Ownership changes
+    r'>\s+',  # File overwriting
+    r'\brmdir\s+',  # Directory removal
+]
+
+# Level 1 - Safe read operations (default)
+_READ_ONLY_PATTERNS = [
+    r'\bls\b', r'\bcat\b', r'\bfind\b', r'\bgrep\b', r'\bpwd\b',
+    r'\bdf\b', r'\bdu\b', r'\bhead\b', r'\btail\b', r'\bless\b',
+    r'\bmore\b', r'\bwc\b', r'\bstat\b', r'\bfile\b', r'\bwhich\b',
+    r'\bwhereis\b', r'\blocate\b', r'\btype\b', r'\bcommand\s+-v\b'
+]
+
+
+def _compile_first_match(named_patterns: List[Tuple[str, str]]) -> Pattern[str]:
+    """
+    Compile (name, pattern) pairs into one regex whose ``lastgroup`` names the
+    first pair, in list order, that matches anywhere in the string.
+
+    Each alternative is an anchored lookahead, so priority follows the list
+    order rather than the leftmost position in the command, and the whole
+    classification is a single ``match`` call.
+    """
+    alternatives = "|".join(f"(?=.*?(?P<{name}>{pattern}))" for name, pattern in named_patterns)
+    return re.compile(f"^(?:{alternatives})", re.IGNORECASE | re.DOTALL)
+
+
+def _alternation(patterns: List[str]) -> str:
+    """Join patterns into a single alternation"""
+    return "|".join(f"(?:{p})" for p in patterns)
+
+
+def _hyperscan_database(patterns: List[str]) -> Optional[Any]:
+    """
+    Compile patterns into a Hyperscan block-mode database
+
+    Returns None when hyperscan isn't installed or rejects a pattern, in which
+    case the caller falls back to ``re``.
+    """
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[pattern.encode() for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+        )
+        return database
+    except Exception:
+        return None
+
+
+class _RuleSet(Generic[T]):
+    """Ordered (pattern, value) rules compiled for fast first-match lookup"""
+
+    def __init__(self, rules: List[Tuple[str, T]]):
+        self.values = [value for _, value in rules]
+        patterns = [pattern for pattern, _ in rules]
+        # Hyperscan scans for all patterns in one pass over the command
+        self.database = _hyperscan_database(patterns)
+        if self.database is None:
+            names = [f"rule{i}" for i in range(len(rules))]
+            # Plain alternation: cheapest way to reject the common no-match case
+            self.any_re = re.compile(_alternation(patterns), re.IGNORECASE)
+            self.first_re = _compile_first_match(list(zip(names, patterns)))
+
+    def first(self, command: str) -> Optional[T]:
+        """Return the value of the first rule matching the command, if any"""
+        if self.database is not None:
+            matched = []
+            self.database.scan(
+                command.encode("utf-8", "replace"),
+                match_event_handler=lambda rule_id, start, end, flags, context: matched.append(rule_id)
+            )
+            return self.values[min(matched)] if matched else None
+
+        if not self.any_re.search(command):
+            return None
+        return self.values[int(self.first_re.match(command).lastgroup[4:])]
+
+
+# Compiled once at import time; checks run on every generated command.
+_DANGER_RULES = _RuleSet(DANGEROUS_PATTERNS)
+_WARNING_RULES = _RuleSet(WARNING_PATTERNS)
+
+# Severity tiers, highest first; a command scores as the first tier it hits.
+_SEVERITY_RULES = _RuleSet([
+    (_alternation(_LEVEL5_PATTERNS), 5),
+    (_alternation(_LEVEL4_PATTERNS), 4),
+    (_alternation(_LEVEL3_PATTERNS), 3),
+    (_alternation(_LEVEL2_PATTERNS), 2),
+    (_alternation(_READ_ONLY_PATTERNS), 1),
+])
+
+
+def _risk_score(command: str) -> int:
+    """Calculate the 1-5 risk score of a command"""
+    score = _SEVERITY_RULES.first(command)
+    # Default to level 2 for unknown commands (better safe than sorry)
+    return score if score is not None else 2
+
+
+def _level_from_score(score: int) -> str:
+    """Map a 1-5 risk score to its level category"""
+    if score >= 5:
+        return "CRITICAL"
+    elif score >= 4:
+        return "HIGH"
+    elif score >= 3:
+        return "MEDIUM-HIGH"
+    elif score >= 2:
+        return "MEDIUM"
+    else:
+        return "LOW"
 
 
 class SafetyChecker:
@@ -42,32 +292,37 @@ class SafetyChecker:
         risky_commands = []
         warnings = []
         safe_commands = []
+        safe_indices = []
 
-        for i, cmd in enumerate(commands):
-            is_risky, risk_reason = self._is_command_risky(cmd)
-            has_warning, warning_msg = self._has_command_warning(cmd)
+        # One Hyperscan pass (or a couple of C-level regex calls) per command
+        # instead of a Python loop over every pattern
+        risk_reasons = [_DANGER_RULES.first(cmd) for cmd in commands]
 
-            if is_risky:
-                risk_score = self._calculate_risk_score(cmd)
+        for i, (cmd, risk_reason) in enumerate(zip(commands, risk_reasons)):
+            if risk_reason:
+                risk_score = _risk_score(cmd)
                 risky_commands.append({
                     "index": i,
                     "command": cmd,
                     "reason": risk_reason,
-                    "risk_level": self._get_risk_level(cmd),
+                    "risk_level": _level_from_score(risk_score),
                     "risk_score": risk_score
                 })
             else:
                 safe_commands.append(cmd)
-                if has_warning:
+                safe_indices.append(i)
+                warning = _WARNING_RULES.first(cmd)
+                if warning:
                     warnings.append({
                         "index": i,
                         "command": cmd,
-                        "warning": warning_msg
+                        "warning": warning
                     })
 
         return {
             "safe": len(risky_commands) == 0,
             "safe_commands": safe_commands,
+            "safe_indices": safe_indices,  # Positions of safe_commands in the input list
             "risky_commands": risky_commands,  # Changed from blocked_commands
             "warnings": warnings,
             "total_commands": len(commands),
@@ -76,95 +331,20 @@ class SafetyChecker:
 
     def _is_command_risky(self, command: str) -> Tuple[bool, str]:
         """Check if a command is risky (requires extra confirmation)"""
-        for pattern, reason in self.dangerous_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return True, reason
-        return False, ""
+        reason = _DANGER_RULES.first(command)
+        return (True, reason) if reason else (False, "")
 
     def _calculate_risk_score(self, command: str) -> int:
         """Calculate risk score from 1-5 for a command"""
-        # Level 5 - System destruction
-        level5_patterns = [
-            r'\brm\s+-rf\s+/',
-            r'\bdd\s+if=/dev/zero',
-            r'\bmkfs\b',
-            r'\bfdisk\b',
-            r'\bparted\b',
-            r'\bkill\s+-9\s+-1',
-        ]
-        
-        # Level 4 - Critical system modification
-        level4_patterns = [
-            r'>\s*/etc/',
-            r'>\s*/boot/',
-            r'>\s*/bin/',
-            r'\bchmod\s+777\s+-R\s+/',
-            r'\bchown\s+root\s+/',
-        ]
-        
-        # Level 3 - System modification with sudo
-        level3_patterns = [
-            r'\bsudo\b',
-            r'\biptables\s+-F',
-            r'\bchmod\s+777\s+-R\b',
-        ]
-        
-        # Level 2 - File deletion and modification operations
-        level2_patterns = [
-            r'\brm\s+',  # Any rm command (file deletion)
-            r'\bunlink\b',  # File deletion
-            r'\bmv\s+',  # Moving files (can overwrite)
-            r'\bchmod\s+',  # Permission changes
-            r'\bchown\s+',  # Ownership changes
-            r'>\s+',  # File overwriting
-            r'\brmdir\s+',  # Directory removal
-        ]
-        
-        # Level 1 - Safe read operations (default)
-        read_only_patterns = [
-            r'\bls\b', r'\bcat\b', r'\bfind\b', r'\bgrep\b', r'\bpwd\b', 
-            r'\bdf\b', r'\bdu\b', r'\bhead\b', r'\btail\b', r'\bless\b',
-            r'\bmore\b', r'\bwc\b', r'\bstat\b', r'\bfile\b', r'\bwhich\b',
-            r'\bwhereis\b', r'\blocate\b', r'\btype\b', r'\bcommand\s+-v\b'
-        ]
-        
-        for pattern in level5_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return 5
-        
-        for pattern in level4_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return 4
-        
-        for pattern in level3_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return 3
-        
-        for pattern in level2_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return 2
-        
-        # Check if it's a read-only command
-        if any(re.search(pattern, command, re.IGNORECASE) for pattern in read_only_patterns):
-            return 1
-        
-        # Default to level 2 for unknown commands (better safe than sorry)
-        return 2
+        return _risk_score(command)
+
+    def is_read_only(self, command: str) -> bool:
+        """Whether a command only reads (lowest risk tier, no writes or redirects)"""
+        return self._calculate_risk_score(command) <= 1
 
     def _get_risk_level(self, command: str) -> str:
         """Get the risk level category of a command"""
-        score = self._calculate_risk_score(command)
-        
-        if score >= 5:
-            return "CRITICAL"
-        elif score >= 4:
-            return "HIGH"
-        elif score >= 3:
-            return "MEDIUM-HIGH"
-        elif score >= 2:
-            return "MEDIUM"
-        else:
-            return "LOW"
+        return _level_from_score(self._calculate_risk_score(command))
     
     def analyze_impact(self, command: str) -> Dict[str, Any]:
         """Analyze the potential impact of a command"""
@@ -204,105 +384,16 @@ class SafetyChecker:
 
     def _has_command_warning(self, command: str) -> Tuple[bool, str]:
         """Check if a command has warnings"""
-        for pattern, warning in self.warning_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return True, warning
-        return False, ""
+        warning = _WARNING_RULES.first(command)
+        return (True, warning) if warning else (False, "")
 
     def _get_dangerous_patterns(self) -> List[Tuple[str, str]]:
         """Get patterns for dangerous commands that require confirmation"""
-        return [
-            # ===== FILE DELETION (RISKY CATEGORY 1) =====
-            (r'\brm\s+-rf\s+/', "CRITICAL: 'rm -rf /' can destroy entire system"),
-            (r'\brm\s+-rf\s+\*', "CRITICAL: 'rm -rf *' can delete all files"),
-            (r'\brm\s+-rf\b', "HIGH: Recursive deletion can remove multiple files"),
-            (r'\brm\s+', "MEDIUM: File deletion - data cannot be recovered easily"),
-            (r'\bunlink\b', "MEDIUM: File deletion command"),
-            (r'\bdelete\b', "MEDIUM: File deletion operation"),
-            
-            # ===== FILE MODIFICATION (RISKY CATEGORY 2) =====
-            (r'\bmv\s+', "MEDIUM: Moving/renaming files can overwrite existing files"),
-            (r'\bcp\s+', "LOW-MEDIUM: Copying files can overwrite existing files"),
-            (r'\bchmod\s+', "MEDIUM: Changing file permissions"),
-            (r'\bchown\s+', "MEDIUM: Changing file ownership"),
-            (r'\bchgrp\s+', "MEDIUM: Changing file group"),
-            (r'\btouch\s+', "LOW: Creating/modifying file timestamps"),
-            
-            # ===== FILE WRITING/OVERWRITING (RISKY CATEGORY 3) =====
-            (r'>\s+', "MEDIUM: Redirecting output can overwrite files"),
-            (r'>>\s+', "LOW: Appending to files (safer but still modification)"),
-            (r'\btee\s+', "MEDIUM: Writing to files"),
-            
-            # ===== SYSTEM DESTRUCTION (RISKY CATEGORY 4 - CRITICAL) =====
-            (r'\bdd\s+if=/dev/zero', "CRITICAL: 'dd if=/dev/zero' can overwrite disks"),
-            (r'\bmkfs\b', "CRITICAL: Filesystem formatting can destroy data"),
-            (r'\bfdisk\b', "CRITICAL: Disk partitioning can destroy data"),
-            (r'\bparted\b', "CRITICAL: Partition editing can destroy data"),
-            (r'\bformat\b', "CRITICAL: Formatting can destroy data"),
-            
-            # ===== PRIVILEGE ESCALATION (RISKY CATEGORY 5) =====
-            (r'\bsudo\b', "HIGH: Sudo commands require elevated privileges"),
-            (r'\bsu\b', "HIGH: Privilege escalation"),
-            (r'\bdoas\b', "HIGH: Privilege escalation"),
-            
-            # ===== SYSTEM FILE MODIFICATION (RISKY CATEGORY 6) =====
-            (r'>\s*/etc/', "CRITICAL: Modifying system configuration files"),
-            (r'>\s*/boot/', "CRITICAL: Modifying boot files"),
-            (r'>\s*/bin/', "CRITICAL: Modifying system binaries"),
-            (r'>\s*/usr/bin/', "CRITICAL: Modifying system binaries"),
-            (r'>\s*/sbin/', "CRITICAL: Modifying system binaries"),
-            (r'>\s*/lib/', "CRITICAL: Modifying system libraries"),
-            
-            # ===== DANGEROUS PERMISSIONS (RISKY CATEGORY 7) =====
-            (r'\bchmod\s+777\s+-R\b', "HIGH: Recursive 777 permissions are insecure"),
-            (r'\bchmod\s+777\b', "MEDIUM-HIGH: 777 permissions are insecure"),
-            (r'\bchown\s+root\b', "HIGH: Changing ownership to root"),
-            (r'\bchmod\s+-R\b', "MEDIUM: Recursive permission changes"),
-            (r'\bchown\s+-R\b', "MEDIUM: Recursive ownership changes"),
-            
-            # ===== NETWORK/FIREWALL (RISKY CATEGORY 8) =====
-            (r'\biptables\s+-F', "HIGH: Flushing firewall rules"),
-            (r'\biptables\s+-X', "HIGH: Deleting firewall rules"),
-            (r'\bip\s+route\s+del', "MEDIUM: Deleting network routes"),
-            
-            # ===== PROCESS MANAGEMENT (RISKY CATEGORY 9) =====
-            (r'\bkill\s+-9\s+-1', "CRITICAL: Killing all processes"),
-            (r'\bkillall\s+-9', "HIGH: Force killing all instances"),
-            (r'\bkill\s+-9\b', "MEDIUM: Force killing processes"),
-            (r'\bpkill\s+', "MEDIUM: Killing processes by name"),
-            
-            # ===== PACKAGE MANAGEMENT (RISKY CATEGORY 10) =====
-            (r'\bapt\s+(remove|purge|autoremove)', "MEDIUM: Removing packages"),
-            (r'\byum\s+remove', "MEDIUM: Removing packages"),
-            (r'\bdnf\s+remove', "MEDIUM: Removing packages"),
-            (r'\bpacman\s+-R', "MEDIUM: Removing packages"),
-            
-            # ===== DIRECTORY OPERATIONS (RISKY CATEGORY 11) =====
-            (r'\brmdir\s+', "MEDIUM: Removing directories"),
-            (r'\bmkdir\s+-p\s+/', "HIGH: Creating directories in system paths"),
-        ]
+        return list(DANGEROUS_PATTERNS)
 
     def _get_warning_patterns(self) -> List[Tuple[str, str]]:
         """Get patterns for commands that should have warnings"""
-        return [
-            # Recursive operations
-            (r'\bchmod\s+-R\b', "Warning: recursive permission changes can be dangerous"),
-            (r'\bchown\s+-R\b', "Warning: recursive ownership changes can be dangerous"),
-
-            # Large file operations
-            (r'\bgrep\s+-r\b', "Warning: recursive grep on large directories may be slow"),
-            (r'\bfind\s+/\b', "Warning: searching from root may take a long time"),
-
-            # Network operations
-            (r'\bwget\b', "Warning: downloading files from internet"),
-            (r'\bcurl\b', "Warning: network requests can be slow or fail"),
-
-            # Package management (might need sudo)
-            (r'\bapt\b', "Warning: package management may require privileges"),
-            (r'\byum\b', "Warning: package management may require privileges"),
-            (r'\bdnf\b', "Warning: package management may require privileges"),
-            (r'\bpacman\b', "Warning: package management may require privileges"),
-        ]
+        return list(WARNING_PATTERNS)
 
     def suggest_alternatives(self, dangerous_command: str) -> List[str]:
         """Suggest safer alternatives for dangerous commands"""
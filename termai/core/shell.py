@@ -13,6 +13,7 @@ from .display import DisplayManager
 from .preferences import Preferences
 from .api_setup import APIKeySetupError
 from .conversational import ConversationalAgent
+from .plan_cache import PlanCache
 from .react_agent import ReActAgent
 from .system_info import SystemInfoCollector
 
@@ -30,10 +31,13 @@ class TermaShell:
             # Re-raise to be handled by CLI
             raise
         self.safety_checker = SafetyChecker()
-        self.executor = CommandExecutor(cwd)
+        # One bash process for the whole session, so `cd` and variables persist
+        self.executor = CommandExecutor(cwd, persistent_shell=True)
         self.display = DisplayManager()
+        self.plan_cache = PlanCache.from_env()
         
-        # Initialize conversational agent
+        # Initialize conversational agent. It gets no plan cache: it only
+        # caches standalone questions, and every shell query has history
         self.conversational_agent = ConversationalAgent(
             llm_client=self.llm_client,
             working_directory=self.executor.get_working_directory()
@@ -42,7 +46,8 @@ class TermaShell:
         # Initialize ReAct agent
         self.react_agent = ReActAgent(
             llm_client=self.llm_client,
-            working_directory=self.executor.get_working_directory()
+            working_directory=self.executor.get_working_directory(),
+            plan_cache=self.plan_cache
         )
         
         # Session context
@@ -338,4 +343,5 @@ class TermaShell:
     def _exit_shell(self):
         """Exit the shell gracefully"""
         self.running = False
+        self.executor.close()
         self.console.print("\n[green]👋 Thanks for using Terma Shell![/green]")
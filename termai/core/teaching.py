@@ -34,8 +34,7 @@ Provide:
 Keep it clear and educational."""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": "You are a Linux teacher helping beginners understand commands."},
                     {"role": "user", "content": explanation_prompt}
@@ -82,8 +81,7 @@ I generated this command: "{command}"
 Explain why this command is appropriate for the user's request. Be clear and educational."""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": "You are a Linux teacher explaining command choices."},
                     {"role": "user", "content": prompt}
@@ -114,8 +112,7 @@ Explain why this command is appropriate for the user's request. Be clear and edu
 Suggest safer alternatives that achieve similar goals. Explain why each alternative is safer."""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": "You are a Linux safety advisor."},
                     {"role": "user", "content": prompt}
@@ -155,8 +152,7 @@ Suggest safer alternatives that achieve similar goals. Explain why each alternat
 For each part of the command, explain what it does."""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": "You are a Linux teacher breaking down commands."},
                     {"role": "user", "content": prompt}
@@ -7,6 +7,7 @@ from rich.panel import Panel
 from .llm import LLMClient
 from .executor import CommandExecutor
 from .display import DisplayManager
+from .json_utils import parse_llm_json
 
 
 class TroubleshootingAgent:
@@ -103,8 +104,7 @@ Return as JSON:
 }}"""
 
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.config.get("model", "x-ai/grok-4.1-fast:free"),
+            response = self.llm_client.chat(
                 messages=[
                     {"role": "system", "content": "You are a Linux system troubleshooting expert. Diagnose issues systematically."},
                     {"role": "user", "content": prompt}
@@ -182,23 +182,8 @@ Return as JSON:
 
     def _parse_response(self, content: str) -> Dict[str, Any]:
         """Parse AI response"""
-        import json
-        import re
-        
         try:
-            content = content.strip()
-            
-            # Extract JSON
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                content = content[start:end].strip()
-            
-            response = json.loads(content)
+            response = parse_llm_json(content)
             
             # Validate
             if not isinstance(response, dict):
@@ -0,0 +1,17 @@
+"""Shared pytest fixtures"""
+
+import pytest
+from termai.core.api_setup import _reset_api_key_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_api_key_cache():
+    """
+    Don't let an API key cached by one test leak into the next
+
+    xunit-style setup_method runs after this fixture, so tests that build a
+    client there must reset the cache themselves.
+    """
+    _reset_api_key_cache()
+    yield
+    _reset_api_key_cache()
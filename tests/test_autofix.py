@@ -0,0 +1,103 @@
+"""Tests for auto-fix error analysis"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from termai.core.autofix import AutoFix
+
+
+def _reply(content):
+    """A chat completion whose message content is content"""
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = content
+    return response
+
+
+def _analysis(summary):
+    """A minimal analysis object as the model returns it"""
+    return {"error_summary": summary, "root_cause": "", "fixes": [{"command": "ls"}], "prevention": ""}
+
+
+class TestAutoFix:
+    """Test batch error analysis"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.llm_client = Mock()
+        self.llm_client.achat = AsyncMock()
+        self.llm_client.aclose = AsyncMock()
+        with patch('termai.core.autofix.TeachingMode'):
+            self.autofix = AutoFix(llm_client=self.llm_client)
+        self.failures = [
+            {"command": "cat missing", "stderr": "No such file", "return_code": 1},
+            {"command": "ls /root", "stderr": "Permission denied", "return_code": 2},
+        ]
+
+    def test_parse_analyses(self):
+        """Test the single, array and {"analyses": [...]} reply shapes"""
+        single = self.autofix._parse_analyses(json.dumps(_analysis("one")))
+        assert [a["error_summary"] for a in single] == ["one"]
+
+        wrapped = self.autofix._parse_analyses(json.dumps({"analyses": [_analysis("a"), {"error_summary": "b"}]}))
+        assert [a["error_summary"] for a in wrapped] == ["a", "b"]
+        assert wrapped[1]["fixes"] == []
+
+        fenced = self.autofix._parse_analyses("```json\n[" + json.dumps(_analysis("f")) + "]\n```")
+        assert fenced[0]["error_summary"] == "f"
+
+        with pytest.raises(ValueError):
+            self.autofix._parse_analyses("not json")
+        with pytest.raises(ValueError):
+            self.autofix._parse_analyses("[1, 2]")
+
+    def test_batch_reply(self):
+        """Test that a reply with one analysis per failure needs a single request"""
+        self.llm_client.achat.return_value = _reply(json.dumps({"analyses": [_analysis("a"), _analysis("b")]}))
+
+        results = self.autofix.analyze_errors_batch(self.failures)
+
+        assert self.llm_client.achat.call_count == 1
+        assert [r["error_summary"] for r in results] == ["a", "b"]
+        assert [r["original_command"] for r in results] == ["cat missing", "ls /root"]
+        assert results[1]["return_code"] == 2
+        self.llm_client.aclose.assert_awaited_once()
+
+    @pytest.mark.parametrize("batch_content", [
+        json.dumps({"analyses": [_analysis("only one")]}),
+        "not json at all",
+    ])
+    def test_batch_falls_back_to_each(self, batch_content):
+        """Test that a wrong count or malformed reply re-asks each failure"""
+        self.llm_client.achat.side_effect = [
+            _reply(batch_content),
+            _reply(json.dumps(_analysis("first"))),
+            _reply(json.dumps(_analysis("second"))),
+        ]
+
+        results = self.autofix.analyze_errors_batch(self.failures)
+
+        assert self.llm_client.achat.call_count == 3
+        assert [r["error_summary"] for r in results] == ["first", "second"]
+
+    def test_batch_request_error(self):
+        """Test that a failed request is reported, not re-sent per failure"""
+        self.llm_client.achat.side_effect = ConnectionError("offline")
+
+        results = self.autofix.analyze_errors_batch(self.failures)
+
+        assert self.llm_client.achat.call_count == 1
+        assert all("offline" in r["error"] for r in results)
+
+    def test_batch_in_event_loop(self):
+        """Test that the sync API refuses to run inside an event loop"""
+        async def call_sync():
+            return self.autofix.analyze_errors_batch(self.failures)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(call_sync())
+
+        self.llm_client.achat.return_value = _reply(json.dumps({"analyses": [_analysis("a"), _analysis("b")]}))
+        results = asyncio.run(self.autofix.aanalyze_errors_batch(self.failures))
+        assert len(results) == 2
@@ -1,10 +1,12 @@
 """Tests for command executor"""
 
+import asyncio
 import pytest
 import os
+import shutil
 import tempfile
 from unittest.mock import patch, MagicMock
-from termai.core.executor import CommandExecutor
+from termai.core.executor import CommandExecutor, _direct_argv, _on_path
 
 
 class TestCommandExecutor:
@@ -38,8 +40,8 @@ class TestCommandExecutor:
         """Test successful command execution"""
         mock_process = MagicMock()
         mock_process.returncode = 0
-        mock_process.stdout = "output"
-        mock_process.stderr = ""
+        mock_process.stdout = b"output"
+        mock_process.stderr = b""
         mock_run.return_value = mock_process
 
         result = self.executor._execute_single_command("echo hello")
@@ -61,8 +63,8 @@ class TestCommandExecutor:
         """Test failed command execution"""
         mock_process = MagicMock()
         mock_process.returncode = 1
-        mock_process.stdout = ""
-        mock_process.stderr = "error message"
+        mock_process.stdout = b""
+        mock_process.stderr = b"error message"
         mock_run.return_value = mock_process
 
         result = self.executor._execute_single_command("invalid_command")
@@ -97,9 +99,26 @@ class TestCommandExecutor:
         assert result["timed_out"] == False
         assert "System error" in result["stderr"]
 
+    @patch('subprocess.run')
+    def test_execute_plain_command_without_shell(self, mock_run):
+        """Test that plain program invocations skip the shell"""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+        self.executor._execute_single_command("ls -la")
+
+        assert mock_run.call_args[0][0] == ["ls", "-la"]
+        assert mock_run.call_args[1]["shell"] == False
+
+    def test_direct_argv_needs_shell(self):
+        """Test that shell syntax, builtins and unknown programs keep the shell"""
+        assert _direct_argv("git status") == ["git", "status"]
+        for command in ["ls | wc -l", "ls *.py", "cd /tmp", "FOO=1 ls", "ls 'a b'", "no_such_program_xyz"]:
+            assert _direct_argv(command) is None
+
     def test_execute_commands_sequence(self):
         """Test executing multiple commands in sequence"""
-        commands = ["echo first", "echo second"]
+        # Dependent commands run one after another through _execute_single_command
+        commands = ["mkdir demo", "touch demo/file"]
         explanations = ["First command", "Second command"]
 
         with patch.object(self.executor, '_execute_single_command') as mock_execute:
@@ -163,31 +182,140 @@ class TestCommandExecutor:
             assert result["results"][0]["success"] == True
             assert result["results"][1]["success"] == False
 
-    @patch('subprocess.run')
-    def test_test_command_success(self, mock_run):
+    def test_execute_commands_concurrently(self):
+        """Test that independent read-only commands run at once, in order"""
+        assert self.executor.are_independent(["ls -la", "cat README.md | wc -l"])
+        assert not self.executor.are_independent(["ls; echo done", "pwd"])
+        assert not self.executor.are_independent(["ls", "find . -delete"])
+        assert not self.executor.are_independent(["mkdir demo", "ls demo"])
+        assert not self.executor.are_independent(["env rm -f /tmp/x", "ls"])
+        assert not self.executor.are_independent(["awk 'BEGIN{system(\"touch /tmp/y\")}'", "ls /tmp/y"])
+        assert self.executor.are_independent(["sort -r b.txt", "find . -name '*.py' -print"])
+        for writer in ["sort --output=a.txt b.txt", "sort -oa.txt b.txt", "sort -o a.txt b.txt",
+                       "find . -fprintf out %p", "find -fprint0 x", "find -fls list",
+                       "uniq in.txt out.txt"]:
+            assert not self.executor.are_independent([writer, "cat a.txt"]), writer
+
+        commands = ["cat /dev/null", "echo second"]
+        with patch.object(self.executor, '_execute_single_command') as mock_execute:
+            result = self.executor.execute_commands(commands, ["First command", "Second command"])
+
+        mock_execute.assert_not_called()
+        assert result["all_successful"] == True
+        assert [r["command_index"] for r in result["results"]] == [0, 1]
+        assert result["results"][1]["stdout"].strip() == "second"
+
+    def test_iter_execute_yields_each_result(self):
+        """Test that results are yielded one at a time, in order"""
+        commands = ["echo first", "echo second"]
+        explanations = ["First command", "Second command"]
+
+        with patch.object(self.executor, '_execute_single_command') as mock_execute:
+            mock_execute.side_effect = [
+                {"return_code": 0, "stdout": "first", "stderr": "", "success": True, "timed_out": False},
+                {"return_code": 0, "stdout": "second", "stderr": "", "success": True, "timed_out": False},
+            ]
+
+            results = self.executor.iter_execute(commands, explanations)
+
+            first = next(results)
+            assert first["command"] == "echo first"
+            assert first["command_index"] == 0
+            assert mock_execute.call_count == 1
+
+            second = next(results)
+            assert second["command"] == "echo second"
+            assert second["command_index"] == 1
+
+    @patch('termai.core.executor.which')
+    def test_test_command_success(self, mock_which):
         """Test command testing for success"""
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_run.return_value = mock_process
+        _on_path.cache_clear()
+        mock_which.return_value = "/bin/echo"
 
-        result = self.executor.test_command("echo")
+        result = self.executor.test_command("echo hello")
 
         assert result == True
-        mock_run.assert_called_with("which echo", shell=True, capture_output=True, text=True)
+        assert mock_which.call_args.args == ("echo",)
 
-    @patch('subprocess.run')
-    def test_test_command_failure(self, mock_run):
+        # Lookups are cached
+        self.executor.test_command("echo again")
+        assert mock_which.call_count == 1
+
+    @patch('termai.core.executor.which')
+    def test_test_command_failure(self, mock_which):
         """Test command testing for failure"""
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_run.return_value = mock_process
+        _on_path.cache_clear()
+        mock_which.return_value = None
 
         result = self.executor.test_command("nonexistent_command")
 
         assert result == False
+        assert self.executor.test_command("") == False
 
     def test_is_critical_failure(self):
         """Test critical failure detection"""
         # For now, this always returns False (non-critical)
         assert self.executor._is_critical_failure("any_command", {"return_code": 1}) == False
         assert self.executor._is_critical_failure("any_command", {"return_code": 0}) == False
+
+    def test_aiter_execute_parallel_keeps_order(self):
+        """Test that parallel execution still yields results in command order"""
+        commands = ["sleep 0.2; echo first", "echo second"]
+        explanations = ["First command", "Second command"]
+
+        async def collect():
+            return [r async for r in self.executor.aiter_execute(commands, explanations, parallel=True)]
+
+        results = asyncio.run(collect())
+
+        assert [r["command_index"] for r in results] == [0, 1]
+        assert [r["stdout"].strip() for r in results] == ["first", "second"]
+
+    def test_persistent_shell_keeps_state(self):
+        """Test that the persistent shell keeps cd and variables between commands"""
+        temp_dir = os.path.realpath(tempfile.mkdtemp())
+        executor = CommandExecutor(working_directory=temp_dir, persistent_shell=True)
+        try:
+            os.mkdir(os.path.join(temp_dir, "sub"))
+            result = executor._execute_single_command("cd sub && GREETING=hello")
+            assert result["success"] == True
+            assert executor.get_working_directory() == os.path.join(temp_dir, "sub")
+
+            result = executor._execute_single_command("echo $GREETING; echo oops >&2; exit 3")
+            assert result["stdout"] == "hello\n"
+            assert result["stderr"] == "oops\n"
+            assert result["return_code"] == 3
+
+            # The shell is restarted after exiting
+            assert executor._execute_single_command("pwd")["success"] == True
+        finally:
+            executor.close()
+            shutil.rmtree(temp_dir)
+
+    def test_persistent_shell_async_keeps_state(self):
+        """Test that aiter_execute runs in the persistent shell even when asked for parallel"""
+        executor = CommandExecutor(persistent_shell=True)
+        try:
+            executor._execute_single_command("GREETING=hello")
+
+            async def collect():
+                return [r async for r in executor.aiter_execute(["echo $GREETING", "pwd"], ["", ""], parallel=True)]
+
+            results = asyncio.run(collect())
+            assert results[0]["stdout"] == "hello\n"
+        finally:
+            executor.close()
+
+    def test_stream_output_keeps_tail(self):
+        """Test that streamed commands report their result and keep only the output tail"""
+        executor = CommandExecutor(stream_output=True)
+        with patch.object(executor.console, 'out') as mock_out, \
+                patch('termai.core.executor.STREAM_TAIL_BYTES', 4):
+            result = executor._execute_single_command("printf 'abcdefgh'; printf 'oops' >&2; exit 1")
+
+        assert result["streamed"] == True
+        assert result["return_code"] == 1
+        assert result["stdout"] == "efgh"
+        assert result["stderr"] == "oops"
+        assert "".join(call.args[0] for call in mock_out.call_args_list) in ("abcdefghoops", "oopsabcdefgh")
@@ -0,0 +1,49 @@
+"""Tests for the local query classifier"""
+
+import pytest
+from termai.core.fast_classifier import classify, score
+
+
+class TestFastClassifier:
+    """Test the deterministic query classifier"""
+
+    @pytest.mark.parametrize("query", [
+        "ls",
+        "ls -la",
+        "git status",
+        "cat README.md",
+        "ps aux | grep python",
+        "list files in current directory",
+        "find all python files",
+    ])
+    def test_execution_queries(self, query):
+        """Test that shell commands and task requests need execution"""
+        assert classify(query) == "exec"
+
+    @pytest.mark.parametrize("query", [
+        "hello",
+        "thanks!",
+        "what is git?",
+        "how do I check disk usage?",
+        "explain bash",
+    ])
+    def test_conversational_queries(self, query):
+        """Test that greetings and general questions are conversational"""
+        assert classify(query) == "conv"
+
+    @pytest.mark.parametrize("query", [
+        "",
+        "what is in my home directory?",
+        "why is my disk full?",
+        "show me how grep works?",
+        "organize my files",
+    ])
+    def test_ambiguous_queries(self, query):
+        """Test that ambiguous queries are left to the LLM"""
+        assert classify(query) == "unknown"
+
+    def test_threshold(self):
+        """Test that labels below the threshold become unknown"""
+        label, confidence = score("what is git?")
+        assert label == "conv"
+        assert classify("what is git?", threshold=confidence + 0.01) == "unknown"
@@ -0,0 +1,54 @@
+"""Tests for file helper utilities"""
+
+import os
+import tempfile
+from unittest.mock import patch
+from termai.core import file_helper
+from termai.core.file_helper import correct_filename_in_command, list_entries
+
+
+class TestFileHelper:
+    """Test filename suggestion and correction"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dir = self.tmpdir.name
+        open(os.path.join(self.dir, "README.md"), "w").close()
+        os.mkdir(os.path.join(self.dir, "Docs"))
+
+    def teardown_method(self):
+        """Clean up test fixtures"""
+        self.tmpdir.cleanup()
+
+    def test_list_entries(self):
+        """Test that directories are listed with a trailing slash"""
+        assert sorted(list_entries(self.dir)) == ["Docs/", "README.md"]
+
+    def test_list_entries_cached_until_directory_changes(self):
+        """Test that the listing is reused until an entry is added"""
+        list_entries(self.dir)
+        with patch.object(file_helper.os, "scandir") as mock_scandir:
+            list_entries(self.dir)
+            mock_scandir.assert_not_called()
+
+        stat = os.stat(self.dir)
+        open(os.path.join(self.dir, "notes.txt"), "w").close()
+        # Make sure the mtime moves even on coarse-grained filesystems
+        os.utime(self.dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert "notes.txt" in list_entries(self.dir)
+
+    def test_correct_filename_in_command(self):
+        """Test case-insensitive filename correction"""
+        assert correct_filename_in_command("cat readme.md", self.dir) == ("cat README.md", True)
+        assert correct_filename_in_command("ls docs", self.dir) == ("ls Docs/", True)
+        assert correct_filename_in_command("cat README.md", self.dir) == ("cat README.md", False)
+
+    def test_correct_filename_keeps_rest_of_command(self):
+        """Test that only the corrected token changes"""
+        open(os.path.join(self.dir, "My File.txt"), "w").close()
+
+        assert correct_filename_in_command("head  -n 5   readme.md", self.dir) == ("head  -n 5   README.md", True)
+        assert correct_filename_in_command('cat "my file.txt"', self.dir) == ('cat "My File.txt"', True)
+        # An escaped name can't be replaced verbatim, so it isn't touched
+        assert correct_filename_in_command("cat my\\ file.txt", self.dir) == ("cat my\\ file.txt", False)
@@ -0,0 +1,27 @@
+"""Tests for JSON helpers"""
+
+from termai.core.json_utils import ArrayItemStream, parse_llm_json
+
+
+class TestJsonUtils:
+    """Test parsing of LLM JSON output"""
+
+    def test_parse_llm_json(self):
+        """Test bare, fenced and prose-wrapped JSON"""
+        assert parse_llm_json('{"a": 1}') == {"a": 1}
+        assert parse_llm_json('```json\n{"a": 1}\n```') == {"a": 1}
+        assert parse_llm_json('Sure! {"a": 1} Hope that helps.') == {"a": 1}
+
+    def test_array_item_stream(self):
+        """Test that array items are returned as soon as they are complete"""
+        document = (
+            '{"summary": "x", "steps": [{"step": 1, "command": "echo \\"}\\""}, '
+            '{"step": 2, "dependencies": [1]}], "warnings": [{"not": "a step"}]}'
+        )
+        for size in (1, 7, len(document)):
+            stream = ArrayItemStream("steps")
+            items = []
+            for i in range(0, len(document), size):
+                items.extend(stream.feed(document[i:i + size]))
+
+            assert items == [{"step": 1, "command": 'echo "}"'}, {"step": 2, "dependencies": [1]}]
@@ -1,8 +1,11 @@
 """Tests for LLM client"""
 
+import os
+import tempfile
 import pytest
 from unittest.mock import Mock, patch
 from termai.core.llm import LLMClient
+from termai.core.api_setup import APIKeySetupError, _reset_api_key_cache
 
 
 class TestLLMClient:
@@ -12,6 +15,8 @@ class TestLLMClient:
         """Set up test fixtures"""
         with patch.dict('os.environ', {'API_KEY': 'test-key'}):
             self.client = LLMClient()
+        # Runs after the autouse fixture, so forget the key cached just now
+        _reset_api_key_cache()
 
     @patch('termai.core.llm.OpenAI')
     def test_initialization(self, mock_openai):
@@ -23,13 +28,18 @@ class TestLLMClient:
             assert 'model' in client.config
             assert 'temperature' in client.config
 
+    @patch('termai.core.api_setup.show_api_key_instructions')
+    @patch('dotenv.load_dotenv')
     @patch('termai.core.llm.load_dotenv')
-    def test_missing_api_key(self, mock_load_dotenv):
+    def test_missing_api_key(self, mock_load_dotenv, mock_api_load_dotenv, mock_instructions):
         """Test error when API key is missing"""
         mock_load_dotenv.return_value = None  # Don't load .env file
+        mock_api_load_dotenv.return_value = None
         with patch.dict('os.environ', {}, clear=True):
-            with pytest.raises(ValueError, match="API_KEY environment variable not found"):
+            _reset_api_key_cache()
+            with pytest.raises(APIKeySetupError, match="API_KEY not configured"):
                 LLMClient()
+        mock_instructions.assert_called_once()
 
     @patch('termai.core.llm.OpenAI')
     def test_generate_commands_success(self, mock_openai_class):
@@ -86,6 +96,52 @@ class TestLLMClient:
             assert "error" in result
             assert "Invalid JSON" in result["error"]
 
+    def test_parse_response_with_surrounding_text(self):
+        """Test that JSON is found inside fences or surrounding prose"""
+        payload = '{"commands": ["ls"], "explanations": ["List files"], "safe": true}'
+
+        for content in (payload, f"```json\n{payload}\n```", f"Here you go:\n{payload}\nDone."):
+            result = self.client._parse_response(content)
+            assert result["commands"] == ["ls"]
+            assert result["error"] is None
+
+    @patch('termai.core.llm.OpenAI')
+    def test_chat_uses_configured_defaults(self, mock_openai_class):
+        """Test that chat() fills in the configured model and allows overrides"""
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+
+        with patch.dict('os.environ', {'API_KEY': 'test-key'}):
+            client = LLMClient()
+            messages = [{"role": "user", "content": "hi"}]
+            client.chat(messages, max_tokens=50)
+
+            kwargs = mock_client.chat.completions.create.call_args.kwargs
+            assert kwargs["model"] == client.config["model"]
+            assert kwargs["temperature"] == client.config["temperature"]
+            assert kwargs["max_tokens"] == 50
+            assert kwargs["messages"] == messages
+
+    def test_config_reparsed_only_when_modified(self):
+        """Test that the settings file is parsed again only after it changes"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "settings.yaml")
+            with open(path, "w") as f:
+                f.write("model: first\n")
+
+            with patch.dict('os.environ', {'API_KEY': 'test-key'}):
+                assert LLMClient(config_path=path).config["model"] == "first"
+                with patch('yaml.load') as mock_load:
+                    assert LLMClient(config_path=path).config["model"] == "first"
+                    mock_load.assert_not_called()
+
+                stat = os.stat(path)
+                with open(path, "w") as f:
+                    f.write("model: second\n")
+                # Make sure the mtime moves even on coarse-grained filesystems
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                assert LLMClient(config_path=path).config["model"] == "second"
+
     @patch('termai.core.llm.OpenAI')
     def test_test_connection_success(self, mock_openai_class):
         """Test successful connection test"""
@@ -133,3 +189,25 @@ class TestLLMClient:
 
             assert "test query" in prompt
             assert "bash commands" in prompt
+
+    def test_build_messages_layout(self):
+        """Test that the static system prompt leads and history turns are separate messages"""
+        with patch.dict('os.environ', {'API_KEY': 'test-key'}):
+            client = LLMClient()
+            history = ["User: list files", "AI: Here are your files"]
+            messages = client.build_messages("static prompt", "new request", history)
+
+            assert messages[0] == {"role": "system", "content": "static prompt"}
+            assert [m["role"] for m in messages[1:]] == ["user", "assistant", "user"]
+            assert messages[-1]["content"] == "new request"
+
+    def test_build_messages_anthropic_cache_marker(self):
+        """Test that Anthropic models get a cache_control marker on the system prompt"""
+        with patch.dict('os.environ', {'API_KEY': 'test-key'}):
+            client = LLMClient()
+            client.config["model"] = "anthropic/claude-3.5-sonnet"
+            system = client.build_messages("static prompt", "request")[0]
+            assert system["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+            client.config["prompt_cache"] = False
+            assert client.build_messages("static prompt", "request")[0]["content"] == "static prompt"
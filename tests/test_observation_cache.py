@@ -0,0 +1,59 @@
+"""Tests for the observation cache"""
+
+import os
+import tempfile
+from termai.core.observation_cache import ObservationCache, snapshot
+
+
+class TestObservationCache:
+    """Test directory snapshots and their reuse"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = self.tmpdir.name
+        with open(os.path.join(self.path, "notes.txt"), "w") as f:
+            f.write("hello")
+        os.mkdir(os.path.join(self.path, "docs"))
+        self.cache = ObservationCache()
+
+    def teardown_method(self):
+        """Clean up test fixtures"""
+        self.tmpdir.cleanup()
+
+    def test_snapshot(self):
+        """Test that files, directories and sizes are listed"""
+        listing = snapshot(self.path)
+
+        assert listing["files"] == ["notes.txt"]
+        assert listing["directories"] == ["docs"]
+        assert listing["file_sizes"] == {"notes.txt": 5}
+
+    def test_snapshot_missing_directory(self):
+        """Test that a missing directory gives an empty listing"""
+        listing = snapshot(os.path.join(self.path, "missing"))
+
+        assert listing == {"files": [], "directories": [], "file_sizes": {}}
+
+    def test_reuse_until_changed(self):
+        """Test that the listing is reused until the directory changes"""
+        first = self.cache.get(self.path)
+        assert self.cache.get(self.path) is first
+
+        with open(os.path.join(self.path, "new.txt"), "w") as f:
+            f.write("x")
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 1))
+
+        assert "new.txt" in self.cache.get(self.path)["files"]
+
+    def test_invalidate(self):
+        """Test that invalidate() forces a re-scan after in-place writes"""
+        first = self.cache.get(self.path)
+        with open(os.path.join(self.path, "notes.txt"), "w") as f:
+            f.write("hello world")
+
+        self.cache.invalidate()
+
+        listing = self.cache.get(self.path)
+        assert listing is not first
+        assert listing["file_sizes"]["notes.txt"] == 11
@@ -0,0 +1,73 @@
+"""Tests for the plan cache"""
+
+import os
+import tempfile
+from unittest.mock import patch
+from termai.core.plan_cache import PlanCache
+
+
+class TestPlanCache:
+    """Test the similarity-keyed plan cache"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = PlanCache(db_path=os.path.join(self.tmpdir.name, "plans.sqlite"))
+
+    def teardown_method(self):
+        """Clean up test fixtures"""
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_lookup_similar_query(self):
+        """Test that near-identical goals hit the cache"""
+        self.cache.store("goal", "organize text files", {"steps": [{"command": "mkdir docs"}]})
+
+        hit = self.cache.lookup("goal", "Organize all the text files")
+        assert hit is not None
+        assert hit["query"] == "organize text files"
+        assert hit["payload"] == {"steps": [{"command": "mkdir docs"}]}
+
+    def test_lookup_miss(self):
+        """Test that unrelated goals and other kinds miss the cache"""
+        self.cache.store("goal", "organize text files", {"steps": []})
+
+        assert self.cache.lookup("goal", "delete old log files") is None
+        assert self.cache.lookup("react", "organize text files") is None
+
+    def test_lookup_exact(self):
+        """Test that exact lookups ignore case and spacing but not word order"""
+        self.cache.store("conversational", "how do I convert png to jpg", {"response": "png -> jpg"})
+
+        assert self.cache.lookup("conversational", "How do I  convert png to jpg", exact=True)["payload"] == {
+            "response": "png -> jpg"
+        }
+        assert self.cache.lookup("conversational", "how do I convert jpg to png", exact=True) is None
+
+    def test_store_replaces_same_query(self):
+        """Test that storing the same query again replaces the old entry"""
+        self.cache.store("goal", "check git status", {"version": 1})
+        self.cache.store("goal", "check git status", {"version": 2})
+
+        assert self.cache.lookup("goal", "check git status")["payload"] == {"version": 2}
+
+    def test_response_cache(self):
+        """Test exact-request caching and its expiry"""
+        key = PlanCache.response_key("model", {"temperature": 0.3}, "system", "prompt")
+        assert key == PlanCache.response_key("model", {"temperature": 0.3}, "system", "prompt")
+        assert key != PlanCache.response_key("other-model", {"temperature": 0.3}, "system", "prompt")
+
+        assert self.cache.get_response(key) is None
+        self.cache.put_response(key, {"steps": [{"command": "ls"}]})
+        assert self.cache.get_response(key) == {"steps": [{"command": "ls"}]}
+        assert self.cache.get_response(key, max_age=0) is None
+
+    def test_from_env(self):
+        """Test that the cache is opt-in and can be disabled"""
+        with patch.dict(os.environ, {"TERMA_PLAN_CACHE": ""}):
+            assert PlanCache.from_env() is None
+        with patch.dict(os.environ, {"TERMA_PLAN_CACHE": "1", "HOME": self.tmpdir.name}):
+            assert PlanCache.from_env(disabled=True) is None
+            cache = PlanCache.from_env()
+            assert isinstance(cache, PlanCache)
+            cache.close()
@@ -0,0 +1,81 @@
+"""Tests for the ReAct agent's action execution"""
+
+import asyncio
+import tempfile
+import time
+from unittest.mock import Mock, patch
+from termai.core.react_agent import ReActAgent
+
+
+class TestReActAgent:
+    """Test grouping and running planned actions"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.agent = ReActAgent(llm_client=Mock(), working_directory=self.tmpdir.name)
+
+    def teardown_method(self):
+        """Clean up test fixtures"""
+        self.tmpdir.cleanup()
+
+    def _commands(self, groups):
+        """The commands of grouped actions"""
+        return [[action["command"] for action in group] for group in groups]
+
+    def test_group_actions(self):
+        """Test that only flagged, locally verified read-only actions share a group"""
+        actions = [
+            {"command": "mkdir out", "parallel_safe": True},
+            {"command": "touch out/a", "parallel_safe": True},
+            {"command": "ls", "parallel_safe": True},
+            {"command": "cat notes.txt", "parallel_safe": True},
+            {"command": "env rm notes.txt", "parallel_safe": True},
+            {"command": "pwd", "parallel_safe": False},
+            {"command": "wc -l notes.txt", "parallel_safe": True},
+        ]
+
+        assert self._commands(self.agent._group_actions(actions)) == [
+            ["mkdir out"], ["touch out/a"], ["ls", "cat notes.txt"], ["env rm notes.txt"], ["pwd"], ["wc -l notes.txt"]
+        ]
+
+    def test_execute_plan_keeps_order(self):
+        """Test that a parallel group's results come back in action order"""
+        actions = [{"command": "ls a", "parallel_safe": True}, {"command": "ls b", "parallel_safe": True}]
+
+        def run(action):
+            # The first action finishes last
+            time.sleep(0.05 if action["command"] == "ls a" else 0)
+            return {"success": True, "stdout": action["command"], "exit_code": 0}
+
+        with patch.object(self.agent, '_run_action', side_effect=run):
+            results = asyncio.run(self.agent._execute_plan(actions, auto_confirm=True, verbose=False))
+
+        assert [r["stdout"] for r in results] == ["ls a", "ls b"]
+
+    def test_execute_plan_stops_on_critical_failure(self):
+        """Test that groups after one with a critical failure don't run"""
+        actions = [{"command": "mkdir out"}, {"command": "ls out"}]
+
+        with patch.object(self.agent, '_run_action', return_value={"success": False, "exit_code": 1}) as mock_run:
+            results = asyncio.run(self.agent._execute_plan(actions, auto_confirm=True, verbose=False))
+
+        assert mock_run.call_count == 1
+        assert len(results) == 1
+        assert results[0]["critical_failure"] == True
+
+    def test_execute_plan_maps_exceptions(self):
+        """Test that an action raising becomes a failed result without affecting the others"""
+        actions = [{"command": "ls a", "parallel_safe": True}, {"command": "ls b", "parallel_safe": True}]
+
+        def run(action):
+            if action["command"] == "ls a":
+                raise RuntimeError("boom")
+            return {"success": True, "stdout": "ok", "exit_code": 0}
+
+        with patch.object(self.agent, '_run_action', side_effect=run):
+            results = asyncio.run(self.agent._execute_plan(actions, auto_confirm=True, verbose=False))
+
+        assert results[0]["success"] == False
+        assert results[0]["stderr"] == "Execution error: boom"
+        assert results[1]["success"] == True
@@ -113,3 +113,12 @@ class TestSafetyChecker:
         assert len(result["safe_commands"]) == 0
         assert len(result.get("risky_commands", [])) == 0
         assert len(result["warnings"]) == 0
+
+    def test_safe_indices_match_input_positions(self):
+        """Test that safe commands report their positions in the input list"""
+        commands = ["rm file.txt", "ls -la", "sudo reboot", "pwd"]
+        result = self.checker.check_commands(commands)
+
+        assert result["safe_commands"] == ["ls -la", "pwd"]
+        assert result["safe_indices"] == [1, 3]
+        assert [r["index"] for r in result["risky_commands"]] == [0, 2]